@@ -0,0 +1,262 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Generators for synthetic benchmark data.
+
+All generators are seeded, so the same arguments always yield the same data
+and results of different runs can be compared.
+"""
+
+import csv
+import json
+import os
+import random
+from typing import Optional
+
+from licensevalidator.lib.dependency import DependencyInfo
+
+# licenses along with their approximate share in a typical dependency tree
+LICENSE_DISTRIBUTION: list[tuple[str, float]] = [
+    ("MIT", 0.44),
+    ("Apache-2.0", 0.18),
+    ("BSD-3-Clause", 0.08),
+    ("ISC", 0.07),
+    ("MIT OR Apache-2.0", 0.06),
+    ("BSD-2-Clause", 0.04),
+    ("Apache Software License", 0.02),
+    ("Python Software Foundation License", 0.02),
+    ("MPL-2.0", 0.02),
+    ("Apache-2.0 WITH LLVM-exception", 0.01),
+    ("LGPL-2.1-or-later", 0.01),
+    ("GPL-3.0-only", 0.01),
+    ("Unlicense", 0.01),
+    ("unknown", 0.03),
+]
+
+# whitelist matching most, but not all licenses of the distribution
+WHITELIST: list[str] = [
+    "MIT",
+    "Apache-2.0",
+    "Apache 2.0",
+    "BSD-3-Clause",
+    "BSD-2-Clause",
+    "ISC",
+    "Python Software Foundation License",
+    "MPL-2.0",
+    "LLVM-exception",
+    "Unlicense",
+]
+
+# share of dependencies declaring a second license
+_DUAL_LICENSE_SHARE = 0.05
+
+_NAME_PARTS = [
+    "async", "core", "http", "json", "log", "net", "parse", "py", "serde",
+    "sync", "test", "time", "tokio", "url", "util", "yaml", "zip",
+]  # fmt: skip
+
+
+def get_licenses(count: int, seed: int = 0) -> list[str]:
+    """Return license names drawn from the license distribution.
+
+    Args:
+        count (int): The number of license names.
+        seed (int, optional): The seed of the random generator.
+
+    Returns:
+        list[str]: The license names.
+    """
+    rng = random.Random(seed)
+    names = [name for name, _ in LICENSE_DISTRIBUTION]
+    weights = [weight for _, weight in LICENSE_DISTRIBUTION]
+    return rng.choices(names, weights, k=count)
+
+
+def generate_dependencies(count: int, seed: int = 0) -> list[DependencyInfo]:
+    """Generate unique dependencies in random order.
+
+    Args:
+        count (int): The number of dependencies.
+        seed (int, optional): The seed of the random generator.
+
+    Returns:
+        list[DependencyInfo]: The dependencies.
+    """
+    rng = random.Random(seed)
+    licenses = get_licenses(count, seed)
+    second_licenses = get_licenses(count, seed + 1)
+
+    result = []
+    for index in range(count):
+        name = f"{rng.choice(_NAME_PARTS)}-{rng.choice(_NAME_PARTS)}-{index}"
+        version = f"{rng.randint(0, 9)}.{rng.randint(0, 30)}.{rng.randint(0, 99)}"
+        dep_licenses = [licenses[index]]
+        if rng.random() < _DUAL_LICENSE_SHARE:
+            dep_licenses.append(second_licenses[index])
+        result.append(DependencyInfo(name, version, dep_licenses))
+    return result
+
+
+def split_by_origin(
+    dependencies: list[DependencyInfo],
+    origins: Optional[list[str]] = None,
+) -> dict[str, list[DependencyInfo]]:
+    """Distribute the dependencies round robin over the given origins.
+
+    Args:
+        dependencies (list[DependencyInfo]): The dependencies.
+        origins (Optional[list[str]], optional): The origins.
+            Defaults to Python, Rust and Workflows.
+
+    Returns:
+        dict[str, list[DependencyInfo]]: Maps the origin to its dependencies.
+    """
+    origins = origins or ["Python", "Rust", "Workflows"]
+    return {
+        origin: dependencies[index :: len(origins)]
+        for index, origin in enumerate(origins)
+    }
+
+
+def write_license_finder_output(path: str, dependencies: list[DependencyInfo]) -> None:
+    """Write the dependencies in the CSV format of license_finder.
+
+    Args:
+        path (str): The path of the output file.
+        dependencies (list[DependencyInfo]): The dependencies to write.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        for dep in dependencies:
+            writer.writerow([dep.name, dep.version, ", ".join(dep.licenses)])
+
+
+def generate_workflow(step_count: int, steps_per_job: int = 20, seed: int = 0) -> str:
+    """Generate a GitHub workflow using actions.
+
+    About a third of the steps are shell steps, the others use an action.
+    Actions are reused, as in real workflows.
+
+    Args:
+        step_count (int): The total number of steps.
+        steps_per_job (int, optional): The number of steps per job.
+        seed (int, optional): The seed of the random generator.
+
+    Returns:
+        str: The workflow as YAML.
+    """
+    rng = random.Random(seed)
+    action_count = max(1, step_count // 10)
+    lines = ["name: Benchmark", "on: [push]", "jobs:"]
+    for step in range(step_count):
+        if step % steps_per_job == 0:
+            lines.append(f"  job-{step // steps_per_job}:")
+            lines.append("    runs-on: ubuntu-latest")
+            lines.append("    steps:")
+
+        lines.append(f"      - name: Step {step}")
+        if rng.random() < 0.33:
+            lines.append(f"        run: echo {step}")
+            continue
+
+        action = rng.randrange(action_count)
+        path = f"/sub-{action % 3}" if action % 5 == 0 else ""
+        lines.append(
+            f"        uses: org-{action % 50}/action-{action}{path}@v{step % 4}"
+        )
+        lines.append("        with:")
+        lines.append(f"          input: value-{step}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_file(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(content)
+
+
+def write_synthetic_project(
+    project_root: str,
+    scan_dir_count: int,
+    dependency_count: int,
+    workflow_count: int = 10,
+) -> list[dict[str, str]]:
+    """Write a project with Python, Rust and JavaScript scan dirs and workflows.
+
+    Each scan dir contains a requirements.txt, a Cargo.toml with Cargo.lock
+    and a package.json with package-lock.json. The project root contains
+    the workflows and a whitelist.txt based on WHITELIST.
+
+    Args:
+        project_root (str): The directory to write the project to.
+        scan_dir_count (int): The number of scan dirs.
+        dependency_count (int): The number of dependencies
+            per scan dir and language.
+        workflow_count (int, optional): The number of workflow files.
+
+    Returns:
+        list[dict[str, str]]: The scan dir configs of the project.
+    """
+    for index in range(scan_dir_count):
+        scan_dir = os.path.join(project_root, f"dir{index}")
+        python_deps, rust_deps, javascript_deps = (
+            generate_dependencies(dependency_count, seed=index * 3 + offset)
+            for offset in range(3)
+        )
+
+        _write_file(
+            os.path.join(scan_dir, "requirements.txt"),
+            "".join(f"{dep.name}=={dep.version}\n" for dep in python_deps),
+        )
+
+        _write_file(
+            os.path.join(scan_dir, "Cargo.toml"),
+            f'[package]\nname = "crate{index}"\nversion = "0.1.0"\n',
+        )
+        _write_file(
+            os.path.join(scan_dir, "Cargo.lock"),
+            "version = 3\n"
+            + "".join(
+                f'\n[[package]]\nname = "{dep.name}"\nversion = "{dep.version}"\n'
+                'source = "registry+https://github.com/rust-lang/crates.io-index"\n'
+                for dep in rust_deps
+            ),
+        )
+
+        _write_file(
+            os.path.join(scan_dir, "package.json"),
+            json.dumps({"name": f"package{index}", "version": "1.0.0"}),
+        )
+        packages = {"": {"name": f"package{index}", "version": "1.0.0"}}
+        for dep in javascript_deps:
+            packages[f"node_modules/{dep.name}"] = {
+                "version": dep.version,
+                "license": dep.licenses[0],
+            }
+        _write_file(
+            os.path.join(scan_dir, "package-lock.json"),
+            json.dumps({"lockfileVersion": 3, "packages": packages}),
+        )
+
+    for index in range(workflow_count):
+        _write_file(
+            os.path.join(project_root, ".github", "workflows", f"workflow{index}.yml"),
+            generate_workflow(50, seed=index),
+        )
+
+    _write_file(
+        os.path.join(project_root, "whitelist.txt"),
+        "".join(f"{license_name}\n" for license_name in WHITELIST),
+    )
+    return [{"path": f"dir{index}"} for index in range(scan_dir_count)]
@@ -0,0 +1,441 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""End-to-end performance regression benchmarks.
+
+Runs the license checker over copies of the testbench projects and over
+scaled-up synthetic projects, using a stub license_finder executable and a
+stub GitHub API, so the measurements only depend on the orchestration of
+the scans and not on the network or the installed package managers.
+
+The wall time of each phase is compared to a baseline recorded on the same
+machine and the run fails if a phase got slower than the configured
+threshold. Wall times depend on the machine, so the baseline is not
+committed. The run fails if there is no baseline yet.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.endtoend --update-baseline
+    PYTHONPATH=src python -m benchmarks.endtoend --threshold 20
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from typing import Any, Callable, Optional
+
+import yaml
+
+import action
+from benchmarks import stublicensefinder
+from benchmarks.datagenerators import write_synthetic_project
+from benchmarks.stubgithub import StubGitHubServer
+from dash.dashgenerator import generate_dash_input
+from licensevalidator.checklicenses import (
+    LicenseValidator,
+    check_licenses,
+    read_license_list,
+)
+from licensevalidator.findlicenses import find_licenses
+from licensevalidator.licensevalidator import validate_used_licenses
+from licensevalidator.noticegenerator import generate_notice_file
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTBENCH_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), "testbench")
+DEFAULT_BASELINE_FILE = os.path.join(BENCHMARKS_DIR, "endtoend-baseline.json")
+
+# scan dir configs of the testbench projects, C++ is disabled in the checker
+TESTBENCH_SCENARIOS: dict[str, list[dict[str, Any]]] = {
+    "javascript-npm": [{"path": "."}],
+    "multilang": [{"path": "python-proj"}, {"path": "rust-proj"}],
+    "python-with-workflows": [
+        {
+            "path": "./my-source",
+            "python-pip-included-requirement-files": ["requirements.txt"],
+        }
+    ],
+    "rust": [{"path": "."}],
+}
+
+# (scan dirs, dependencies per scan dir and language) of the synthetic projects
+DEFAULT_SCALES = ["4x100", "16x500"]
+
+PHASES = [
+    "find_licenses",
+    "check_licenses",
+    "generate_notice_file",
+    "generate_dash_input",
+    "validate_used_licenses",
+    "main",
+]
+
+
+class Scenario:
+    """A project to benchmark."""
+
+    def __init__(
+        self,
+        name: str,
+        project_root: str,
+        scan_dirs: list[dict[str, Any]],
+        whitelist_path: str = "whitelist.txt",
+    ):
+        """Create a new instance.
+
+        Args:
+            name (str): Name of the scenario.
+            project_root (str): The root of the project.
+            scan_dirs (list[dict[str, Any]]): The scan dir configs.
+            whitelist_path (str, optional): The path of the whitelist,
+                relative to the project root.
+        """
+        self.name = name
+        self.project_root = project_root
+        self.scan_dirs = scan_dirs
+        self.whitelist_path = whitelist_path
+
+
+@contextlib.contextmanager
+def stub_environment(
+    work_dir: str, license_finder_latency: float, github_latency: float
+) -> Iterator[StubGitHubServer]:
+    """Provide the stub license_finder and GitHub API to the license checker.
+
+    The stub license_finder is put in front of the PATH and the GitHub API
+    URLs point to the stub server. The environment is restored on exit.
+
+    Args:
+        work_dir (str): Directory to put the stub executable in.
+        license_finder_latency (float): Minimal duration of each report
+            of the stub license_finder in seconds.
+        github_latency (float): Duration of each request to the stub
+            GitHub API in seconds.
+
+    Yields:
+        StubGitHubServer: The running stub server.
+    """
+    bin_dir = os.path.join(work_dir, "bin")
+    os.makedirs(bin_dir, exist_ok=True)
+    executable = os.path.join(bin_dir, "license_finder")
+    with open(stublicensefinder.__file__, "r", encoding="utf-8") as source:
+        with open(executable, "w", encoding="utf-8") as file:
+            file.write(f"#!{sys.executable}\n")
+            file.write(source.read())
+    os.chmod(executable, os.stat(executable).st_mode | stat.S_IXUSR)
+
+    previous_environment = dict(os.environ)
+    with StubGitHubServer(github_latency) as server:
+        os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        os.environ[stublicensefinder.LATENCY_ENV] = str(license_finder_latency)
+        os.environ["GITHUB_API_URL"] = server.url
+        os.environ["GITHUB_GRAPHQL_URL"] = f"{server.url}/graphql"
+        try:
+            yield server
+        finally:
+            os.environ.clear()
+            os.environ.update(previous_environment)
+
+
+def create_scenarios(work_dir: str, scales: list[str]) -> list[Scenario]:
+    """Create copies of the testbench projects and the synthetic projects.
+
+    Args:
+        work_dir (str): The directory to create the projects in.
+        scales (list[str]): The sizes of the synthetic projects, each as
+            "<scan dirs>x<dependencies per scan dir and language>".
+
+    Returns:
+        list[Scenario]: The scenarios of all projects.
+    """
+    scenarios = []
+    for name, scan_dirs in TESTBENCH_SCENARIOS.items():
+        project_root = os.path.join(work_dir, name)
+        shutil.copytree(os.path.join(TESTBENCH_DIR, name), project_root)
+        scenarios.append(Scenario(name, project_root, scan_dirs))
+
+    for scale in scales:
+        scan_dir_count, dependency_count = (int(part) for part in scale.split("x"))
+        name = f"synthetic-{scale}"
+        project_root = os.path.join(work_dir, name)
+        scan_dirs = write_synthetic_project(
+            project_root, scan_dir_count, dependency_count
+        )
+        scenarios.append(Scenario(name, project_root, scan_dirs))
+
+    return scenarios
+
+
+def _time_phase(run: Callable[[], Any], repeat: int) -> float:
+    """Return the shortest wall time of several runs of the given function."""
+    durations = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            try:
+                run()
+            except SystemExit:
+                # main exits with an error code, e.g. on license violations
+                pass
+            durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def run_scenario(scenario: Scenario, repeat: int = 3) -> dict[str, float]:
+    """Measure the wall time of each phase of the license checker.
+
+    Args:
+        scenario (Scenario): The scenario to run.
+        repeat (int, optional): Number of runs per phase,
+            the shortest one is reported.
+
+    Returns:
+        dict[str, float]: Maps the phase to its wall time in seconds.
+    """
+    project_root = scenario.project_root
+    with contextlib.redirect_stdout(io.StringIO()):
+        store = find_licenses(project_root, scenario.scan_dirs)
+    whitelist = read_license_list(os.path.join(project_root, scenario.whitelist_path))
+
+    def check_all_licenses() -> None:
+        validator = LicenseValidator(whitelist, True)
+        for origin, dependencies in store.items():
+            check_licenses(origin, dependencies, validator)
+
+    config_file_path = os.path.join(project_root, ".benchmark-config.yml")
+    with open(config_file_path, "w", encoding="utf-8") as file:
+        yaml.safe_dump(
+            {
+                "whitelist-file-path": scenario.whitelist_path,
+                "scan-dirs": scenario.scan_dirs,
+            },
+            file,
+        )
+
+    def run_main() -> None:
+        previous_argv = sys.argv
+        os.environ["GITHUB_WORKSPACE"] = project_root
+        sys.argv = ["action.py", "true", "NOTICE", "false", config_file_path, "true"]
+        try:
+            action.main()
+        finally:
+            sys.argv = previous_argv
+            del os.environ["GITHUB_WORKSPACE"]
+
+    phases: dict[str, Callable[[], Any]] = {
+        "find_licenses": lambda: find_licenses(project_root, scenario.scan_dirs),
+        "check_licenses": check_all_licenses,
+        "generate_notice_file": lambda: generate_notice_file(
+            store, os.path.join(project_root, "NOTICE-BENCHMARK.md")
+        ),
+        "generate_dash_input": lambda: generate_dash_input(
+            os.path.join(project_root, "benchmark.input"), store
+        ),
+        "validate_used_licenses": lambda: validate_used_licenses(
+            project_root, scenario.scan_dirs, scenario.whitelist_path
+        ),
+        "main": run_main,
+    }
+    return {phase: _time_phase(run, repeat) for phase, run in phases.items()}
+
+
+def compare_to_baseline(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+    tolerance: float,
+) -> list[str]:
+    """Find the phases which got slower than allowed.
+
+    Args:
+        results (dict[str, dict[str, float]]): The measured wall times
+            per scenario and phase.
+        baseline (dict[str, dict[str, float]]): The baseline wall times
+            per scenario and phase.
+        threshold (float): The allowed slowdown in percent.
+        tolerance (float): Slowdowns up to this number of seconds are
+            always allowed, so very short phases do not fail due to noise.
+
+    Returns:
+        list[str]: A description of each regression.
+    """
+    regressions = []
+    for scenario, phases in results.items():
+        for phase, seconds in phases.items():
+            baseline_seconds = baseline.get(scenario, {}).get(phase)
+            if baseline_seconds is None:
+                continue
+            allowed = max(
+                baseline_seconds * (1 + threshold / 100), baseline_seconds + tolerance
+            )
+            if seconds > allowed:
+                regressions.append(
+                    f"{scenario}/{phase}: {seconds:.3f}s, baseline "
+                    f"{baseline_seconds:.3f}s (+"
+                    f"{(seconds / baseline_seconds - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def format_result(
+    scenario: str, phase: str, seconds: float, baseline_seconds: Optional[float]
+) -> str:
+    """Format a measurement as a row of the result table.
+
+    Args:
+        scenario (str): Name of the scenario.
+        phase (str): Name of the phase.
+        seconds (float): The measured wall time.
+        baseline_seconds (Optional[float]): The wall time of the baseline.
+
+    Returns:
+        str: The formatted row.
+    """
+    change = ""
+    if baseline_seconds:
+        change = f"{(seconds / baseline_seconds - 1) * 100:+.0f}%"
+    baseline = f"{baseline_seconds * 1000:.1f}" if baseline_seconds else "-"
+    return f"{scenario:<28}{phase:<26}{seconds * 1000:>12.1f}{baseline:>14}{change:>9}"
+
+
+def read_baseline(path: str) -> Optional[dict[str, dict[str, float]]]:
+    """Read the baseline file.
+
+    Args:
+        path (str): The path of the baseline file.
+
+    Returns:
+        Optional[dict[str, dict[str, float]]]: The wall times per scenario
+            and phase. None if there is no baseline yet.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def get_args():
+    """Obtain all command line arguments given to the script."""
+    parser = argparse.ArgumentParser(
+        "Detects performance regressions of the license checker"
+    )
+    parser.add_argument(
+        "--scales",
+        type=str,
+        nargs="*",
+        default=DEFAULT_SCALES,
+        help="Sizes of the synthetic projects as <scan dirs>x<dependencies>",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per phase"
+    )
+    parser.add_argument(
+        "--license-finder-latency",
+        type=float,
+        default=0.05,
+        help="Duration of each license_finder report in seconds",
+    )
+    parser.add_argument(
+        "--github-latency",
+        type=float,
+        default=0.02,
+        help="Duration of each GitHub API request in seconds",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=DEFAULT_BASELINE_FILE,
+        help="Path of the baseline file",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the measurements as new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="Allowed slowdown of a phase in percent",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.05,
+        help="Slowdown of a phase in seconds which is always allowed",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Entry point of the end-to-end benchmarks."""
+    args = get_args()
+    baseline = read_baseline(args.baseline)
+    if baseline is None and not args.update_baseline:
+        # without a baseline no regression could ever be detected
+        print(
+            f"::error::No baseline found at '{args.baseline}', "
+            "record one on this machine with --update-baseline first"
+        )
+        sys.exit(2)
+    baseline = baseline or {}
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="license-check-benchmark-") as work_dir:
+        with stub_environment(
+            work_dir, args.license_finder_latency, args.github_latency
+        ):
+            print(
+                f"{'Scenario':<28}{'Phase':<26}{'Time [ms]':>12}"
+                f"{'Baseline [ms]':>14}{'Change':>9}"
+            )
+            for scenario in create_scenarios(work_dir, args.scales):
+                results[scenario.name] = run_scenario(scenario, args.repeat)
+                for phase, seconds in results[scenario.name].items():
+                    print(
+                        format_result(
+                            scenario.name,
+                            phase,
+                            seconds,
+                            baseline.get(scenario.name, {}).get(phase),
+                        ),
+                        flush=True,
+                    )
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Baseline written to '{args.baseline}'")
+        return
+
+    regressions = compare_to_baseline(results, baseline, args.threshold, args.tolerance)
+    if regressions:
+        print(f"::error::Performance regressions (> {args.threshold:.0f}% slower):")
+        for regression in regressions:
+            print(f"\t{regression}")
+        sys.exit(1)
+    print("No performance regressions found")
+
+
+if __name__ == "__main__":
+    main()
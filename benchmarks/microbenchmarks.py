@@ -0,0 +1,290 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Micro-benchmarks of the hot paths of the license checker.
+
+Each benchmark is run on synthetic data of several sizes. The reported
+throughput is based on the fastest of several runs, the peak memory is
+measured with tracemalloc in a separate run.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.microbenchmarks --sizes 1000 10000
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from benchmarks.datagenerators import (
+    WHITELIST,
+    generate_dependencies,
+    generate_workflow,
+    get_licenses,
+    split_by_origin,
+    write_license_finder_output,
+)
+from dash.dashgenerator import generate_dash_input
+from licensevalidator.checklicenses import LicenseValidator, check_licenses
+from licensevalidator.findlicenses import sort_dependencies
+from licensevalidator.lib import licensefinder
+from licensevalidator.lib.workflowlicenses import _read_used_actions_from_yaml
+from licensevalidator.noticegenerator import generate_notice_file
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# parsing YAML is much slower than the other paths,
+# so workflows are benchmarked with fewer steps
+WORKFLOW_SIZE_DIVISOR = 10
+
+
+class BenchmarkResult:
+    """Measurements of a single benchmark for a single size."""
+
+    def __init__(self, name: str, size: int, seconds: float, peak_memory: int):
+        """Create a new instance.
+
+        Args:
+            name (str): Name of the benchmark.
+            size (int): Number of processed items.
+            seconds (float): Duration of the fastest run.
+            peak_memory (int): Peak of the memory allocated
+                during the run in bytes.
+        """
+        self.name = name
+        self.size = size
+        self.seconds = seconds
+        self.peak_memory = peak_memory
+
+    @property
+    def throughput(self) -> float:
+        """Number of processed items per second."""
+        return self.size / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a JSON serializable dict."""
+        return {
+            "name": self.name,
+            "size": self.size,
+            "seconds": self.seconds,
+            "throughput": self.throughput,
+            "peak_memory": self.peak_memory,
+        }
+
+
+def measure(
+    name: str,
+    size: int,
+    run: Callable[[], Any],
+    repeat: int = 3,
+    setup: Optional[Callable[[], None]] = None,
+) -> BenchmarkResult:
+    """Measure the duration and the peak memory of the given function.
+
+    Args:
+        name (str): Name of the benchmark.
+        size (int): Number of items processed by a single run.
+        run (Callable[[], Any]): The function to benchmark.
+        repeat (int, optional): Number of timed runs.
+        setup (Optional[Callable[[], None]], optional): Called before
+            each run, e.g. to reset state. Not included in the measurement.
+
+    Returns:
+        BenchmarkResult: The measurements.
+    """
+    durations = []
+    # all output of the benchmarked code is discarded
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            run()
+            durations.append(time.perf_counter() - start)
+            output.seek(0)
+            output.truncate()
+
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            run()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(name, size, min(durations), peak_memory)
+
+
+def run_benchmarks(
+    sizes: list[int], repeat: int = 3, selected: Optional[list[str]] = None
+) -> list[BenchmarkResult]:
+    """Run all (or the selected) benchmarks for each of the given sizes.
+
+    Args:
+        sizes (list[int]): The numbers of dependencies to benchmark with.
+        repeat (int, optional): Number of timed runs per benchmark.
+        selected (Optional[list[str]], optional): Names of the benchmarks
+            to run. Defaults to all.
+
+    Returns:
+        list[BenchmarkResult]: The measurements.
+    """
+    read_output_file = getattr(licensefinder, "__read_output_file")
+    results = []
+
+    def add(name: str, size: int, run: Callable[[], Any], **kwargs) -> None:
+        if selected is None or name in selected:
+            result = measure(name, size, run, repeat, **kwargs)
+            print(format_result(result), flush=True)
+            results.append(result)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            dependencies = generate_dependencies(size)
+            shuffled = random.Random(size).sample(dependencies, len(dependencies))
+            origin_to_deps = split_by_origin(sort_dependencies(dependencies))
+            license_names = get_licenses(size)
+
+            output_file = os.path.join(temp_dir, f"license_finder_{size}.csv")
+            write_license_finder_output(output_file, dependencies)
+            # the loop variables are bound by functools.partial or default
+            # arguments, so each benchmark keeps the data of its own size
+            add(
+                "read_output_file",
+                size,
+                functools.partial(read_output_file, output_file),
+            )
+
+            add(
+                "sort_dependencies",
+                size,
+                functools.partial(sort_dependencies, shuffled),
+            )
+
+            # a new validator per run, so its memo does not hide the costs
+            validators = [LicenseValidator(WHITELIST, True)]
+
+            def reset_validator(validators=validators) -> None:
+                validators[0] = LicenseValidator(WHITELIST, True)
+
+            add(
+                "is_license_valid",
+                size,
+                lambda validators=validators, license_names=license_names: [
+                    validators[0].is_license_valid(name) for name in license_names
+                ],
+                setup=reset_validator,
+            )
+            add(
+                "check_licenses",
+                size,
+                lambda validators=validators, dependencies=dependencies: check_licenses(
+                    "Python", dependencies, validators[0]
+                ),
+                setup=reset_validator,
+            )
+
+            notice_file = os.path.join(temp_dir, "NOTICE")
+            add(
+                "generate_notice_file",
+                size,
+                functools.partial(generate_notice_file, origin_to_deps, notice_file),
+            )
+
+            dash_file = os.path.join(temp_dir, "DASH")
+            add(
+                "generate_dash_input",
+                size,
+                functools.partial(generate_dash_input, dash_file, origin_to_deps),
+            )
+
+            step_count = max(1, size // WORKFLOW_SIZE_DIVISOR)
+            workflow = generate_workflow(step_count)
+            add(
+                "read_used_actions_from_yaml",
+                step_count,
+                lambda workflow=workflow: _read_used_actions_from_yaml(
+                    io.StringIO(workflow)
+                ),
+            )
+
+    return results
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """Format a result as a row of the result table.
+
+    Args:
+        result (BenchmarkResult): The result to format.
+
+    Returns:
+        str: The formatted row.
+    """
+    return (
+        f"{result.name:<30}{result.size:>10}{result.seconds * 1000:>12.2f}"
+        f"{result.throughput:>16,.0f}{result.peak_memory / 1024 / 1024:>14.2f}"
+    )
+
+
+def get_args():
+    """Obtain all command line arguments given to the script."""
+    parser = argparse.ArgumentParser("Benchmarks the hot paths of the license checker")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Numbers of dependencies to benchmark with",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of timed runs per benchmark"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=str,
+        action="append",
+        help="Name of a benchmark to run, can be given multiple times",
+    )
+    parser.add_argument(
+        "--json", type=str, help="Path of a file to write the results to as JSON"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Entry point of the benchmarks."""
+    args = get_args()
+    print(
+        f"{'Benchmark':<30}{'Size':>10}{'Time [ms]':>12}"
+        f"{'Items/s':>16}{'Peak [MiB]':>14}"
+    )
+    results = run_benchmarks(args.sizes, args.repeat, args.benchmark)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump([result.to_dict() for result in results], file, indent=2)
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Local stand-in for the GitHub API used by the benchmarks.
+
+Answers the repository requests of the REST API and the batched repository
+queries of the GraphQL API with a license derived from the repository name,
+after a configurable latency.
+"""
+
+import json
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+# number of requests allowed by the stub, as for authenticated users of GitHub
+RATE_LIMIT = 5000
+
+_LICENSES = ["MIT License", "Apache License 2.0", 'BSD 3-Clause "New" License']
+
+_GRAPHQL_REPOSITORY_PATTERN = re.compile(
+    r'(r\d+): repository\(owner: "([^"]*)", name: "([^"]*)"\)'
+)
+
+
+def get_stub_license(repository: str) -> str:
+    """Return the license reported by the stub for the given repository.
+
+    Args:
+        repository (str): The repository name, e.g. "actions/checkout".
+
+    Returns:
+        str: The name of the license.
+    """
+    return _LICENSES[zlib.crc32(repository.encode("utf-8")) % len(_LICENSES)]
+
+
+class StubGitHubServer:
+    """HTTP server serving the stub API on a free local port.
+
+    Use as context manager, the server runs in a background thread.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """Create a new instance.
+
+        Args:
+            latency (float, optional): Time in seconds each request takes.
+        """
+        self.latency = latency
+        self.request_count = 0
+        self.__lock = threading.Lock()
+        self.__server: Optional[ThreadingHTTPServer] = None
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the API."""
+        if self.__server is None:
+            raise RuntimeError("Server is not running")
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubGitHubServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                match = re.fullmatch(r"/repos/([^/]+/[^/]+)", self.path)
+                if match is None:
+                    stub.respond(self, 404, {"message": "Not Found"})
+                    return
+                license_name = get_stub_license(match[1])
+                stub.respond(self, 200, {"license": {"name": license_name}})
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                query = json.loads(self.rfile.read(length) or b"{}").get("query", "")
+                data = {
+                    alias: {
+                        "licenseInfo": {"name": get_stub_license(f"{owner}/{name}")}
+                    }
+                    for alias, owner, name in _GRAPHQL_REPOSITORY_PATTERN.findall(query)
+                }
+                stub.respond(self, 200, {"data": data})
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, daemon=True
+        )
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def respond(self, handler: BaseHTTPRequestHandler, status: int, body: dict) -> None:
+        """Send a JSON response after the configured latency.
+
+        Args:
+            handler (BaseHTTPRequestHandler): The handler of the request.
+            status (int): The HTTP status code.
+            body (dict): The response body.
+        """
+        with self.__lock:
+            self.request_count += 1
+            remaining = max(0, RATE_LIMIT - self.request_count)
+        time.sleep(self.latency)
+
+        content = json.dumps(body).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(content)))
+        handler.send_header("X-RateLimit-Remaining", str(remaining))
+        handler.end_headers()
+        handler.wfile.write(content)
@@ -0,0 +1,159 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Stand-in for the pivotal license_finder executable used by the benchmarks.
+
+Supports the "version" and "report" commands with the arguments passed by
+the license checker. Instead of preparing and inspecting the projects, the
+dependencies are read directly from the requirement, Cargo.lock and
+package-lock.json files, and licenses not recorded there are derived from
+the package name. Each report takes at least LICENSE_FINDER_STUB_LATENCY
+seconds, to simulate the costs of the real tool.
+
+Only uses the standard library, as it is copied into a directory of its own
+and executed as "license_finder".
+"""
+
+import csv
+import json
+import os
+import re
+import sys
+import time
+import zlib
+
+LATENCY_ENV = "LICENSE_FINDER_STUB_LATENCY"
+VERSION = "7.2.1-stub"
+
+ALL_PACKAGE_MANAGERS = ["pip", "cargo", "npm"]
+_LICENSES = ["MIT", "MIT", "MIT", "Apache 2.0", "BSD-3-Clause", "ISC"]
+
+
+def _get_license(name):
+    return _LICENSES[zlib.crc32(name.encode("utf-8")) % len(_LICENSES)]
+
+
+def _parse_args(args):
+    """Parse the report arguments into a dict of option to list of values."""
+    options = {}
+    option = None
+    for arg in args:
+        if arg.startswith("--"):
+            option, separator, value = arg[2:].partition("=")
+            options[option] = value.split() if separator else []
+        elif option is not None:
+            options[option].append(arg)
+    return options
+
+
+def _read_requirements(path, visited):
+    path = os.path.normpath(path)
+    if path in visited or not os.path.isfile(path):
+        return
+    visited.add(path)
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.split("#")[0].strip()
+            include = re.match(r"^(?:-r|--requirement)[\s=]+(\S+)", line)
+            if include:
+                yield from _read_requirements(
+                    os.path.join(os.path.dirname(path), include[1]), visited
+                )
+                continue
+            match = re.match(r"^([A-Za-z0-9._-]+)\s*(?:==\s*(\S+))?", line)
+            if match:
+                yield match[1], match[2] or "", _get_license(match[1])
+
+
+def _read_cargo_lock(path):
+    if not os.path.isfile(path):
+        return
+    with open(path, "r", encoding="utf-8") as file:
+        content = file.read()
+    for match in re.finditer(r'name = "([^"]+)"\nversion = "([^"]+)"', content):
+        yield match[1], match[2], _get_license(match[1])
+
+
+def _read_package_lock(path):
+    if not os.path.isfile(path):
+        return
+    with open(path, "r", encoding="utf-8") as file:
+        packages = json.load(file).get("packages", {})
+    for package_path, entry in packages.items():
+        name = entry.get("name") or package_path.rsplit("node_modules/", 1)[-1]
+        if name:
+            yield (
+                name,
+                entry.get("version", ""),
+                entry.get("license") or (_get_license(name)),
+            )
+
+
+def _find_dependencies(directory, package_manager, options):
+    if package_manager == "pip":
+        requirements = options.get("pip-requirements-path", ["requirements.txt"])[0]
+        return _read_requirements(os.path.join(directory, requirements), set())
+    if package_manager == "cargo":
+        return _read_cargo_lock(os.path.join(directory, "Cargo.lock"))
+    if package_manager == "npm":
+        return _read_package_lock(os.path.join(directory, "package-lock.json"))
+    return iter(())
+
+
+def report(args):
+    """Write the report requested by the given arguments."""
+    started = time.perf_counter()
+    options = _parse_args(args)
+    package_managers = options.get("enabled-package-managers") or (ALL_PACKAGE_MANAGERS)
+    directories = options.get("aggregate-paths") or [os.curdir]
+    columns = options.get("columns") or ["name", "version", "licenses"]
+
+    rows = []
+    for directory in directories:
+        for package_manager in package_managers:
+            for name, version, license_name in _find_dependencies(
+                directory, package_manager, options
+            ):
+                values = {
+                    "name": name,
+                    "version": version,
+                    "licenses": license_name,
+                    "package_manager": package_manager,
+                }
+                rows.append([values[column] for column in columns])
+
+    remaining = float(os.environ.get(LATENCY_ENV, "0")) - (
+        time.perf_counter() - started
+    )
+    if remaining > 0:
+        time.sleep(remaining)
+
+    with open(options["save"][0], "w", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerows(rows)
+
+
+def main():
+    """Entry point of the stub."""
+    if len(sys.argv) > 1 and sys.argv[1] == "version":
+        print(VERSION)
+    elif len(sys.argv) > 1 and sys.argv[1] == "report":
+        report(sys.argv[2:])
+    else:
+        print(f"Unsupported arguments: {sys.argv[1:]}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
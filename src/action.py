@@ -15,18 +15,40 @@
 """Github Action which finds and checks all licenses used by a software project."""
 
 import argparse
+import contextlib
+import os
 import sys
-from typing import Any
+from typing import Any, Optional
 
 import yaml
-from git import Repo
+from git import BadName, GitError
 from str2bool import str2bool
 
 from dash.dashgenerator import generate_dash_input
-from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.dependencystore import DependencyStore
+from licensevalidator.lib.metrics import (
+    get_metrics,
+    phase,
+    reset_metrics,
+    set_value,
+    write_metrics_file,
+    write_step_summary,
+)
+from licensevalidator.lib.profiling import profiling
+from licensevalidator.lib.tracing import (
+    disable_tracing,
+    enable_tracing,
+    span,
+    write_trace,
+)
 from licensevalidator.lib.utils import print_step
-from licensevalidator.licensevalidator import validate_used_licenses
-from licensevalidator.noticegenerator import generate_notice_file
+from licensevalidator.licensevalidator import (
+    validate_license_delta,
+    validate_used_licenses,
+)
+from licensevalidator.noticegenerator import update_notice_file
+
+PROFILE_DIR = "license-check-profile"
 
 
 def get_args():
@@ -61,57 +83,70 @@ def get_args():
         type=lambda x: bool(str2bool(x)),
         help="Generate Eclipse Dash compliant input file",
     )
+    parser.add_argument(
+        "--delta-base-ref",
+        type=str,
+        help="Only check dependencies added to the lock files since this git ref",
+    )
+    parser.add_argument(
+        "--incremental-base-ref",
+        type=str,
+        help="Only rescan dirs whose dependency files changed since this git ref",
+    )
+    parser.add_argument(
+        "--profile",
+        type=lambda x: bool(str2bool(x)),
+        default=False,
+        help="Profile the CPU time of the run with cProfile",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        type=lambda x: bool(str2bool(x)),
+        default=False,
+        help="Report the top allocating sites of each step with tracemalloc",
+    )
 
     return parser.parse_args()
 
 
-def is_dirty(repo_root_path: str, file_path: str) -> bool:
-    """Return true is the specified file is changed ("is dirty"); false otherwise.
-
-    Args:
-        repo_root_path (str): The path to the root of the repository.
-        file_path (str): The path to the file to check.
-    """
-    repo = Repo(repo_root_path)
-    repo.config_writer("global").set_value(
-        "safe", "directory", repo_root_path
-    ).release()
-    return repo.is_dirty(path=f"{repo_root_path}/{file_path}")
-
-
-def output_update_hint(repo_root_path: str, notice_file_name: str) -> None:
+def output_update_hint(notice_file_name: str, notice_diff: str) -> None:
     """Output a hint that the notice file needs to be updated manually.
 
     Args:
-        repo_root_path (str): The path to the root of the repository.
         notice_file_name (str): Name of the notice file to check.
+        notice_diff (str): Unified diff from the checked-in to the
+            updated contents of the notice file.
     """
     print(
         f'::error::{notice_file_name} needs to be manually updated ("checked-in")! '
-        "You can copy the updated contents from the workflow output."
+        "Apply the changes below, e.g. by piping them into 'git apply'."
     )
     print(
         "============================================================================================================="
     )
-    print(
-        "Copy from below here (!! Make sure to also copy the newline at the end-of-file !!) ..."
-    )
-    print(
-        "vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv"
-    )
-    with open(f"{repo_root_path}/{notice_file_name}", "r", encoding="utf8") as file:
-        print(file.read())
-    print(
-        "^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^"
-    )
-    print(
-        "... until above here. (!! Make sure to also copy the newline at the end-of-file !!)"
-    )
+    print(notice_diff, end="")
     print(
         "============================================================================================================="
     )
 
 
+def output_metrics(github_workspace: str, metrics_file: Optional[str]) -> None:
+    """Output the metrics of the run to the step summary and the metrics file.
+
+    Args:
+        github_workspace (str): The path of the checked out repository.
+        metrics_file (Optional[str]): The path of the metrics file relative
+            to the workspace. If not set, no metrics file is written.
+    """
+    metrics = get_metrics().to_dict()
+    try:
+        write_step_summary(metrics)
+        if metrics_file:
+            write_metrics_file(os.path.join(github_workspace, metrics_file), metrics)
+    except OSError as err:
+        print(f"::warning::Unable to write the metrics: {err}")
+
+
 def read_config_file(config_file_path: str) -> Any:
     """Read the config file located at the provided path.
 
@@ -133,27 +168,66 @@ def read_config_file(config_file_path: str) -> Any:
     return None
 
 
-def main():
-    """Execute the action which executes all steps of the license-validator."""
-    args = get_args()
-
-    config = read_config_file(args.config_file_path)
+def __run_action(args: argparse.Namespace, config: Any, github_workspace: str):
+    """Execute all steps of the license-validator.
 
-    github_workspace = "/github/workspace"
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        config (Any): The configuration of the license check.
+        github_workspace (str): The path of the checked out repository.
+    """
+    if args.delta_base_ref:
+        try:
+            licenses_are_valid, _ = validate_license_delta(
+                github_workspace,
+                config["scan-dirs"],
+                config["whitelist-file-path"],
+                args.delta_base_ref,
+                github_token=args.github_token,
+                cache_dir=config.get("cache-dir"),
+                github_cache_ttl=config.get("github-cache-ttl"),
+                github_offline=config.get("github-offline", False),
+            )
+        except FileNotFoundError as err:
+            print(f"::error::{err}")
+            sys.exit(-1)
+        except (BadName, GitError, ValueError) as err:
+            print(f"::warning::Unable to compute the dependency delta: {err}")
+        else:
+            set_value("licenses_valid", licenses_are_valid)
+            # the notice and dash files require all dependencies
+            print("Skipping notice and dash file generation in delta mode")
+            if not licenses_are_valid and args.fail_on_violation:
+                print(
+                    "::error::License check failed. At least one invalid license found!"
+                )
+                sys.exit(1)
+            return
 
     licenses_are_valid = False
-    origin_to_licenses: dict[str, list[DependencyInfo]] = {}
+    origin_to_licenses = DependencyStore()
     try:
         licenses_are_valid, origin_to_licenses = validate_used_licenses(
             github_workspace,
             config["scan-dirs"],
             config["whitelist-file-path"],
             github_token=args.github_token,
+            max_workers=config.get("max-workers"),
+            cache_dir=config.get("cache-dir"),
+            github_cache_ttl=config.get("github-cache-ttl"),
+            github_offline=config.get("github-offline", False),
+            aggregate=config.get("aggregate-license-finder-runs", False),
+            incremental_base_ref=args.incremental_base_ref,
+            license_lock_file=config.get("license-lock-file"),
         )
     except FileNotFoundError as err:
         print(f"::error::{err}")
         sys.exit(-1)
 
+    for origin, dependencies in origin_to_licenses.items():
+        set_value(f"dependencies.{origin}", len(dependencies))
+    set_value("licenses_valid", licenses_are_valid)
+
     workflow_failure = False
 
     if not licenses_are_valid and args.fail_on_violation:
@@ -163,23 +237,72 @@ def main():
     if args.generate_notice_file:
         print_step("Generating notice file")
         notice_file_path = f"{args.notice_file_name}.md"
-        generate_notice_file(
-            origin_to_licenses, f"{github_workspace}/{notice_file_path}"
+        # a newly generated notice file has not been checked in yet
+        is_new_notice_file = not os.path.isfile(
+            f"{github_workspace}/{notice_file_path}"
         )
-        notice_file_is_dirty = is_dirty(github_workspace, notice_file_path)
-        if notice_file_is_dirty:
-            output_update_hint(github_workspace, notice_file_path)
+        with phase("Generating notice file"):
+            notice_diff = update_notice_file(
+                origin_to_licenses,
+                f"{github_workspace}/{notice_file_path}",
+                notice_file_path,
+            )
+        if is_new_notice_file:
+            print(f"Generated new notice file {notice_file_path}")
+        elif notice_diff is not None:
+            output_update_hint(notice_file_path, notice_diff)
             workflow_failure = True
 
     if args.generate_dash:
         print("Generating Eclipse Dash compliant input file")
-        generate_dash_input(
-            f"{github_workspace}/clearlydefined.input", origin_to_licenses
-        )
+        with phase("Generating dash input"):
+            generate_dash_input(
+                f"{github_workspace}/clearlydefined.input", origin_to_licenses
+            )
 
     if workflow_failure:
         sys.exit(1)
 
 
+def main():
+    """Execute the action which executes all steps of the license-validator."""
+    args = get_args()
+
+    config = read_config_file(args.config_file_path)
+
+    # the runner mounts the workspace at /github/workspace for container
+    # actions and sets GITHUB_WORKSPACE accordingly, reading the variable
+    # lets main() also run outside the container, e.g. in benchmarks.endtoend
+    github_workspace = os.environ.get("GITHUB_WORKSPACE", "/github/workspace")
+
+    profiler = (
+        profiling(
+            os.path.join(github_workspace, PROFILE_DIR),
+            cpu=args.profile,
+            memory=args.profile_memory,
+        )
+        if args.profile or args.profile_memory
+        else contextlib.nullcontext()
+    )
+    with profiler:
+        reset_metrics()
+        trace_file = config.get("trace-file") if config else None
+        if trace_file:
+            enable_tracing()
+        try:
+            with span("License check", "run"):
+                __run_action(args, config, github_workspace)
+        finally:
+            if trace_file:
+                trace_file_path = os.path.join(github_workspace, trace_file)
+                write_trace(trace_file_path)
+                disable_tracing()
+                print(f"Trace written to '{trace_file_path}'")
+            output_metrics(
+                github_workspace,
+                config.get("metrics-file") if config else None,
+            )
+
+
 if __name__ == "__main__":
     main()
@@ -14,25 +14,29 @@
 
 """Methods to generate a notice file from given dependencies."""
 
+from collections.abc import Mapping
+
 from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.tracing import span
 
 
 def generate_dash_input(
-    path_to_output_file: str, origin_to_dependencies: dict[str, list[DependencyInfo]]
+    path_to_output_file: str, origin_to_dependencies: Mapping[str, list[DependencyInfo]]
 ) -> None:
     """Generate a notice file from the given dependencies in
     type/provider/namespace/name/revision format"""
-    with open(path_to_output_file, "w", encoding="utf-8") as file:
-        for origin, dep_infos in origin_to_dependencies.items():
-            for dep_info in dep_infos:
-                try:
-                    file.write(
-                        f"{get_type_provider_namespace_prefix(origin)}{dep_info.name}/{dep_info.version}\n"
-                    )
-                except KeyError as err:
-                    print(f"Uknown origin {origin}")
-                    print(f"Error: {err}")
-                    continue
+    with span("generate_dash_input", "output", path=path_to_output_file):
+        with open(path_to_output_file, "w", encoding="utf-8") as file:
+            for origin, dep_infos in origin_to_dependencies.items():
+                for dep_info in dep_infos:
+                    try:
+                        file.write(
+                            f"{get_type_provider_namespace_prefix(origin)}{dep_info.name}/{dep_info.version}\n"
+                        )
+                    except KeyError as err:
+                        print(f"Uknown origin {origin}")
+                        print(f"Error: {err}")
+                        continue
 
 
 def get_type_provider_namespace_prefix(origin: str) -> str:
@@ -14,9 +14,72 @@
 
 """Provides methods and classes to check licenses of a software project."""
 
+import re
 from io import open
+from typing import Optional, Union
 
 from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.spdx import parse_expression
+
+# different spellings of the same license, folded to their SPDX id.
+# keys and values are in normalized form, see normalize_license_name
+_LICENSE_ALIASES = {
+    "apache 2": "apache-2.0",
+    "apache 2.0": "apache-2.0",
+    "apache v2": "apache-2.0",
+    "apache version 2.0": "apache-2.0",
+    "apache, version 2.0": "apache-2.0",
+    "apache license 2.0": "apache-2.0",
+    "apache license v2": "apache-2.0",
+    "apache license version 2.0": "apache-2.0",
+    "apache license, version 2.0": "apache-2.0",
+    "asl 2.0": "apache-2.0",
+    "2-clause bsd": "bsd-2-clause",
+    "bsd 2-clause": "bsd-2-clause",
+    "simplified bsd": "bsd-2-clause",
+    "3-clause bsd": "bsd-3-clause",
+    "bsd 3-clause": "bsd-3-clause",
+    "new bsd": "bsd-3-clause",
+    "modified bsd": "bsd-3-clause",
+    "revised bsd": "bsd-3-clause",
+    "eclipse public 2.0": "epl-2.0",
+    "eclipse public v2.0": "epl-2.0",
+    "eclipse public license 2.0": "epl-2.0",
+    "eclipse public license v2.0": "epl-2.0",
+    "expat": "mit",
+    "isc license (iscl)": "isc",
+    "iscl": "isc",
+    "mozilla public 2.0": "mpl-2.0",
+    "mozilla public 2.0 (mpl 2.0)": "mpl-2.0",
+    "mozilla public license 2.0": "mpl-2.0",
+    "mozilla public license 2.0 (mpl 2.0)": "mpl-2.0",
+    "mpl 2.0": "mpl-2.0",
+    "the unlicense": "unlicense",
+    "the unlicense (unlicense)": "unlicense",
+    "zlib/libpng": "zlib",
+}
+
+_LICENSE_SUFFIX_PATTERN = re.compile(r" licen[cs]e$")
+
+
+def normalize_license_name(license_name: Optional[str]) -> str:
+    """Return the normalized form of the given license name.
+
+    Case, whitespace and a trailing "License" are ignored, and well-known
+    spellings of the same license are folded to its SPDX id, so e.g.
+    "Apache License 2.0", "Apache 2.0" and "apache-2.0" are equal.
+
+    Args:
+        license_name (Optional[str]): The name of the license.
+
+    Returns:
+        str: The normalized name. Empty if no name is given.
+    """
+    if license_name is None:
+        return ""
+    normalized = " ".join(license_name.lower().split())
+    normalized = _LICENSE_SUFFIX_PATTERN.sub("", normalized).strip()
+    return _LICENSE_ALIASES.get(normalized, normalized)
 
 
 class LicenseValidator:
@@ -40,30 +103,59 @@ def __init__(
         """
         self.licenses_list = licenses_list
         self.is_licenses_list_inclusive = is_licenses_list_inclusive
+        self.__normalized_licenses = frozenset(
+            normalize_license_name(license_name)
+            for license_name in licenses_list
+            if license_name
+        )
+        # dependencies share only a few distinct license names
+        self.__results: dict[Optional[str], bool] = {}
 
     def is_license_valid(self, license_name: str) -> bool:
         """Return if the given license is valid.
 
+        Unless listed literally, SPDX expressions are evaluated, i.e.
+        "MIT OR GPL-3.0" is valid if MIT is valid.
+
         Args:
             license_name (str):
-                The name of the license to check.
+                The name of the license or SPDX expression to check.
 
         Returns:
             bool: True if the license is valid. False otherwise.
         """
-        contained_in_list = license_name in self.licenses_list
+        result = self.__results.get(license_name)
+        if result is None:
+            result = self.__is_single_license_valid(license_name)
+            if (
+                license_name is not None
+                and normalize_license_name(license_name)
+                not in self.__normalized_licenses
+            ):
+                # SPDX expressions like "MIT OR Apache-2.0" are evaluated
+                try:
+                    expression = parse_expression(license_name)
+                    if expression.operator != "LICENSE":
+                        result = expression.evaluate(
+                            self.__is_single_license_valid,
+                            self.is_licenses_list_inclusive,
+                        )
+                except ValueError:
+                    pass
+            self.__results[license_name] = result
+        return result
+
+    def __is_single_license_valid(self, license_name: Optional[str]) -> bool:
+        contained_in_list = (
+            license_name is not None
+            and normalize_license_name(license_name) in self.__normalized_licenses
+        )
 
         # containedInList    | inclusive | result
         # true                 true        true
         # false                true        false
         # true                 false       false
         # false                false       true
-        if not contained_in_list:
-            # give it another try without the " License" suffix
-            if license_name is not None:
-                contained_in_list = (
-                    license_name.replace(" License", "") in self.licenses_list
-                )
         return contained_in_list == self.is_licenses_list_inclusive
 
 
@@ -88,7 +180,7 @@ def read_license_list(path: str) -> list[str]:
 def check_licenses(
     origin: str,
     all_deps_with_licenses: list[DependencyInfo],
-    whitelisted_licenses: list[str],
+    whitelisted_licenses: Union[list[str], LicenseValidator],
 ) -> bool:
     """Check if all given licenses are present in the provided whitelist.
 
@@ -97,14 +189,19 @@ def check_licenses(
             Origin of the dependencies.
         all_deps_with_licenses (list[DependencyInfo]):
             The list of all dependencies along with their licenses.
-        whitelisted_licenses (list[str]):
-            The list of whitelisted licenses.
+        whitelisted_licenses (Union[list[str], LicenseValidator]):
+            The list of whitelisted licenses or a validator built from it,
+            which can be shared between several checks.
 
     Returns:
         bool: True if all licenses are present in the whitelist.
               False otherwise.
     """
-    validator = LicenseValidator(whitelisted_licenses, True)
+    validator = (
+        whitelisted_licenses
+        if isinstance(whitelisted_licenses, LicenseValidator)
+        else LicenseValidator(whitelisted_licenses, True)
+    )
 
     result = True
     print(f'Checking licenses from "{origin}"...')
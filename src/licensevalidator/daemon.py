@@ -0,0 +1,429 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Long-running license check server for checking many projects in a row.
+
+Every run of the action pays for starting the interpreter and importing
+its dependencies, for reading the caches and the whitelist and for
+starting its workers. The daemon does this once and then serves scan
+requests on a local Unix socket, keeping the following warm across scans:
+
+* the imported modules and the version of the license finder
+* the pool of workers executing the scan jobs
+* the cached licenses of workflow actions, per cache directory
+* the validators of the whitelists, including their memoized results,
+  until the whitelist file changes
+
+Requests are processed one at a time, as the output and the metrics of
+a scan are collected process wide. See licensevalidator.daemonclient for
+the client and the protocol.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Optional
+
+import yaml
+
+from licensevalidator.checklicenses import LicenseValidator, read_license_list
+from licensevalidator.daemonclient import DEFAULT_SOCKET_PATH
+from licensevalidator.findlicenses import get_license_cache_file
+from licensevalidator.lib.githubcache import DEFAULT_TTL, GitHubLicenseCache
+from licensevalidator.lib.licensefinder import get_license_finder_version
+from licensevalidator.lib.metrics import get_metrics, reset_metrics, set_value
+from licensevalidator.lib.tracing import span
+from licensevalidator.licensevalidator import validate_used_licenses
+
+
+class LicenseCheckDaemon:
+    """Scans projects, keeping workers, caches and whitelists in memory."""
+
+    def __init__(self, max_workers: Optional[int] = None, cache_dir: str = None):
+        """Create a new instance and start its workers.
+
+        Args:
+            max_workers (Optional[int], optional): Maximum number of scan jobs
+                executed concurrently. Defaults to the number of CPU cores.
+            cache_dir (str, optional): Directory of the persistent result
+                cache used for projects which do not configure one.
+                If not set, the results of those projects are not cached.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = os.path.abspath(cache_dir) if cache_dir else None
+        self.scan_count = 0
+        self.__executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.__validators: dict[str, tuple[tuple[int, int], LicenseValidator]] = {}
+        self.__license_caches: dict[str, GitHubLicenseCache] = {}
+
+    def warm_up(self) -> None:
+        """Start the license finder once in the background,
+        so its version is known and its files are cached by the OS."""
+        self.__executor.submit(get_license_finder_version)
+
+    def get_validator(self, whitelist_path: str) -> LicenseValidator:
+        """Return the validator for the given whitelist.
+
+        The validator is reused until the whitelist file is modified.
+
+        Args:
+            whitelist_path (str): The path of the whitelist file.
+
+        Raises:
+            FileNotFoundError: In case the whitelist file does not exist.
+
+        Returns:
+            LicenseValidator: The validator.
+        """
+        whitelist_path = os.path.abspath(whitelist_path)
+        stat = os.stat(whitelist_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self.__validators.get(whitelist_path)
+        if cached is None or cached[0] != version:
+            cached = (
+                version,
+                LicenseValidator(read_license_list(whitelist_path), True),
+            )
+            self.__validators[whitelist_path] = cached
+        return cached[1]
+
+    def get_license_cache(
+        self, cache_dir: str, ttl: float = DEFAULT_TTL, offline: bool = False
+    ) -> GitHubLicenseCache:
+        """Return the cache of the licenses of workflow actions.
+
+        The cache file is only read once, afterwards the cache is
+        kept in memory and saved after each lookup.
+
+        Args:
+            cache_dir (str): The directory of the persistent result cache.
+            ttl (float, optional): Time in seconds for which an entry is
+                used without revalidation. Defaults to one day.
+            offline (bool, optional): If set to True, only cached entries
+                are used. Defaults to False.
+
+        Returns:
+            GitHubLicenseCache: The cache.
+        """
+        cache_file = os.path.abspath(get_license_cache_file(cache_dir))
+        license_cache = self.__license_caches.get(cache_file)
+        if license_cache is None:
+            license_cache = GitHubLicenseCache(cache_file)
+            self.__license_caches[cache_file] = license_cache
+        license_cache.ttl = ttl
+        license_cache.offline = offline
+        return license_cache
+
+    def scan(
+        self,
+        project_root: str,
+        config: Any,
+        github_token: str = None,
+        incremental_base_ref: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Find and check all licenses of a project.
+
+        The max-workers setting of the config is ignored,
+        the workers of the daemon are used instead.
+
+        Args:
+            project_root (str): The path to the project root.
+            config (Any): The configuration of the license check.
+            github_token (str, optional): GitHub token to do authorized
+                API requests (overcoming rate limiting).
+            incremental_base_ref (Optional[str], optional): Only rescan dirs
+                whose dependency files changed since this git ref.
+
+        Raises:
+            FileNotFoundError: In case the whitelist file is not present.
+            KeyError: In case a required config key is missing.
+
+        Returns:
+            dict[str, Any]: The result, see daemonclient.scan.
+        """
+        project_root = os.path.abspath(project_root)
+        whitelist_file_path = config["whitelist-file-path"]
+        whitelist_path = os.path.join(project_root, whitelist_file_path)
+
+        cache_dir = self.cache_dir
+        if config.get("cache-dir"):
+            cache_dir = os.path.join(project_root, config["cache-dir"])
+        github_cache_ttl = config.get("github-cache-ttl")
+        github_offline = config.get("github-offline", False)
+        license_cache = None
+        if cache_dir:
+            license_cache = self.get_license_cache(
+                cache_dir,
+                github_cache_ttl if github_cache_ttl is not None else DEFAULT_TTL,
+                github_offline,
+            )
+
+        reset_metrics()
+        self.scan_count += 1
+        with span("License check", "run"):
+            licenses_valid, origin_to_deps = validate_used_licenses(
+                project_root,
+                config["scan-dirs"],
+                whitelist_file_path,
+                github_token=github_token,
+                max_workers=self.max_workers,
+                cache_dir=cache_dir,
+                github_cache_ttl=github_cache_ttl,
+                github_offline=github_offline,
+                aggregate=config.get("aggregate-license-finder-runs", False),
+                incremental_base_ref=incremental_base_ref,
+                license_lock_file=config.get("license-lock-file"),
+                executor=self.__executor,
+                license_cache=license_cache,
+                validator=(
+                    self.get_validator(whitelist_path)
+                    if os.path.isfile(whitelist_path)
+                    else None
+                ),
+            )
+        for origin, dependencies in origin_to_deps.items():
+            set_value(f"dependencies.{origin}", len(dependencies))
+        set_value("licenses_valid", licenses_valid)
+
+        return {
+            "licenses_valid": licenses_valid,
+            "dependencies": {
+                origin: [
+                    [dep.name, dep.version, list(dep.licenses)] for dep in dependencies
+                ]
+                for origin, dependencies in origin_to_deps.items()
+            },
+            "metrics": get_metrics().to_dict(),
+        }
+
+    def close(self) -> None:
+        """Stop the workers once the running jobs are finished."""
+        self.__executor.shutdown()
+
+
+def _send_message(wfile: BinaryIO, message: dict[str, Any]) -> None:
+    wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+    wfile.flush()
+
+
+class _OutputStream(io.TextIOBase):
+    """Forwards everything printed during a scan to the client, line by line.
+
+    Once the client disconnected, the output is dropped,
+    so the scan is not interrupted.
+    """
+
+    def __init__(self, wfile: BinaryIO):
+        """Create a new instance.
+
+        Args:
+            wfile (BinaryIO): The stream of the connection to the client.
+        """
+        self.__wfile = wfile
+        self.__buffer = ""
+        self.__lock = threading.Lock()
+        self.disconnected = False
+
+    def write(self, text: str) -> int:
+        """Forward all complete lines of the written text."""
+        with self.__lock:
+            self.__buffer += text
+            if "\n" in self.__buffer:
+                lines, _, self.__buffer = self.__buffer.rpartition("\n")
+                self.__send(lines + "\n")
+        return len(text)
+
+    def flush(self) -> None:
+        """Forward the incomplete line, if any."""
+        with self.__lock:
+            if self.__buffer:
+                self.__send(self.__buffer)
+                self.__buffer = ""
+
+    def __send(self, text: str) -> None:
+        if self.disconnected:
+            return
+        try:
+            _send_message(self.__wfile, {"output": text})
+        except OSError:
+            self.disconnected = True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Processes a single request of a client."""
+
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError as err:
+            _send_message(self.wfile, {"error": f"Malformed request: {err}"})
+            return
+
+        command = request.get("command", "scan")
+        if command == "shutdown":
+            self.server.stop_requested = True
+            _send_message(self.wfile, {"result": {}})
+        elif command == "scan":
+            self.__scan(request)
+        else:
+            _send_message(self.wfile, {"error": f"Unknown command '{command}'"})
+
+    def __scan(self, request: dict[str, Any]) -> None:
+        output = _OutputStream(self.wfile)
+        try:
+            with contextlib.redirect_stdout(output):
+                try:
+                    with open(
+                        request["config_file_path"], "r", encoding="utf-8"
+                    ) as file:
+                        config = yaml.safe_load(file)
+                    result = self.server.daemon.scan(
+                        request["project_root"],
+                        config,
+                        request.get("github_token"),
+                        request.get("incremental_base_ref"),
+                    )
+                finally:
+                    output.flush()
+        except Exception as err:
+            # the request boundary, a failing scan must not kill the daemon
+            # or leave the client without an answer
+            message: dict[str, Any] = {"error": f"{type(err).__name__}: {err}"}
+        else:
+            message = {"result": result}
+
+        print(
+            f"Scan #{self.server.daemon.scan_count} of "
+            f"'{request.get('project_root')}': "
+            f"{'failed' if 'error' in message else 'done'}"
+        )
+        if not output.disconnected:
+            _send_message(self.wfile, message)
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server passing the requests to the daemon one at a time."""
+
+    def __init__(self, socket_path: str, daemon: LicenseCheckDaemon):
+        """Create a new instance and bind it to the given socket.
+
+        Args:
+            socket_path (str): The path of the Unix socket.
+            daemon (LicenseCheckDaemon): The daemon processing the requests.
+        """
+        self.daemon = daemon
+        self.stop_requested = False
+        super().__init__(socket_path, _RequestHandler)
+
+
+def __remove_stale_socket(socket_path: str) -> None:
+    """Remove the socket of a daemon which is no longer running.
+
+    Raises:
+        OSError: In case a daemon is still listening on the socket.
+    """
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+            return
+    raise OSError(f"A daemon is already listening on '{socket_path}'")
+
+
+def serve(daemon: LicenseCheckDaemon, socket_path: str = DEFAULT_SOCKET_PATH) -> None:
+    """Serve the requests of clients until a shutdown is requested.
+
+    The socket is only accessible by the current user.
+
+    Args:
+        daemon (LicenseCheckDaemon): The daemon processing the requests.
+        socket_path (str, optional): The path of the Unix socket.
+
+    Raises:
+        OSError: In case the socket cannot be created.
+    """
+    __remove_stale_socket(socket_path)
+    previous_umask = os.umask(0o177)
+    try:
+        server = _DaemonServer(socket_path, daemon)
+    finally:
+        os.umask(previous_umask)
+
+    print(f"Listening on '{socket_path}'")
+    try:
+        while not server.stop_requested:
+            server.handle_request()
+    finally:
+        server.server_close()
+        os.remove(socket_path)
+
+
+def get_args():
+    """Obtain all command line arguments given to the script."""
+    parser = argparse.ArgumentParser(
+        "Serves license checks of projects on a Unix socket"
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=DEFAULT_SOCKET_PATH,
+        help="Path of the Unix socket to listen on",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum number of scan jobs executed concurrently",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Result cache for projects which do not configure a cache-dir",
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Run the daemon until it is stopped by a client or a signal."""
+    args = get_args()
+
+    def stop(*_: Any) -> None:
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+
+    daemon = LicenseCheckDaemon(args.max_workers, args.cache_dir)
+    daemon.warm_up()
+    try:
+        serve(daemon, args.socket)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+
+
+if __name__ == "__main__":
+    main()
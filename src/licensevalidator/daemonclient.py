@@ -0,0 +1,203 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Client of the license check daemon.
+
+Only depends on the standard library, so it starts quickly. The heavy
+lifting is done by the daemon (see licensevalidator.daemon), which keeps
+the imported modules, caches and workers warm across scans.
+
+The protocol consists of JSON messages, one per line. The client sends a
+single request and the daemon answers with any number of "output"
+messages, carrying what the scan printed, followed by either a "result"
+or an "error" message.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+from typing import Any, Optional, TextIO
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "license-check.sock")
+
+
+class DaemonError(Exception):
+    """Raised if the daemon was unable to process a request."""
+
+
+def send_request(
+    socket_path: str, request: dict[str, Any], output: Optional[TextIO] = None
+) -> dict[str, Any]:
+    """Send a request to the daemon and wait for its result.
+
+    Args:
+        socket_path (str): The path of the Unix socket of the daemon.
+        request (dict[str, Any]): The request, see scan and shutdown.
+        output (Optional[TextIO], optional): Receives the output of the
+            scan while it is running. Defaults to stdout.
+
+    Raises:
+        DaemonError: In case the daemon reported an error or
+            closed the connection without a result.
+        OSError: In case the daemon is not reachable.
+
+    Returns:
+        dict[str, Any]: The result.
+    """
+    if output is None:
+        output = sys.stdout
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with connection.makefile("r", encoding="utf-8") as messages:
+            for line in messages:
+                message = json.loads(line)
+                if "output" in message:
+                    output.write(message["output"])
+                    output.flush()
+                elif "error" in message:
+                    raise DaemonError(message["error"])
+                elif "result" in message:
+                    return message["result"]
+
+    raise DaemonError("Connection closed by the daemon without a result")
+
+
+def scan(
+    socket_path: str,
+    project_root: str,
+    config_file_path: str,
+    github_token: Optional[str] = None,
+    incremental_base_ref: Optional[str] = None,
+    output: Optional[TextIO] = None,
+) -> dict[str, Any]:
+    """Let the daemon find and check all licenses of a project.
+
+    Args:
+        socket_path (str): The path of the Unix socket of the daemon.
+        project_root (str): The path to the project root.
+        config_file_path (str): The path to the license check configuration.
+        github_token (Optional[str], optional): GitHub token to do authorized
+            API requests (overcoming rate limiting).
+        incremental_base_ref (Optional[str], optional): Only rescan dirs
+            whose dependency files changed since this git ref.
+        output (Optional[TextIO], optional): Receives the output of the
+            scan while it is running. Defaults to stdout.
+
+    Raises:
+        DaemonError: In case the daemon was unable to scan the project.
+        OSError: In case the daemon is not reachable.
+
+    Returns:
+        dict[str, Any]: The result, containing "licenses_valid", the found
+            "dependencies" as rows of name, version and licenses per
+            origin and the "metrics" of the scan.
+    """
+    return send_request(
+        socket_path,
+        {
+            "command": "scan",
+            "project_root": os.path.abspath(project_root),
+            "config_file_path": os.path.abspath(config_file_path),
+            "github_token": github_token,
+            "incremental_base_ref": incremental_base_ref,
+        },
+        output,
+    )
+
+
+def shutdown(socket_path: str) -> None:
+    """Stop the daemon once the running scan is finished.
+
+    Args:
+        socket_path (str): The path of the Unix socket of the daemon.
+
+    Raises:
+        OSError: In case the daemon is not reachable.
+    """
+    send_request(socket_path, {"command": "shutdown"})
+
+
+def get_args():
+    """Obtain all command line arguments given to the script."""
+    parser = argparse.ArgumentParser(
+        "Finds and checks all licenses of a project using the license check daemon"
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=DEFAULT_SOCKET_PATH,
+        help="Path of the Unix socket of the daemon",
+    )
+    parser.add_argument(
+        "--shutdown",
+        action="store_true",
+        help="Stop the daemon instead of scanning a project",
+    )
+    parser.add_argument(
+        "--project-root", type=str, default=".", help="Path to the project root"
+    )
+    parser.add_argument(
+        "--config-file-path",
+        type=str,
+        default=".licensechecker.yml",
+        help="Path to the license check configuration (relative to project root)",
+    )
+    parser.add_argument(
+        "--github-token",
+        type=str,
+        help="Pass GitHub token to overcome possible rate limiting issues",
+    )
+    parser.add_argument(
+        "--incremental-base-ref",
+        type=str,
+        help="Only rescan dirs whose dependency files changed since this git ref",
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Scan a project using the daemon.
+
+    Exits with 1 if an invalid license was found
+    and with 2 if the scan was not possible.
+    """
+    args = get_args()
+    try:
+        if args.shutdown:
+            shutdown(args.socket)
+            return
+
+        result = scan(
+            args.socket,
+            args.project_root,
+            os.path.join(args.project_root, args.config_file_path),
+            args.github_token or os.environ.get("GITHUB_TOKEN"),
+            args.incremental_base_ref,
+        )
+    except (DaemonError, OSError) as err:
+        print(f"::error::{err}")
+        sys.exit(2)
+
+    if not result["licenses_valid"]:
+        print("::error::License check failed. At least one invalid license found!")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,24 +14,97 @@
 
 """Methods and classes to find all licenses of a software project."""
 
+import contextlib
 import os
 import shutil
-from typing import Any, Optional
+import subprocess
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
+from git import BadName, GitError
+
+from licensevalidator.lib.cargoscanner import scan_cargo_dependencies
 from licensevalidator.lib.dependency import DependencyInfo
-from licensevalidator.lib.licensefinder import execute_license_finder
+from licensevalidator.lib.dependencystore import DependencyStore, get_sort_key
+from licensevalidator.lib.githubcache import DEFAULT_TTL, GitHubLicenseCache
+from licensevalidator.lib.incremental import (
+    WORKFLOWS_DIR,
+    get_changed_files,
+    get_incremental_key,
+    get_scan_dir_input_files,
+    get_unpinned_requirements,
+    get_workflow_input_files,
+    is_any_changed,
+)
+from licensevalidator.lib.licensefinder import (
+    MANIFEST_FILES,
+    execute_aggregated_license_finder,
+    execute_license_finder,
+)
+from licensevalidator.lib.metrics import phase
+from licensevalidator.lib.npmscanner import scan_npm_dependencies
+from licensevalidator.lib.pipscanner import MetadataIndex, scan_python_dependencies
+from licensevalidator.lib.resultcache import ResultCache
+from licensevalidator.lib.tracing import add_span, is_tracing_enabled, span
 from licensevalidator.lib.utils import print_step
 from licensevalidator.lib.workflowlicenses import get_workflow_dependencies
 
+# package manager of the license finder which handles each language
+LANGUAGE_PACKAGE_MANAGERS = {"Python": "pip", "Rust": "cargo", "JavaScript": "npm"}
+
+# files of which at least one must be present to run a language check
+LANGUAGE_MANIFEST_FILES = {
+    "Python": ["requirements.txt"],
+    "Rust": MANIFEST_FILES["cargo"],
+    "c++": MANIFEST_FILES["conan"],
+    "JavaScript": MANIFEST_FILES["npm"],
+}
+
+KNOWN_MANIFEST_FILES = frozenset(
+    file_name
+    for file_names in LANGUAGE_MANIFEST_FILES.values()
+    for file_name in file_names
+)
+
 
 def __get_python_licenses(
     project_root: str,
     scan_dir: str,
     python_version: int,
     included_requirement_files: list[str],
+    result_cache: Optional[ResultCache] = None,
+    scanner: str = "license_finder",
+    metadata_paths: Optional[list[str]] = None,
 ) -> set[DependencyInfo]:
     dependencies: set[DependencyInfo] = set()
 
+    if scanner == "native" and metadata_paths is None:
+        # the packages of the interpreter running the check are unrelated
+        # to the project, so its metadata must not be used
+        print(
+            f"::warning::The native Python scanner requires "
+            f"'python-metadata-paths' for '{scan_dir}', "
+            "falling back to the License Finder"
+        )
+        scanner = "license_finder"
+
+    if scanner == "native":
+        metadata_index = MetadataIndex(
+            [
+                os.path.join(project_root, scan_dir, metadata_path)
+                for metadata_path in metadata_paths
+            ]
+        )
+        for requirement_file in included_requirement_files or ["requirements.txt"]:
+            dependencies.update(
+                scan_python_dependencies(
+                    os.path.join(project_root, scan_dir, requirement_file),
+                    metadata_index,
+                )
+            )
+        return dependencies
+
     if included_requirement_files is not None:
         for requirement_file in included_requirement_files:
             dependencies.update(
@@ -40,6 +113,7 @@ def __get_python_licenses(
                     pip_requirements_path=requirement_file,
                     python_version=python_version,
                     package_managers=["pip"],
+                    result_cache=result_cache,
                 )
             )
     else:
@@ -48,12 +122,51 @@ def __get_python_licenses(
                 os.path.join(project_root, scan_dir),
                 python_version=python_version,
                 package_managers=["pip"],
+                result_cache=result_cache,
             )
         )
 
     return dependencies
 
 
+def __get_rust_licenses(
+    project_root: str,
+    scan_dir: str,
+    result_cache: Optional[ResultCache] = None,
+    scanner: str = "license_finder",
+    vendor_dir: str = "vendor",
+) -> list[DependencyInfo]:
+    if scanner == "native":
+        return scan_cargo_dependencies(
+            os.path.join(project_root, scan_dir), vendor_dir=vendor_dir
+        )
+
+    return execute_license_finder(
+        os.path.join(project_root, scan_dir),
+        package_managers=["cargo"],
+        result_cache=result_cache,
+    )
+
+
+def __get_javascript_licenses(
+    project_root: str,
+    scan_dir: str,
+    result_cache: Optional[ResultCache] = None,
+    scanner: str = "license_finder",
+    include_dev_dependencies: bool = True,
+) -> list[DependencyInfo]:
+    if scanner == "native":
+        return scan_npm_dependencies(
+            os.path.join(project_root, scan_dir), include_dev_dependencies
+        )
+
+    return execute_license_finder(
+        os.path.join(project_root, scan_dir),
+        package_managers=["npm"],
+        result_cache=result_cache,
+    )
+
+
 def __get_cpp_licenses(
     project_root: str, scan_dir: str, conan_profile_files: Optional[list[str]]
 ) -> set[DependencyInfo]:
@@ -139,18 +252,442 @@ def sort_dependencies(deps: list[DependencyInfo]) -> list[DependencyInfo]:
     Returns:
         A new list with sorted contents
     """
-    deps = sorted(deps, key=lambda x: x.version.lower())
-    deps = sorted(deps, key=lambda x: x.name.lower())
-    return deps
+    return sorted(deps, key=get_sort_key)
+
+
+def detect_manifests(scan_dir: str) -> frozenset[str]:
+    """Return the known manifest and lock files present in a directory.
+
+    The directory is listed only once, regardless of the number of
+    languages which are checked.
+
+    Args:
+        scan_dir (str): The directory to look into.
+
+    Returns:
+        frozenset[str]: The names of the present manifest and lock files.
+    """
+    try:
+        with os.scandir(scan_dir) as entries:
+            return frozenset(
+                entry.name
+                for entry in entries
+                if entry.name in KNOWN_MANIFEST_FILES and entry.is_file()
+            )
+    except OSError:
+        return frozenset()
+
+
+def __is_language_present(
+    scan_dir: str, scan_directory_config: Any, origin: str, manifests: frozenset[str]
+) -> bool:
+    """Return True if the language check of the given origin applies to
+    the scan directory, based on the present manifests."""
+    if origin == "Python" and scan_directory_config.get(
+        "python-pip-included-requirement-files"
+    ):
+        # configured requirement files may be located in sub directories
+        return any(
+            os.path.isfile(os.path.join(scan_dir, requirement_file))
+            for requirement_file in scan_directory_config[
+                "python-pip-included-requirement-files"
+            ]
+        )
+    return not manifests.isdisjoint(LANGUAGE_MANIFEST_FILES.get(origin, []))
+
+
+def __run_language_check(
+    scan_directory_config: Any,
+    language_check: tuple[str, Callable[[Any], Any]],
+) -> dict[str, list[DependencyInfo]]:
+    """Run a single language check on a single scan directory.
+
+    Args:
+        scan_directory_config (Any):
+            The configuration of the directory to scan.
+        language_check (tuple[str, Callable[[Any], Any]]):
+            The origin name and the function finding its dependencies.
+
+    Returns:
+        dict[str, list[DependencyInfo]]: Maps the origin to the list
+            of found dependencies. Empty if the check failed.
+    """
+    print(
+        f"Try finding {language_check[0]} package managers "
+        f"in '{scan_directory_config['path']}':"
+    )
+    with span(
+        f"{language_check[0]} check",
+        "language_check",
+        scan_dir=scan_directory_config["path"],
+    ) as span_args:
+        try:
+            return {language_check[0]: language_check[1](scan_directory_config)}
+        except Exception as err:
+            print(f"Found an issue!: {err}")
+            span_args["error"] = repr(err)
+    return {}
+
+
+def __run_incremental_check(
+    origin: str,
+    get_key: Callable[[], str],
+    is_changed: bool,
+    run_check: Callable[[], dict[str, list[DependencyInfo]]],
+    result_cache: ResultCache,
+) -> dict[str, list[DependencyInfo]]:
+    """Run a check, unless its inputs are unchanged and its previous
+    result is cached.
+
+    Args:
+        origin (str): The origin of the dependencies found by the check.
+        get_key (Callable[[], str]): Returns the key of the result,
+            derived from all inputs of the check.
+        is_changed (bool): True if any input of the check changed.
+        run_check (Callable[[], dict[str, list[DependencyInfo]]]):
+            Runs the check.
+        result_cache (ResultCache): The cache of previous results.
+
+    Returns:
+        dict[str, list[DependencyInfo]]: Maps the origin to the list
+            of found dependencies. Empty if the check failed.
+    """
+    key = get_key()
+    if not is_changed:
+        deps = result_cache.get(key)
+        if deps is not None:
+            print(f"Reusing {origin} dependencies, inputs are unchanged")
+            return {origin: deps}
+
+    result = run_check()
+    if origin in result:
+        result_cache.put(key, result[origin])
+    return result
+
+
+def __run_incremental_language_check(
+    project_root: str,
+    scan_directory_config: Any,
+    language_check: tuple[str, Callable[[Any], Any]],
+    changed_files: set[str],
+    result_cache: ResultCache,
+) -> dict[str, list[DependencyInfo]]:
+    """Run a single language check on a single scan directory, unless
+    its inputs did not change since the base ref. Python checks of
+    unpinned requirements are always run.
+
+    Args:
+        project_root (str):
+            The path to the project's root.
+        scan_directory_config (Any):
+            The configuration of the directory to scan.
+        language_check (tuple[str, Callable[[Any], Any]]):
+            The origin name and the function finding its dependencies.
+        changed_files (set[str]):
+            The files changed since the base ref.
+        result_cache (ResultCache):
+            The cache of previous results.
+
+    Returns:
+        dict[str, list[DependencyInfo]]: Maps the origin to the list
+            of found dependencies. Empty if the check failed.
+    """
+    if language_check[0] == "Python":
+        unpinned = get_unpinned_requirements(project_root, scan_directory_config)
+        if unpinned:
+            print(
+                f"Not reusing Python dependencies of '{scan_directory_config['path']}',"
+                f" the requirements {', '.join(unpinned)} are not pinned"
+            )
+            return __run_language_check(scan_directory_config, language_check)
+
+    input_files = get_scan_dir_input_files(
+        project_root, scan_directory_config, KNOWN_MANIFEST_FILES
+    )
+    return __run_incremental_check(
+        language_check[0],
+        lambda: get_incremental_key(
+            project_root,
+            language_check[0],
+            scan_directory_config["path"],
+            scan_directory_config,
+            input_files,
+        ),
+        is_any_changed(input_files, changed_files),
+        lambda: __run_language_check(scan_directory_config, language_check),
+        result_cache,
+    )
+
+
+def __run_project_check(
+    project_root: str,
+    project_check: tuple[str, Callable[[], list[DependencyInfo]]],
+    changed_files: Optional[set[str]] = None,
+    result_cache: Optional[ResultCache] = None,
+) -> dict[str, list[DependencyInfo]]:
+    """Run a check on the whole project, e.g. for the workflows.
+
+    Args:
+        project_root (str):
+            The path to the project's root.
+        project_check (tuple[str, Callable[[], list[DependencyInfo]]]):
+            The origin name and the function finding its dependencies.
+        changed_files (Optional[set[str]]):
+            The files changed since the base ref in incremental mode.
+        result_cache (Optional[ResultCache]):
+            The cache of previous results.
+
+    Returns:
+        dict[str, list[DependencyInfo]]: Maps the origin to the list
+            of found dependencies.
+    """
+    print(f"Getting dependencies for {project_check[0]}")
+    with span(f"{project_check[0]} check", "project_check"):
+        if changed_files is None or result_cache is None:
+            return {project_check[0]: project_check[1]()}
+
+        return __run_incremental_check(
+            project_check[0],
+            lambda: get_incremental_key(
+                project_root,
+                project_check[0],
+                os.curdir,
+                None,
+                get_workflow_input_files(project_root),
+            ),
+            is_any_changed([WORKFLOWS_DIR], changed_files),
+            lambda: {project_check[0]: project_check[1]()},
+            result_cache,
+        )
+
+
+def __run_timed(timing: list[float], function: Callable, *args: Any) -> Any:
+    """Run a function, appending its start and end time to the given list."""
+    timing.append(time.perf_counter())
+    try:
+        return function(*args)
+    finally:
+        timing.append(time.perf_counter())
+
+
+def __add_scan_dir_spans(jobs: list[tuple[list[str], list[float], Future]]) -> None:
+    """Add a span per scan dir, from the start of its first job
+    to the end of its last job, each on a track of its own.
+
+    Args:
+        jobs (list[tuple[list[str], list[float], Future]]): The scan dirs
+            of each job along with the start and end time of the job.
+    """
+    scan_dir_times: dict[str, list[float]] = {}
+    for scan_dirs, timing, _ in jobs:
+        if len(timing) < 2:
+            continue
+        for scan_dir in scan_dirs:
+            times = scan_dir_times.setdefault(scan_dir, [timing[0], timing[1]])
+            times[0] = min(times[0], timing[0])
+            times[1] = max(times[1], timing[1])
+
+    for scan_dir, (start, end) in scan_dir_times.items():
+        add_span(
+            f"Scan dir '{scan_dir}'",
+            "scan_dir",
+            start,
+            end,
+            track=f"Scan dir '{scan_dir}'",
+            jobs=sum(scan_dir in scan_dirs for scan_dirs, _, _ in jobs),
+        )
+
+
+def __uses_native_scanner(scan_directory_config: Any, origin: str) -> bool:
+    return scan_directory_config.get(f"{origin.lower()}-scanner") == "native"
+
+
+def __get_aggregation_groups(
+    project_root: str,
+    scan_directories_config: list[Any],
+    scan_dir_manifests: list[frozenset[str]],
+) -> dict[tuple[Any, tuple[str, ...]], tuple[list[str], list[str], list[int]]]:
+    """Group the scan directories which can be scanned by a single
+    license finder execution.
+
+    Directories can be aggregated if they share the python version and
+    the package managers handled by the license finder.
+
+    Args:
+        project_root (str):
+            The path to the project's root.
+        scan_directories_config (list[Any]):
+            A list of directories to scan and their respective configurations.
+        scan_dir_manifests (list[frozenset[str]]):
+            The manifests present in each of the directories.
+
+    Returns:
+        dict[tuple[Any, tuple[str, ...]], tuple[list[str], list[str], list[int]]]:
+            Maps (python version, package managers) to the directories and
+            the requirement files to scan and the indices of the
+            directories in the configuration.
+    """
+    groups: dict[
+        tuple[Any, tuple[str, ...]], tuple[list[str], list[str], list[int]]
+    ] = {}
+    for index, (scan_directory_config, manifests) in enumerate(
+        zip(scan_directories_config, scan_dir_manifests)
+    ):
+        scan_dir = os.path.join(project_root, scan_directory_config["path"])
+        package_managers = tuple(
+            package_manager
+            for origin, package_manager in LANGUAGE_PACKAGE_MANAGERS.items()
+            if package_manager != "pip"
+            and not __uses_native_scanner(scan_directory_config, origin)
+            and __is_language_present(
+                scan_dir, scan_directory_config, origin, manifests
+            )
+        )
+
+        scan_dir_requirement_files = []
+        if not __uses_native_scanner(scan_directory_config, "Python"):
+            for requirement_file in scan_directory_config.get(
+                "python-pip-included-requirement-files"
+            ) or ["requirements.txt"]:
+                requirement_path = os.path.abspath(
+                    os.path.join(scan_dir, requirement_file)
+                )
+                if os.path.isfile(requirement_path):
+                    scan_dir_requirement_files.append(requirement_path)
+
+        if len(package_managers) == 0 and len(scan_dir_requirement_files) == 0:
+            continue
+
+        working_dirs, requirement_files, indices = groups.setdefault(
+            (scan_directory_config.get("python-version", 3), package_managers),
+            ([], [], []),
+        )
+        working_dirs.append(scan_dir)
+        indices.append(index)
+        requirement_files.extend(scan_dir_requirement_files)
+    return groups
+
+
+def __run_aggregated_check(
+    python_version: Any,
+    package_managers: tuple[str, ...],
+    working_dirs: list[str],
+    requirement_files: list[str],
+    result_cache: Optional[ResultCache] = None,
+    fallback_checks: Optional[
+        list[tuple[Any, tuple[str, Callable[[Any], Any]]]]
+    ] = None,
+) -> dict[str, list[DependencyInfo]]:
+    """Run a single license finder execution for a group of scan directories.
+
+    If the execution fails, e.g. due to conflicting pins in the merged
+    requirement files, the directories are checked one by one instead.
+
+    Args:
+        python_version (Any):
+            The python version of the directories.
+        package_managers (tuple[str, ...]):
+            The package managers to enable for the directories, except pip.
+        working_dirs (list[str]):
+            The directories to scan.
+        requirement_files (list[str]):
+            The requirement files to scan by pip.
+        result_cache (Optional[ResultCache]):
+            The cache of previous results.
+        fallback_checks (Optional[list[tuple[Any, tuple[str, Callable]]]]):
+            The (scan directory config, language check) pairs to run
+            if the aggregated execution fails.
+
+    Returns:
+        dict[str, list[DependencyInfo]]: Maps the origin to the list
+            of found dependencies.
+    """
+    print(
+        f"Try finding {', '.join(package_managers + ('pip',))} package managers "
+        f"in {len(working_dirs)} directories:"
+    )
+    with span(
+        "Aggregated check",
+        "language_check",
+        package_managers=list(package_managers),
+        scan_dirs=len(working_dirs),
+        requirement_files=len(requirement_files),
+    ) as span_args:
+        try:
+            package_manager_to_deps = execute_aggregated_license_finder(
+                working_dirs,
+                requirement_files,
+                python_version=python_version,
+                package_managers=list(package_managers),
+                result_cache=result_cache,
+            )
+        except (OSError, subprocess.CalledProcessError) as err:
+            print(f"Found an issue!: {err}")
+            span_args["error"] = repr(err)
+            package_manager_to_deps = None
+
+    if package_manager_to_deps is None:
+        print(f"Checking the {len(working_dirs)} directories one by one instead")
+        result: dict[str, list[DependencyInfo]] = {}
+        for scan_directory_config, language_check in fallback_checks or []:
+            for origin, deps in __run_language_check(
+                scan_directory_config, language_check
+            ).items():
+                result.setdefault(origin, []).extend(deps)
+        return result
+
+    return {
+        origin: package_manager_to_deps[package_manager]
+        for origin, package_manager in LANGUAGE_PACKAGE_MANAGERS.items()
+        if package_manager in package_manager_to_deps
+    }
+
+
+def get_license_cache_file(cache_dir: str) -> str:
+    """Return the path of the file caching the licenses of workflow actions.
+
+    Args:
+        cache_dir (str): The directory of the persistent result cache.
+
+    Returns:
+        str: The path of the cache file.
+    """
+    return os.path.join(cache_dir, "github-licenses.json")
 
 
 def find_licenses(
     project_root: str,
     scan_directories_config: list[Any],
     github_token: str = None,
-) -> dict[str, list[DependencyInfo]]:
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    github_cache_ttl: Optional[float] = None,
+    github_offline: bool = False,
+    aggregate: bool = False,
+    incremental_base_ref: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    license_cache: Optional[GitHubLicenseCache] = None,
+) -> DependencyStore:
     """Find all licenses used in the software project.
 
+    First, the manifests present in each scan directory are detected, so
+    only the matching languages are checked. Every (scan directory,
+    language) pair is an independent job. The jobs are executed by a pool
+    of workers, but their results are merged in configuration order so
+    the outcome does not depend on scheduling.
+    Dependencies found in several scan directories are merged.
+    The project checks (e.g. Workflows) run concurrently to the scans.
+
+    In aggregated mode, all directories sharing the same settings are
+    scanned by a single license finder execution for all package managers
+    instead. The scan directories of the dependencies found this way are
+    not tracked.
+
+    In incremental mode, only the checks whose input files (manifests,
+    lock files, requirement and decision files, workflows) changed since
+    the base ref are executed. The results of all other checks are taken
+    from the cache. Aggregated checks are always executed.
+
     Args:
         project_root (str):
             The path to the project's root.
@@ -158,14 +695,66 @@ def find_licenses(
             A list of directories to scan and their respective configurations.
         github-token (str):
             GitHub token to do authorized API requests (overcoming rate limiting)
+        max_workers (Optional[int]):
+            Maximum number of jobs executed concurrently. The license
+            finder executions for pip and conan run one at a time anyway.
+            Defaults to the number of CPU cores.
+        cache_dir (Optional[str]):
+            Directory of the persistent result cache. If not set,
+            no results are cached.
+        github_cache_ttl (Optional[float]):
+            Time in seconds for which cached licenses of workflow actions are
+            used without revalidation. Defaults to one day.
+        github_offline (bool):
+            If set to True, licenses of workflow actions are only read from
+            the cache and the GitHub API is not contacted.
+        aggregate (bool):
+            If set to True, the license finder is executed once per group
+            of compatible scan directories instead of once per
+            directory, language and requirement file.
+        incremental_base_ref (Optional[str]):
+            If set, only the checks whose inputs changed since this git ref
+            are executed. Requires the cache directory.
+        executor (Optional[Executor]):
+            Pool executing the jobs, e.g. one kept alive across runs.
+            It is not shut down afterwards. If not given, a pool of
+            max_workers threads is created for this run.
+        license_cache (Optional[GitHubLicenseCache]):
+            Cache of the licenses of workflow actions, e.g. one kept in
+            memory across runs. If not given, it is read from cache_dir.
 
     Returns:
-        dict[str,list[DependencyInfo]]: Dict containing mappings from
-            origin -> list of dependencies. Where origin can be
+        DependencyStore: Store containing mappings from
+            origin -> sorted list of dependencies. Where origin can be
             Python, Github Workflows or other programming/markup languages.
     """
 
-    origin_to_deps: dict[str, list[DependencyInfo]] = {}
+    origin_to_deps = DependencyStore()
+
+    result_cache = None
+    if cache_dir:
+        result_cache = ResultCache(cache_dir)
+        if license_cache is None:
+            license_cache = GitHubLicenseCache(
+                get_license_cache_file(cache_dir),
+                github_cache_ttl if github_cache_ttl is not None else DEFAULT_TTL,
+                github_offline,
+            )
+    elif license_cache is None and github_offline:
+        print("::warning::Offline mode requires a cache directory, ignoring it")
+
+    changed_files: Optional[set[str]] = None
+    if incremental_base_ref and result_cache is None:
+        print("::warning::Incremental mode requires a cache directory, ignoring it")
+    elif incremental_base_ref:
+        try:
+            changed_files = get_changed_files(project_root, incremental_base_ref)
+            print(f"{len(changed_files)} files changed since '{incremental_base_ref}'")
+        except (BadName, GitError, ValueError) as err:
+            print(
+                f"::warning::Unable to diff against '{incremental_base_ref}', "
+                f"scanning everything: {err}"
+            )
 
     language_checks = [
         (
@@ -175,13 +764,19 @@ def find_licenses(
                 config.get("path"),
                 config.get("python-version", 3),
                 config.get("python-pip-included-requirement-files"),
+                result_cache,
+                config.get("python-scanner", "license_finder"),
+                config.get("python-metadata-paths"),
             ),
         ),
         (
             "Rust",
-            lambda config: execute_license_finder(
-                os.path.join(project_root, config.get("path")),
-                package_managers=["cargo"],
+            lambda config: __get_rust_licenses(
+                project_root,
+                config.get("path"),
+                result_cache,
+                config.get("rust-scanner", "license_finder"),
+                config.get("rust-vendor-dir", "vendor"),
             ),
         ),
         # Disable Conan scan - not working yet - enable once fixed
@@ -196,32 +791,154 @@ def find_licenses(
         # ),
         (
             "JavaScript",
-            lambda config: execute_license_finder(
-                os.path.join(project_root, config.get("path")), package_managers=["npm"]
+            lambda config: __get_javascript_licenses(
+                project_root,
+                config.get("path"),
+                result_cache,
+                config.get("javascript-scanner", "license_finder"),
+                config.get("javascript-include-dev-dependencies", True),
             ),
         ),
     ]
 
     project_checks = [
-        ("Workflows", lambda: get_workflow_dependencies(project_root, github_token)),
+        (
+            "Workflows",
+            lambda: get_workflow_dependencies(
+                project_root, github_token, license_cache
+            ),
+        ),
+    ]
+
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+
+    print_step(f"Detecting languages in {len(scan_directories_config)} directories")
+    with phase("Detecting languages"):
+        scan_dir_manifests = [
+            detect_manifests(os.path.join(project_root, scan_directory_config["path"]))
+            for scan_directory_config in scan_directories_config
+        ]
+    scan_dir_languages = [
+        [
+            language_check[0]
+            for language_check in language_checks
+            if __is_language_present(
+                os.path.join(project_root, scan_directory_config["path"]),
+                scan_directory_config,
+                language_check[0],
+                manifests,
+            )
+        ]
+        for scan_directory_config, manifests in zip(
+            scan_directories_config, scan_dir_manifests
+        )
     ]
+    for scan_directory_config, languages in zip(
+        scan_directories_config, scan_dir_languages
+    ):
+        print(
+            f"Detected {', '.join(languages) or 'no known languages'} "
+            f"in '{scan_directory_config['path']}'"
+        )
 
-    for scan_directory_config in scan_directories_config:
-        print_step(f"Scanning '{scan_directory_config['path']}'")
-        for language_check in language_checks:
-            print(f"Try finding {language_check[0]} package managers:")
-
-            try:
-                deps = sort_dependencies(language_check[1](scan_directory_config))
-                if len(deps) > 0:
-                    origin_to_deps[language_check[0]] = deps
-            except Exception as err:
-                print(f"Found an issue!: {err}")
-
-    for project_check in project_checks:
-        print_step(f"Getting dependencies for {project_check[0]}")
-        deps = sort_dependencies(project_check[1]())
-        if len(deps) > 0:
-            origin_to_deps[project_check[0]] = deps
+    print_step(f"Scanning {len(scan_directories_config)} directories")
+    with (
+        contextlib.nullcontext(executor)
+        if executor is not None
+        else ThreadPoolExecutor(max_workers=max_workers)
+    ) as executor:
+        project_jobs = [
+            executor.submit(
+                __run_project_check,
+                project_root,
+                project_check,
+                changed_files,
+                result_cache,
+            )
+            for project_check in project_checks
+        ]
+
+        # each job records its start and end time for the spans of the scan dirs
+        jobs: list[tuple[list[str], list[float], Future]] = []
+
+        def submit(scan_dirs: list[str], function: Callable, *args: Any) -> None:
+            timing: list[float] = []
+            jobs.append(
+                (
+                    scan_dirs,
+                    timing,
+                    executor.submit(__run_timed, timing, function, *args),
+                )
+            )
+
+        if aggregate:
+            for (python_version, package_managers), (
+                working_dirs,
+                requirement_files,
+                indices,
+            ) in __get_aggregation_groups(
+                project_root, scan_directories_config, scan_dir_manifests
+            ).items():
+                # a single execution does not tell which of the dirs brought
+                # in a dependency, so none of them is recorded
+                submit(
+                    [],
+                    __run_aggregated_check,
+                    python_version,
+                    package_managers,
+                    working_dirs,
+                    requirement_files,
+                    result_cache,
+                    [
+                        (scan_directories_config[index], language_check)
+                        for index in indices
+                        for language_check in language_checks
+                        if language_check[0] in scan_dir_languages[index]
+                        and not __uses_native_scanner(
+                            scan_directories_config[index], language_check[0]
+                        )
+                    ],
+                )
+        for scan_directory_config, languages in zip(
+            scan_directories_config, scan_dir_languages
+        ):
+            for language_check in language_checks:
+                if language_check[0] not in languages or (
+                    aggregate
+                    and not __uses_native_scanner(
+                        scan_directory_config, language_check[0]
+                    )
+                ):
+                    continue
+                scan_dirs = [os.path.normpath(scan_directory_config["path"])]
+                if changed_files is None:
+                    submit(
+                        scan_dirs,
+                        __run_language_check,
+                        scan_directory_config,
+                        language_check,
+                    )
+                else:
+                    submit(
+                        scan_dirs,
+                        __run_incremental_language_check,
+                        project_root,
+                        scan_directory_config,
+                        language_check,
+                        changed_files,
+                        result_cache,
+                    )
+
+        # merge in submission order, so the result does not depend on timing
+        for scan_dirs, _, job in jobs:
+            for origin, deps in job.result().items():
+                origin_to_deps.add(origin, deps, scan_dirs)
+        for job in project_jobs:
+            for origin, deps in job.result().items():
+                origin_to_deps.add(origin, deps, [os.curdir])
+
+    if is_tracing_enabled():
+        __add_scan_dir_spans(jobs)
 
     return origin_to_deps
@@ -0,0 +1,245 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Native scanner for the licenses of Rust dependencies.
+
+Reads the packages from Cargo.lock and the license of each crate from its
+Cargo.toml, which is looked up in the local registry sources of cargo
+($CARGO_HOME/registry/src) or in a vendor directory. Works fully offline.
+"""
+
+import glob
+import os
+from typing import Any, Optional
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib  # type: ignore[no-redef]
+
+from licensevalidator.lib.dependency import DependencyInfo
+
+
+def _read_toml(path: str) -> dict[str, Any]:
+    with open(path, "rb") as file:
+        return tomllib.load(file)
+
+
+def parse_cargo_lock(content: str) -> list[dict[str, Any]]:
+    """Parse the packages listed in the contents of a Cargo.lock file.
+
+    Args:
+        content (str): The contents of the Cargo.lock file.
+
+    Returns:
+        list[dict[str, Any]]: The package entries, each having at least
+            a name and a version and, unless it is a local package, a source.
+    """
+    return [
+        package
+        for package in tomllib.loads(content).get("package", [])
+        if "name" in package and "version" in package
+    ]
+
+
+def read_cargo_lock(lock_file_path: str) -> list[dict[str, Any]]:
+    """Read all packages listed in a Cargo.lock file.
+
+    Args:
+        lock_file_path (str): The path of the Cargo.lock file.
+
+    Raises:
+        FileNotFoundError: In case the lock file does not exist.
+
+    Returns:
+        list[dict[str, Any]]: The package entries, see parse_cargo_lock.
+    """
+    with open(lock_file_path, "r", encoding="utf-8") as file:
+        return parse_cargo_lock(file.read())
+
+
+def get_licenses_from_manifest(
+    manifest: dict[str, Any], workspace_manifest: Optional[dict[str, Any]] = None
+) -> list[str]:
+    """Return the licenses declared by a crate manifest.
+
+    Args:
+        manifest (dict[str, Any]): The parsed Cargo.toml of the crate.
+        workspace_manifest (Optional[dict[str, Any]], optional): The parsed
+            Cargo.toml of the workspace, to resolve inherited licenses.
+
+    Returns:
+        list[str]: The declared license expression. Empty if not declared.
+    """
+    license_expression = manifest.get("package", {}).get("license")
+    if isinstance(license_expression, dict) and license_expression.get("workspace"):
+        license_expression = (
+            (workspace_manifest or {})
+            .get("workspace", {})
+            .get("package", {})
+            .get("license")
+        )
+
+    if not isinstance(license_expression, str) or not license_expression.strip():
+        return []
+
+    # "MIT/Apache-2.0" is the deprecated notation of "MIT OR Apache-2.0"
+    return [" OR ".join(part.strip() for part in license_expression.split("/"))]
+
+
+def _get_local_manifests(project_dir: str) -> dict[str, str]:
+    """Return the manifests of the local packages, i.e. the root package
+    and all workspace members.
+
+    Args:
+        project_dir (str): The directory containing the root Cargo.toml.
+
+    Returns:
+        dict[str, str]: Mapping of package name to manifest path.
+    """
+    result: dict[str, str] = {}
+    root_manifest_path = os.path.join(project_dir, "Cargo.toml")
+    if not os.path.isfile(root_manifest_path):
+        return result
+
+    root_manifest = _read_toml(root_manifest_path)
+    manifest_paths = [root_manifest_path]
+    for member_pattern in root_manifest.get("workspace", {}).get("members", []):
+        manifest_paths.extend(
+            sorted(glob.glob(os.path.join(project_dir, member_pattern, "Cargo.toml")))
+        )
+
+    for manifest_path in manifest_paths:
+        name = _read_toml(manifest_path).get("package", {}).get("name")
+        if name is not None:
+            result.setdefault(name, manifest_path)
+    return result
+
+
+def _find_crate_manifest(
+    name: str, version: str, source_dirs: list[str]
+) -> Optional[str]:
+    """Find the manifest of a crate in the given source directories.
+
+    Args:
+        name (str): The name of the crate.
+        version (str): The version of the crate.
+        source_dirs (list[str]): Directories containing unpacked crates,
+            either as "<name>-<version>" or (vendored) as "<name>".
+
+    Returns:
+        Optional[str]: The path of the manifest, if found.
+    """
+    for source_dir in source_dirs:
+        manifest_path = os.path.join(source_dir, f"{name}-{version}", "Cargo.toml")
+        if os.path.isfile(manifest_path):
+            return manifest_path
+
+        manifest_path = os.path.join(source_dir, name, "Cargo.toml")
+        if os.path.isfile(manifest_path):
+            package = _read_toml(manifest_path).get("package", {})
+            if package.get("version") == version:
+                return manifest_path
+    return None
+
+
+def get_cargo_home() -> str:
+    """Return the home directory of cargo.
+
+    Returns:
+        str: The value of CARGO_HOME or its default.
+    """
+    return os.environ.get("CARGO_HOME", os.path.join(os.path.expanduser("~"), ".cargo"))
+
+
+def get_crate_licenses(
+    project_dir: str,
+    packages: list[dict[str, Any]],
+    cargo_home: Optional[str] = None,
+    vendor_dir: str = "vendor",
+) -> list[DependencyInfo]:
+    """Find the licenses of the given Cargo.lock packages.
+
+    Args:
+        project_dir (str): The directory containing Cargo.toml.
+        packages (list[dict[str, Any]]): The package entries of Cargo.lock.
+        cargo_home (Optional[str], optional): The home directory of cargo.
+            Defaults to $CARGO_HOME.
+        vendor_dir (str, optional): The directory (relative to the project)
+            with vendored crates. Defaults to "vendor".
+
+    Returns:
+        list[DependencyInfo]: The packages along with their licenses.
+    """
+    source_dirs = [os.path.join(project_dir, vendor_dir)]
+    source_dirs.extend(
+        sorted(
+            glob.glob(
+                os.path.join(cargo_home or get_cargo_home(), "registry", "src", "*")
+            )
+        )
+    )
+
+    local_manifests = _get_local_manifests(project_dir)
+    workspace_manifest = None
+    if len(local_manifests) > 0:
+        workspace_manifest = _read_toml(os.path.join(project_dir, "Cargo.toml"))
+
+    result = []
+    for package in packages:
+        name = package["name"]
+        version = package["version"]
+
+        if "source" in package:
+            manifest_path = _find_crate_manifest(name, version, source_dirs)
+        else:
+            manifest_path = local_manifests.get(name)
+
+        licenses: list[str] = []
+        if manifest_path is not None:
+            licenses = get_licenses_from_manifest(
+                _read_toml(manifest_path), workspace_manifest
+            )
+        else:
+            print(f"::warning::Sources of crate '{name}' {version} not available")
+
+        result.append(DependencyInfo(name, version, licenses))
+    return result
+
+
+def scan_cargo_dependencies(
+    project_dir: str, cargo_home: Optional[str] = None, vendor_dir: str = "vendor"
+) -> list[DependencyInfo]:
+    """Find all dependencies of a cargo project along with their licenses.
+
+    Args:
+        project_dir (str): The directory containing Cargo.toml and Cargo.lock.
+        cargo_home (Optional[str], optional): The home directory of cargo.
+            Defaults to $CARGO_HOME.
+        vendor_dir (str, optional): The directory (relative to the project)
+            with vendored crates. Defaults to "vendor".
+
+    Raises:
+        FileNotFoundError: In case there is no Cargo.lock.
+
+    Returns:
+        list[DependencyInfo]: The found dependencies, sorted by name and version.
+    """
+    result = get_crate_licenses(
+        project_dir,
+        read_cargo_lock(os.path.join(project_dir, "Cargo.lock")),
+        cargo_home,
+        vendor_dir,
+    )
+    return sorted(result, key=lambda dep: (dep.name.lower(), dep.version.lower()))
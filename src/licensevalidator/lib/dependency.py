@@ -14,34 +14,95 @@
 
 """Contains classes and methods to model dependencies."""
 
+import sys
+from collections.abc import Iterable
+from typing import Union
+
+
+def _intern(value: str) -> str:
+    return sys.intern(value) if type(value) is str else value
+
 
 class DependencyInfo:
-    """Describes a single dependency of a software project."""
+    """Describes a single dependency of a software project.
+
+    Instances are immutable and compact: they have no __dict__, all strings
+    are interned (dependencies share only few distinct licenses and
+    versions) and the hash is computed once.
+    """
+
+    __slots__ = ("name", "version", "licenses", "_hash")
 
-    def __init__(self, name: str, version: str, licenses: list[str]):
+    def __init__(self, name: str, version: str, licenses: Union[Iterable[str], str]):
         """Create a new instance.
 
         Args:
             name (str): Name of the dependency.
             version (str): Version of the dependency.
-            licenses (list[str]): List of license names.
+            licenses (Union[Iterable[str], str]): License names. A single
+                string is treated as a single license.
         """
-        self.name = name
-        self.version = version
-        self.licenses = licenses
+        if isinstance(licenses, str):
+            licenses = (licenses,)
+        licenses = tuple(_intern(license_name) for license_name in licenses)
+        name = _intern(name)
+        version = _intern(version)
+
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "licenses", licenses)
+        object.__setattr__(self, "_hash", hash((name, version, licenses)))
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[tuple[str, str, Iterable[str]]]
+    ) -> list["DependencyInfo"]:
+        """Create dependencies from parsed rows.
+
+        Args:
+            rows (Iterable[tuple[str, str, Iterable[str]]]): Rows of
+                name, version and license names.
+
+        Returns:
+            list[DependencyInfo]: One dependency per row.
+        """
+        return [cls(name, version, licenses) for name, version, licenses in rows]
+
+    def with_licenses(self, licenses: Iterable[str]) -> "DependencyInfo":
+        """Return a copy of this dependency having the given licenses.
+
+        Args:
+            licenses (Iterable[str]): The license names of the copy.
+
+        Returns:
+            DependencyInfo: The new dependency.
+        """
+        return DependencyInfo(self.name, self.version, licenses)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (DependencyInfo, (self.name, self.version, self.licenses))
 
     def __repr__(self) -> str:
-        return f"DependencyInfo({self.name}, {self.version}, {self.licenses.__str__()})"
+        return f"DependencyInfo({self.name}, {self.version}, {list(self.licenses)})"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, DependencyInfo):
             return False
 
         return (
-            self.name == other.name
+            self._hash == other._hash
+            and self.name == other.name
             and self.version == other.version
             and self.licenses == other.licenses
         )
 
     def __hash__(self) -> int:
-        return hash(self.__repr__())
+        return self._hash
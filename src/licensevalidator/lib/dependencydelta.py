@@ -0,0 +1,268 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Computes the difference of the locked dependencies between two revisions.
+
+The lock files (Cargo.lock, package-lock.json, pinned requirement files)
+of both revisions are read from git objects, so no checkout is needed.
+Licenses are only looked up for the dependencies new in the head revision.
+
+Requirement files are treated like lock files: every requirement must be
+pinned and transitive dependencies are only considered if they are listed,
+e.g. as generated by pip-compile.
+"""
+
+import io
+import os
+import posixpath
+from typing import Any, Callable, Optional
+
+from git import Repo
+from git.objects import Tree
+
+from licensevalidator.lib.cargoscanner import get_crate_licenses, parse_cargo_lock
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.dependencystore import DependencyStore
+from licensevalidator.lib.npmscanner import (
+    get_dependency_from_lock_entry,
+    get_package_name,
+    is_relevant_lock_entry,
+    iter_package_lock_entries,
+)
+from licensevalidator.lib.pipscanner import (
+    MetadataIndex,
+    get_licenses_from_metadata,
+    normalize_name,
+    read_requirements,
+)
+
+# maps (origin, name, version) to whatever is needed to look up its license
+_LockedPackages = dict[tuple[str, str, str], Any]
+
+
+class DependencyDelta:
+    """Difference of the locked dependencies between two revisions."""
+
+    def __init__(self):
+        """Create a new, empty instance."""
+        # dependencies not present in the base revision at all
+        self.added = DependencyStore()
+        # new versions of dependencies present in the base revision
+        self.changed = DependencyStore()
+        # dependencies not present in the head revision anymore
+        self.removed = DependencyStore()
+        # maps (origin, name) of changed dependencies to their base versions
+        self.previous_versions: dict[tuple[str, str], list[str]] = {}
+
+    def get_new_dependencies(self) -> DependencyStore:
+        """Return the added dependencies and the new versions of changed ones.
+
+        Returns:
+            DependencyStore: The dependencies whose licenses need to be checked.
+        """
+        result = DependencyStore()
+        for store in (self.added, self.changed):
+            for origin, dep_infos in store.items():
+                result.add(origin, dep_infos)
+        return result
+
+
+def _read_blob(tree: Tree, path: str) -> Optional[bytes]:
+    try:
+        return tree.join(posixpath.normpath(path)).data_stream.read()
+    except KeyError:
+        return None
+
+
+def _read_locked_packages(
+    tree: Tree, scan_directory_config: Any, project_root: str
+) -> _LockedPackages:
+    """Read the locked packages of a scan directory from a git tree.
+
+    Args:
+        tree (Tree): The root tree of the revision.
+        scan_directory_config (Any): The configuration of the directory.
+        project_root (str): The path to the project's root.
+
+    Returns:
+        _LockedPackages: The locked packages of all languages.
+    """
+    scan_dir = posixpath.normpath(scan_directory_config["path"].replace(os.sep, "/"))
+    project_dir = os.path.join(project_root, scan_dir)
+    result: _LockedPackages = {}
+
+    content = _read_blob(tree, posixpath.join(scan_dir, "Cargo.lock"))
+    if content is not None:
+        for package in parse_cargo_lock(content.decode("utf-8")):
+            result[("Rust", package["name"], package["version"])] = package
+
+    content = _read_blob(tree, posixpath.join(scan_dir, "npm-shrinkwrap.json"))
+    if content is None:
+        content = _read_blob(tree, posixpath.join(scan_dir, "package-lock.json"))
+    if content is not None:
+        include_dev_dependencies = scan_directory_config.get(
+            "javascript-include-dev-dependencies", True
+        )
+        for package_path, entry in iter_package_lock_entries(
+            io.StringIO(content.decode("utf-8"))
+        ):
+            if is_relevant_lock_entry(package_path, entry, include_dev_dependencies):
+                name = get_package_name(project_dir, package_path, entry)
+                result.setdefault(
+                    ("JavaScript", name, entry.get("version", "")),
+                    (package_path, entry),
+                )
+
+    def read_file(path: str) -> str:
+        blob = _read_blob(tree, path)
+        if blob is None:
+            raise FileNotFoundError(path)
+        return blob.decode("utf-8")
+
+    for requirement_file in scan_directory_config.get(
+        "python-pip-included-requirement-files"
+    ) or ["requirements.txt"]:
+        try:
+            requirements = read_requirements(
+                posixpath.join(scan_dir, requirement_file), read_file
+            )
+        except FileNotFoundError:
+            continue
+        for requirement in requirements:
+            if requirement.version is None:
+                # a different version could be installed without any change
+                raise ValueError(
+                    f"Requirement '{requirement.name}' of '{requirement_file}' "
+                    "is not pinned, delta mode requires pinned requirement files"
+                )
+            result.setdefault(
+                ("Python", normalize_name(requirement.name), requirement.version),
+                requirement,
+            )
+
+    return result
+
+
+def _get_license_lookups(
+    project_root: str, scan_directory_config: Any
+) -> dict[str, Callable[[str, str, Any], DependencyInfo]]:
+    """Return the functions to look up the license of a new dependency
+    per origin, using the metadata present in the working tree."""
+    project_dir = os.path.join(project_root, scan_directory_config["path"])
+    metadata_index: Optional[MetadataIndex] = None
+
+    def get_python_dependency(name: str, version: str, requirement: Any):
+        # the index is only built if there are new Python dependencies
+        nonlocal metadata_index
+        if metadata_index is None:
+            metadata_paths = scan_directory_config.get("python-metadata-paths")
+            if metadata_paths is None:
+                # the packages of the running interpreter are unrelated
+                raise ValueError(
+                    f"New Python dependencies in '{scan_directory_config['path']}' "
+                    "require 'python-metadata-paths' in delta mode"
+                )
+            metadata_index = MetadataIndex(
+                [os.path.join(project_dir, path) for path in metadata_paths]
+            )
+        metadata = metadata_index.find(name, version or None)
+        if metadata is None:
+            return DependencyInfo(requirement.name, version, [])
+        return DependencyInfo(
+            metadata["Name"], metadata["Version"], get_licenses_from_metadata(metadata)
+        )
+
+    return {
+        "Rust": lambda name, version, package: get_crate_licenses(
+            project_dir,
+            [package],
+            vendor_dir=scan_directory_config.get("rust-vendor-dir", "vendor"),
+        )[0],
+        "JavaScript": lambda name, version, lock_entry: get_dependency_from_lock_entry(
+            project_dir, *lock_entry
+        ),
+        "Python": get_python_dependency,
+    }
+
+
+def get_dependency_delta(
+    project_root: str,
+    scan_directories_config: list[Any],
+    base_ref: str,
+    head_ref: str = "HEAD",
+) -> DependencyDelta:
+    """Compute the difference of the locked dependencies between two revisions.
+
+    Only dependencies pinned in lock files or requirement files are
+    considered, unpinned requirements are refused. The licenses of the new
+    dependencies are looked up from the metadata present in the working tree
+    (crate sources, node_modules or package json of the lock entry, Python
+    package metadata in the configured python-metadata-paths).
+
+    Args:
+        project_root (str):
+            The path to the project's root, which must be a git repository.
+        scan_directories_config (list[Any]):
+            A list of directories to scan and their respective configurations.
+        base_ref (str):
+            The base revision, e.g. the base SHA of a PR.
+        head_ref (str):
+            The head revision. Defaults to "HEAD".
+
+    Raises:
+        git.BadName: In case a ref is unknown.
+        ValueError: In case a requirement file is not fully pinned or
+            python-metadata-paths is missing for new Python dependencies.
+
+    Returns:
+        DependencyDelta: The added, changed and removed dependencies.
+    """
+    repo = Repo(project_root)
+    repo.git.update_environment(
+        GIT_CONFIG_COUNT="1",
+        GIT_CONFIG_KEY_0="safe.directory",
+        GIT_CONFIG_VALUE_0=os.path.abspath(project_root),
+    )
+    base_tree = repo.commit(base_ref).tree
+    head_tree = repo.commit(head_ref).tree
+
+    result = DependencyDelta()
+    for scan_directory_config in scan_directories_config:
+        scan_dir = os.path.normpath(scan_directory_config["path"])
+        base = _read_locked_packages(base_tree, scan_directory_config, project_root)
+        head = _read_locked_packages(head_tree, scan_directory_config, project_root)
+        base_names: dict[tuple[str, str], list[str]] = {}
+        for origin, name, version in base:
+            base_names.setdefault((origin, name), []).append(version)
+        head_names = {(origin, name) for origin, name, _ in head}
+
+        lookups = _get_license_lookups(project_root, scan_directory_config)
+        for key in sorted(head.keys() - base.keys()):
+            origin, name, version = key
+            dep_info = lookups[origin](name, version, head[key])
+            if (origin, name) in base_names:
+                result.changed.add(origin, [dep_info], [scan_dir])
+                result.previous_versions[(origin, name)] = sorted(
+                    base_names[(origin, name)]
+                )
+            else:
+                result.added.add(origin, [dep_info], [scan_dir])
+
+        for origin, name, version in sorted(base.keys() - head.keys()):
+            if (origin, name) not in head_names:
+                result.removed.add(
+                    origin, [DependencyInfo(name, version, [])], [scan_dir]
+                )
+
+    return result
@@ -0,0 +1,123 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Indexed store for the dependencies found in all scan directories."""
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Optional
+
+from licensevalidator.lib.dependency import DependencyInfo
+
+
+def get_sort_key(dep_info: DependencyInfo) -> tuple[str, str]:
+    """Return the key to sort dependencies by name 1st and version 2nd.
+
+    Args:
+        dep_info (DependencyInfo): The dependency.
+
+    Returns:
+        tuple[str, str]: The case insensitive name and version.
+    """
+    return (dep_info.name.lower(), dep_info.version.lower())
+
+
+class DependencyStore(Mapping[str, list[DependencyInfo]]):
+    """Dependencies of all scan directories, indexed by (origin, name, version).
+
+    The same dependency found in several scan directories is only stored
+    once, with the licenses of all findings merged. As a mapping, the store
+    maps each origin to its dependencies sorted by name and version.
+    Origins are kept in the order in which they were added first.
+    The returned lists are shared and must not be modified.
+    """
+
+    def __init__(self):
+        """Create a new, empty instance."""
+        self.__dependencies: dict[str, dict[tuple[str, str], DependencyInfo]] = {}
+        self.__scan_dirs: dict[tuple[str, str, str], set[str]] = {}
+        self.__sorted: dict[str, list[DependencyInfo]] = {}
+
+    def add(
+        self,
+        origin: str,
+        dependencies: Iterable[DependencyInfo],
+        scan_dirs: Iterable[str] = (),
+    ) -> None:
+        """Add the dependencies found for an origin.
+
+        Args:
+            origin (str): The origin of the dependencies, e.g. "Python".
+            dependencies (Iterable[DependencyInfo]): The found dependencies.
+            scan_dirs (Iterable[str], optional): The scan directories
+                which brought in the dependencies.
+        """
+        scan_dirs = tuple(scan_dirs)
+        for dep_info in dependencies:
+            origin_dependencies = self.__dependencies.setdefault(origin, {})
+            key = (dep_info.name, dep_info.version)
+            known = origin_dependencies.get(key)
+            if known is None:
+                origin_dependencies[key] = dep_info
+            elif known.licenses != dep_info.licenses:
+                origin_dependencies[key] = known.with_licenses(
+                    known.licenses
+                    + tuple(
+                        license_name
+                        for license_name in dep_info.licenses
+                        if license_name not in known.licenses
+                    )
+                )
+            self.__scan_dirs.setdefault((origin, *key), set()).update(scan_dirs)
+            self.__sorted.pop(origin, None)
+
+    def get_dependency(
+        self, origin: str, name: str, version: str
+    ) -> Optional[DependencyInfo]:
+        """Look up a single dependency.
+
+        Args:
+            origin (str): The origin of the dependency.
+            name (str): The name of the dependency.
+            version (str): The version of the dependency.
+
+        Returns:
+            Optional[DependencyInfo]: The dependency, if found.
+        """
+        return self.__dependencies.get(origin, {}).get((name, version))
+
+    def get_scan_dirs(self, origin: str, name: str, version: str) -> list[str]:
+        """Return the scan directories which brought in a dependency.
+
+        Args:
+            origin (str): The origin of the dependency.
+            name (str): The name of the dependency.
+            version (str): The version of the dependency.
+
+        Returns:
+            list[str]: The sorted scan directories.
+        """
+        return sorted(self.__scan_dirs.get((origin, name, version), ()))
+
+    def __getitem__(self, origin: str) -> list[DependencyInfo]:
+        result = self.__sorted.get(origin)
+        if result is None:
+            result = sorted(self.__dependencies[origin].values(), key=get_sort_key)
+            self.__sorted[origin] = result
+        return result
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dependencies)
+
+    def __len__(self) -> int:
+        return len(self.__dependencies)
@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent cache for the licenses of GitHub repositories."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Optional
+
+# default time in seconds after which a cached license is revalidated
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class GitHubLicenseCache:
+    """Disk backed cache mapping GitHub repositories to their license.
+
+    Along with the license, the validators (ETag, Last-Modified) of the
+    response are stored, so expired entries can be revalidated with a
+    conditional request.
+    """
+
+    def __init__(self, cache_file: str, ttl: float = DEFAULT_TTL, offline=False):
+        """Create a new instance and load the cache file, if present.
+
+        Args:
+            cache_file (str): The path of the file backing the cache.
+            ttl (float, optional): Time in seconds for which an entry is
+                used without revalidation. Defaults to one day.
+            offline (bool, optional): If set to True, only cached entries
+                are used and no requests shall be done. Defaults to False.
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.offline = offline
+        self.__lock = threading.Lock()
+        self.__entries: dict[str, dict[str, Any]] = {}
+
+        try:
+            with open(cache_file, "r", encoding="utf-8") as file:
+                self.__entries = json.load(file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as err:
+            print(f"::warning::Ignoring unreadable cache file '{cache_file}': {err}")
+
+    def get(self, repository: str) -> Optional[dict[str, Any]]:
+        """Return the cache entry of the given repository.
+
+        Args:
+            repository (str): The repository name.
+
+        Returns:
+            Optional[dict[str, Any]]: The entry, if present.
+        """
+        with self.__lock:
+            return self.__entries.get(repository)
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        """Return True if the entry can be used without revalidation.
+
+        Args:
+            entry (dict[str, Any]): The cache entry.
+        """
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def get_conditional_headers(self, entry: Optional[dict[str, Any]]) -> dict:
+        """Return the request headers to revalidate the given entry.
+
+        Args:
+            entry (Optional[dict[str, Any]]): The cache entry, if any.
+
+        Returns:
+            dict: The If-None-Match/If-Modified-Since headers.
+        """
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(
+        self,
+        repository: str,
+        license_name: Optional[str],
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """Store the license of the given repository.
+
+        Args:
+            repository (str): The repository name.
+            license_name (Optional[str]): The name of its license.
+            etag (Optional[str]): The ETag header of the response.
+            last_modified (Optional[str]): The Last-Modified header
+                of the response.
+        """
+        with self.__lock:
+            self.__entries[repository] = {
+                "license": license_name,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+            }
+
+    def touch(self, repository: str) -> None:
+        """Mark the entry of the given repository as just revalidated.
+
+        Args:
+            repository (str): The repository name.
+        """
+        with self.__lock:
+            if repository in self.__entries:
+                self.__entries[repository]["fetched_at"] = time.time()
+
+    def save(self) -> None:
+        """Write the cache to its backing file."""
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_file))
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with self.__lock:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    json.dump(self.__entries, file, indent=2, sort_keys=True)
+                os.replace(temp_path, self.cache_file)
+            except OSError as err:
+                print(f"::warning::Unable to write cache file: {err}")
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
@@ -0,0 +1,238 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Methods to find out which inputs of a scan changed since a git ref."""
+
+import hashlib
+import os
+import platform
+from typing import Any
+
+from git import Repo
+
+from licensevalidator.lib import cargoscanner, npmscanner, pipscanner
+from licensevalidator.lib.licensefinder import (
+    DEFAULT_DECISIONS_FILE,
+    _get_requirement_files,
+    get_license_finder_version,
+)
+from licensevalidator.lib.resultcache import compute_key, hash_file
+
+WORKFLOWS_DIR = os.path.join(".github", "workflows")
+
+
+def get_changed_files(repo_root: str, base_ref: str) -> set[str]:
+    """Return all files which differ between a git ref and the working tree.
+
+    Args:
+        repo_root (str): The path to the root of the repository.
+        base_ref (str): The ref to compare to, e.g. the base SHA of a PR.
+
+    Raises:
+        git.BadName: In case the ref is unknown, e.g. in a shallow clone.
+        git.GitError: In case git fails.
+        ValueError: In case the ref does not point to a commit.
+
+    Returns:
+        set[str]: The paths (relative to the repository root, using "/")
+            of all added, removed, modified and untracked files.
+    """
+    repo = Repo(repo_root)
+    # the workspace of an action is owned by another user,
+    # so mark it as safe for this process only
+    repo.git.update_environment(
+        GIT_CONFIG_COUNT="1",
+        GIT_CONFIG_KEY_0="safe.directory",
+        GIT_CONFIG_VALUE_0=os.path.abspath(repo_root),
+    )
+
+    result: set[str] = set()
+    for diff in repo.commit(base_ref).diff(None):
+        result.update(path for path in (diff.a_path, diff.b_path) if path)
+    result.update(repo.untracked_files)
+    return result
+
+
+def get_blob_id(path: str) -> str:
+    """Return the git blob id of the file at the given path.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        str: The blob id or "missing" if there is no such file.
+    """
+    if not os.path.isfile(path):
+        return "missing"
+    with open(path, "rb") as file:
+        content = file.read()
+    return hashlib.sha1(
+        b"blob %d\0" % len(content) + content, usedforsecurity=False
+    ).hexdigest()
+
+
+def get_scan_dir_input_files(
+    project_root: str,
+    scan_directory_config: Any,
+    manifest_files: frozenset[str],
+) -> list[str]:
+    """Return all files which influence the result of scanning a directory,
+    including the package metadata read from its python-metadata-paths.
+
+    Args:
+        project_root (str): The path to the project's root.
+        scan_directory_config (Any): The configuration of the directory.
+        manifest_files (frozenset[str]): The names of all known manifest
+            and lock files, which are considered whether present or not.
+
+    Returns:
+        list[str]: The paths of the input files, relative to the project root.
+    """
+    scan_dir = os.path.join(project_root, scan_directory_config["path"])
+    input_files = [os.path.join(scan_dir, name) for name in sorted(manifest_files)]
+    for requirement_file in scan_directory_config.get(
+        "python-pip-included-requirement-files"
+    ) or ["requirements.txt"]:
+        input_files.extend(
+            _get_requirement_files(os.path.join(scan_dir, requirement_file))
+        )
+    if scan_directory_config.get("decision-file"):
+        input_files.append(
+            os.path.join(scan_dir, scan_directory_config["decision-file"])
+        )
+    if scan_directory_config.get("python-metadata-paths"):
+        input_files.extend(
+            pipscanner.get_metadata_files(
+                [
+                    os.path.join(scan_dir, metadata_path)
+                    for metadata_path in scan_directory_config["python-metadata-paths"]
+                ]
+            )
+        )
+    return sorted({os.path.relpath(path, project_root) for path in input_files})
+
+
+def get_unpinned_requirements(
+    project_root: str, scan_directory_config: Any
+) -> list[str]:
+    """Return the names of the requirements of a directory which are not pinned.
+
+    Results depending on them must not be reused, as pip may resolve other
+    versions for them without any change of the inputs.
+
+    Args:
+        project_root (str): The path to the project's root.
+        scan_directory_config (Any): The configuration of the directory.
+
+    Returns:
+        list[str]: The sorted names of all requirements without a pinned version.
+    """
+    scan_dir = os.path.join(project_root, scan_directory_config["path"])
+    result: set[str] = set()
+    for requirement_file in scan_directory_config.get(
+        "python-pip-included-requirement-files"
+    ) or ["requirements.txt"]:
+        result.update(
+            pipscanner.get_unpinned_requirements(
+                os.path.join(scan_dir, requirement_file)
+            )
+        )
+    return sorted(result)
+
+
+def is_any_changed(paths: list[str], changed_files: set[str]) -> bool:
+    """Return True if any of the given files or directories changed.
+
+    Args:
+        paths (list[str]): Paths of files or directories, relative to the
+            repository root.
+        changed_files (set[str]): The changed files as returned by
+            get_changed_files.
+    """
+    prefixes = tuple(path.replace(os.sep, "/") for path in paths)
+    return any(
+        changed_file == prefix or changed_file.startswith(f"{prefix}/")
+        for changed_file in changed_files
+        for prefix in prefixes
+    )
+
+
+def get_tool_versions() -> dict[str, Any]:
+    """Return the versions of the tools which find the dependencies.
+
+    Besides the input files, the result of a scan depends on the license
+    finder, its bundled default decisions, the Python interpreter and the
+    implementation of the native scanners.
+
+    Returns:
+        dict[str, Any]: The versions, or the hashes of the files
+            making up a tool.
+    """
+    return {
+        "license_finder": get_license_finder_version(),
+        "default_decisions": hash_file(DEFAULT_DECISIONS_FILE),
+        "python": platform.python_version(),
+        "native_scanners": {
+            module.__name__.rsplit(".", 1)[-1]: hash_file(module.__file__)
+            for module in (cargoscanner, npmscanner, pipscanner)
+        },
+    }
+
+
+def get_incremental_key(
+    project_root: str, origin: str, scan_dir: str, config: Any, input_files: list[str]
+) -> str:
+    """Return the key of a result which only depends on the given input files
+    and the versions of the tools, see get_tool_versions.
+
+    Args:
+        project_root (str): The path to the project's root.
+        origin (str): The origin of the result.
+        scan_dir (str): The scanned directory, relative to the project root.
+        config (Any): The configuration of the scan.
+        input_files (list[str]): The input files, relative to the project root.
+
+    Returns:
+        str: The cache key.
+    """
+    return compute_key(
+        {
+            "incremental": origin,
+            "scan_dir": os.path.normpath(scan_dir),
+            "config": config,
+            "tools": get_tool_versions(),
+            "input_files": {
+                path: get_blob_id(os.path.join(project_root, path))
+                for path in input_files
+            },
+        }
+    )
+
+
+def get_workflow_input_files(project_root: str) -> list[str]:
+    """Return all workflow files of the project.
+
+    Args:
+        project_root (str): The path to the project's root.
+
+    Returns:
+        list[str]: The paths of the workflow files, relative to the project root.
+    """
+    result = []
+    for dir_path, _, file_names in os.walk(os.path.join(project_root, WORKFLOWS_DIR)):
+        result.extend(
+            os.path.relpath(os.path.join(dir_path, file_name), project_root)
+            for file_name in file_names
+        )
+    return sorted(result)
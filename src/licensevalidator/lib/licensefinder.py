@@ -14,11 +14,75 @@
 
 """Wrapper to execute pivotal license finder and return its result."""
 
+import contextlib
 import csv
+import functools
 import os
+import platform
+import re
 import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Optional
 
 from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.metrics import increment
+from licensevalidator.lib.pipscanner import get_unpinned_requirements
+from licensevalidator.lib.resultcache import ResultCache, compute_key, hash_file
+from licensevalidator.lib.tracing import span
+
+DEFAULT_DECISIONS_FILE = "/dependency_decisions_overwrites.yml"
+
+# manifest and lock files evaluated by the individual package managers
+MANIFEST_FILES = {
+    "pip": [],
+    "cargo": ["Cargo.toml", "Cargo.lock"],
+    "npm": ["package.json", "package-lock.json", "npm-shrinkwrap.json"],
+    "conan": ["conanfile.txt", "conanfile.py", "conan.lock"],
+}
+
+
+# name of the merged requirements file used by aggregated executions
+MERGED_REQUIREMENTS_FILE_NAME = "merged-requirements.txt"
+
+# package managers which --prepare by installing into the interpreter
+# shared by all executions, so they must not run concurrently
+SHARED_INSTALL_PACKAGE_MANAGERS = frozenset({"pip", "conan"})
+
+_shared_install_lock = threading.Lock()
+
+
+def __iter_output_rows(path: str, field_count: int) -> Iterator[list[str]]:
+    """Iterate over the rows of the output generated by pivotal license finder.
+
+    Rows are parsed one by one, so the output is never fully held in memory.
+
+    Args:
+        path (str): The path to the output file.
+        field_count (int): The expected number of fields per row.
+
+    Yields:
+        list[str]: The valid rows contained in the output file.
+    """
+    if not os.path.isfile(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as csvfile:
+        csvreader = csv.reader(csvfile, skipinitialspace=True)
+        for row in csvreader:
+            if len(row) != field_count:
+                print(
+                    f'Invalid entry in file "{path}", '
+                    f'expected exactly {field_count} fields! Found "{row}"'
+                )
+                continue
+            yield row
+
+
+def __to_license_names(license_column: str) -> list[str]:
+    return [license_name.strip() for license_name in license_column.split(",")]
 
 
 def __read_output_file(path: str) -> list[DependencyInfo]:
@@ -31,69 +95,433 @@ def __read_output_file(path: str) -> list[DependencyInfo]:
         list[DependencyInfo]: The list of dependencies
             contained in the output file.
     """
-    result = []
+    return DependencyInfo.from_rows(
+        (row[0], row[1], __to_license_names(row[2]))
+        for row in __iter_output_rows(path, 3)
+    )
 
-    if os.path.isfile(path):
-        with open(path, "r", encoding="utf-8") as csvfile:
-            csvreader = csv.reader(csvfile, skipinitialspace=True)
-            for row in csvreader:
-                if len(row) != 3:
-                    print(
-                        f'Invalid entry in file "{path}", '
-                        'expected exactly 3 fields! Found "{row}"'
-                    )
-                    continue
 
-                dep_name = row[0]
-                version = row[1]
-                licenses = [license_name.strip() for license_name in row[2].split(",")]
-                result.append(DependencyInfo(dep_name, version, licenses))
+def __get_prepare_lock(
+    package_managers: Optional[list[str]],
+) -> contextlib.AbstractContextManager:
+    """Return the lock to hold while preparing the given package managers.
+
+    Args:
+        package_managers (Optional[list[str]]): The enabled package
+            managers. None if all of them are enabled.
+
+    Returns:
+        contextlib.AbstractContextManager: The shared install lock if any
+            of the package managers installs into the shared interpreter,
+            otherwise a context doing nothing.
+    """
+    if package_managers is None or not SHARED_INSTALL_PACKAGE_MANAGERS.isdisjoint(
+        package_managers
+    ):
+        return _shared_install_lock
+    return contextlib.nullcontext()
+
+
+def __run_license_finder(
+    process_args: list[str],
+    package_managers: Optional[list[str]] = None,
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """Run the license finder, recording a span and the subprocess metrics.
+
+    Executions preparing pip or conan are serialized, as they install into
+    the same site-packages. All other executions run side by side.
+
+    Args:
+        process_args (list[str]): The command line of the license finder.
+        package_managers (Optional[list[str]]): The enabled package
+            managers. Defaults to all of them.
+        **kwargs (Any): Further arguments passed to subprocess.run.
+
+    Raises:
+        subprocess.CalledProcessError: In case of a non-zero exit code.
+
+    Returns:
+        subprocess.CompletedProcess: The completed process.
+    """
+    with __get_prepare_lock(package_managers):
+        start = time.perf_counter()
+        with span(
+            "license_finder",
+            "subprocess",
+            argv=process_args,
+            cwd=kwargs.get("cwd", os.curdir),
+        ) as span_args:
+            try:
+                process = subprocess.run(process_args, check=True, **kwargs)
+            except subprocess.CalledProcessError as err:
+                span_args["exit_code"] = err.returncode
+                raise
+            finally:
+                increment("subprocess.count")
+                increment("subprocess.seconds", time.perf_counter() - start)
+            span_args["exit_code"] = 0
+    return process
+
+
+@functools.lru_cache(maxsize=None)
+def get_license_finder_version() -> str:
+    """Return the version of the installed pivotal license finder.
+
+    Returns:
+        str: The version string or "unknown" if it could not be determined.
+    """
+    try:
+        process = __run_license_finder(
+            ["license_finder", "version"], [], capture_output=True, encoding="utf-8"
+        )
+        return process.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _get_requirement_files(requirements_path: str) -> list[str]:
+    """Return the requirements file and all files it includes via -r or -c.
+
+    Args:
+        requirements_path (str): The path of the requirements file.
+
+    Returns:
+        list[str]: The paths of all involved requirement files.
+    """
+    result: list[str] = []
+    pending = [requirements_path]
+    while pending:
+        path = os.path.normpath(pending.pop())
+        if path in result:
+            continue
+        result.append(path)
+        if not os.path.isfile(path):
+            continue
+
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                match = re.match(
+                    r"^\s*(?:-r|--requirement|-c|--constraint)[\s=]+(\S+)", line
+                )
+                if match:
+                    pending.append(os.path.join(os.path.dirname(path), match[1]))
 
     return result
 
 
+def get_cache_key(working_dir: str, **kwargs) -> str:
+    """Compute the result cache key for a license finder execution.
+
+    The key covers the manifest and lock files of all enabled package
+    managers, the decisions file, the python version, the enabled package
+    managers and the version of the license finder.
+
+    Args:
+        working_dir (str):
+            The directory in which the license finder would be executed.
+
+    Returns:
+        str: The cache key.
+    """
+    package_managers = kwargs.get("package_managers", list(MANIFEST_FILES.keys()))
+
+    manifest_paths: list[str] = []
+    for package_manager in package_managers:
+        if package_manager == "pip":
+            manifest_paths.extend(
+                _get_requirement_files(
+                    os.path.join(
+                        working_dir,
+                        kwargs.get("pip_requirements_path", "requirements.txt"),
+                    )
+                )
+            )
+        else:
+            manifest_paths.extend(
+                os.path.join(working_dir, file_name)
+                for file_name in MANIFEST_FILES.get(package_manager, [])
+            )
+
+    decisions_file = kwargs.get("decisions_file", DEFAULT_DECISIONS_FILE)
+
+    return compute_key(
+        {
+            "manifests": {
+                os.path.relpath(path, working_dir): hash_file(path)
+                for path in manifest_paths
+            },
+            "decisions_file": hash_file(os.path.join(working_dir, decisions_file)),
+            "python_version": [
+                kwargs.get("python_version"),
+                platform.python_version(),
+            ],
+            "package_managers": sorted(package_managers),
+            "license_finder_version": get_license_finder_version(),
+        }
+    )
+
+
+def __get_uncacheable_reason(requirements_paths: list[str]) -> Optional[str]:
+    """Return why a result depending on the given requirement files must not
+    be cached, or None if it may be cached.
+
+    pip resolves unpinned requirements anew on each execution, e.g. picking
+    up a new release with another license, without any change of the files
+    the cache key is derived from.
+
+    Args:
+        requirements_paths (list[str]): The paths of the requirement files.
+    """
+    unpinned = sorted(
+        {
+            name
+            for requirements_path in requirements_paths
+            for name in get_unpinned_requirements(requirements_path)
+        }
+    )
+    if len(unpinned) == 0:
+        return None
+    return f"the requirements {', '.join(unpinned)} are not pinned"
+
+
 def execute_license_finder(working_dir: str, **kwargs) -> list[DependencyInfo]:
     """Execute pivotal license finder and returns the result.
 
     Args:
         working_dir (str):
             The path to where the python requirements files are stored.
+        result_cache (Optional[ResultCache]):
+            If given, the result is looked up in and stored to this cache.
+            A cache hit skips the execution of the license finder entirely.
+            The cache is not used if pip scans unpinned requirements.
 
     Returns:
         list[DependencyInfo]: All found dependencies of the license finder.
     """
     result = []
 
-    process_args = [
-        "license_finder",
-        "report",
-        "--save=/tmp/license-finder/dependencies-notice",
-        "--prepare",
+    result_cache: Optional[ResultCache] = kwargs.get("result_cache")
+    if result_cache is not None and "pip" in kwargs.get(
+        "package_managers", MANIFEST_FILES.keys()
+    ):
+        reason = __get_uncacheable_reason(
+            [
+                os.path.join(
+                    working_dir, kwargs.get("pip_requirements_path", "requirements.txt")
+                )
+            ]
+        )
+        if reason is not None:
+            print(
+                f"Not caching the license finder result for '{working_dir}': {reason}"
+            )
+            result_cache = None
+    cache_key = None
+    if result_cache is not None:
+        cache_key = get_cache_key(working_dir, **kwargs)
+        cached_result = result_cache.get(cache_key)
+        if cached_result is not None:
+            print(f"Using cached license finder result for '{working_dir}'")
+            return cached_result
+
+    # every invocation gets its own output directory so that several
+    # license finder processes can run side by side
+    with tempfile.TemporaryDirectory(prefix="license-finder-") as output_dir:
+        output_file_path = os.path.join(output_dir, "dependencies-notice")
+
+        process_args = [
+            "license_finder",
+            "report",
+            f"--save={output_file_path}",
+            "--prepare",
+        ]
+
+        python_version_key = "python_version"
+        if python_version_key in kwargs:
+            process_args.append(f"--python-version={kwargs[python_version_key]}")
+
+        decision_file_key = "decisions_file"
+        if decision_file_key in kwargs:
+            process_args.append(f"--decisions_file={kwargs[decision_file_key]}")
+        else:
+            process_args.append(f"--decisions_file={DEFAULT_DECISIONS_FILE}")
+
+        package_managers_key = "package_managers"
+        if package_managers_key in kwargs:
+            package_managers_list = " ".join(kwargs.get(package_managers_key))
+            process_args.append(f"--enabled-package-managers={package_managers_list}")
+
+        pip_requirements_path_key = "pip_requirements_path"
+        if pip_requirements_path_key in kwargs:
+            process_args.append(
+                f"--pip-requirements-path={kwargs[pip_requirements_path_key]}"
+            )
+
+        __run_license_finder(
+            process_args, kwargs.get(package_managers_key), cwd=working_dir
+        )
+
+        result.extend(__read_output_file(output_file_path))
+
+    if result_cache is not None and cache_key is not None:
+        result_cache.put(cache_key, result)
+
+    return result
+
+
+def get_aggregated_cache_key(
+    working_dirs: list[str], requirement_files: list[str], **kwargs
+) -> str:
+    """Compute the result cache key for an aggregated license finder execution.
+
+    Args:
+        working_dirs (list[str]):
+            The directories scanned by the enabled package managers.
+        requirement_files (list[str]):
+            The requirement files scanned by pip.
+
+    Returns:
+        str: The cache key.
+    """
+    return compute_key(
+        {
+            "working_dirs": [
+                get_cache_key(working_dir, **kwargs) for working_dir in working_dirs
+            ],
+            "requirement_files": [
+                get_cache_key(
+                    os.path.dirname(requirement_file),
+                    pip_requirements_path=os.path.basename(requirement_file),
+                    package_managers=["pip"],
+                    python_version=kwargs.get("python_version"),
+                    decisions_file=kwargs.get("decisions_file", DEFAULT_DECISIONS_FILE),
+                )
+                for requirement_file in requirement_files
+            ],
+        }
+    )
+
+
+def execute_aggregated_license_finder(
+    working_dirs: list[str], requirement_files: list[str], **kwargs
+) -> dict[str, list[DependencyInfo]]:
+    """Execute pivotal license finder once for several directories
+    and package managers and return the result per package manager.
+
+    The enabled package managers (except pip) scan all working dirs using
+    --aggregate-paths. All requirement files are merged into a single
+    requirements file which pip scans in a directory of its own, so the
+    Python dependencies are only prepared once.
+
+    Args:
+        working_dirs (list[str]):
+            The directories to scan by the enabled package managers.
+        requirement_files (list[str]):
+            The absolute paths of the requirement files to scan by pip.
+        package_managers (list[str]):
+            The package managers to enable for the working dirs.
+        result_cache (Optional[ResultCache]):
+            If given, the result is looked up in and stored to this cache.
+            The cache is not used if any requirement file is not pinned.
+
+    Returns:
+        dict[str, list[DependencyInfo]]: Mapping of package manager
+            (e.g. "pip", "cargo") to all dependencies found by it.
+    """
+    package_managers = [
+        package_manager
+        for package_manager in kwargs.get("package_managers", [])
+        if package_manager != "pip"
     ]
+    if len(package_managers) == 0:
+        working_dirs = []
+    if len(requirement_files) > 0:
+        package_managers.append("pip")
+    if len(package_managers) == 0:
+        return {}
 
-    python_version_key = "python_version"
-    if python_version_key in kwargs:
-        process_args.append(f"--python-version={kwargs[python_version_key]}")
-
-    decision_file_key = "decisions_file"
-    if decision_file_key in kwargs:
-        process_args.append(f"--decisions_file={kwargs[decision_file_key]}")
-    else:
-        process_args.append("--decisions_file=/dependency_decisions_overwrites.yml")
-
-    package_managers_key = "package_managers"
-    if package_managers_key in kwargs:
-        package_managers_list = " ".join(kwargs.get(package_managers_key))
-        process_args.append(f"--enabled-package-managers={package_managers_list}")
-
-    pip_requirements_path_key = "pip_requirements_path"
-    if pip_requirements_path_key in kwargs:
-        process_args.append(
-            f"--pip-requirements-path={kwargs[pip_requirements_path_key]}"
+    result_cache: Optional[ResultCache] = kwargs.get("result_cache")
+    if result_cache is not None:
+        reason = __get_uncacheable_reason(requirement_files)
+        if reason is not None:
+            print(f"Not caching the aggregated license finder result: {reason}")
+            result_cache = None
+    cache_keys: dict[str, str] = {}
+    if result_cache is not None:
+        cache_key = get_aggregated_cache_key(working_dirs, requirement_files, **kwargs)
+        cache_keys = {
+            package_manager: compute_key(
+                {"aggregated": cache_key, "package_manager": package_manager}
+            )
+            for package_manager in package_managers
+        }
+        cached_result = {
+            package_manager: result_cache.get(key)
+            for package_manager, key in cache_keys.items()
+        }
+        if all(deps is not None for deps in cached_result.values()):
+            print("Using cached aggregated license finder result")
+            return {
+                package_manager: deps
+                for package_manager, deps in cached_result.items()
+                if deps is not None
+            }
+
+    result: dict[str, list[DependencyInfo]] = {
+        package_manager: [] for package_manager in package_managers
+    }
+    with tempfile.TemporaryDirectory(prefix="license-finder-") as output_dir:
+        output_file_path = os.path.join(output_dir, "dependencies-notice")
+        aggregate_paths = list(working_dirs)
+
+        process_args = [
+            "license_finder",
+            "report",
+            f"--save={output_file_path}",
+            "--prepare",
+            f"--decisions_file={kwargs.get('decisions_file', DEFAULT_DECISIONS_FILE)}",
+        ]
+
+        if "python_version" in kwargs:
+            process_args.append(f"--python-version={kwargs['python_version']}")
+
+        if len(requirement_files) > 0:
+            # the relative requirements path only exists in this directory,
+            # so pip is not activated for any of the other aggregated paths
+            requirements_dir = os.path.join(output_dir, "requirements")
+            os.makedirs(requirements_dir)
+            with open(
+                os.path.join(requirements_dir, MERGED_REQUIREMENTS_FILE_NAME),
+                "w",
+                encoding="utf-8",
+            ) as file:
+                for requirement_file in requirement_files:
+                    file.write(f"-r {requirement_file}\n")
+            aggregate_paths.append(requirements_dir)
+            process_args.append(
+                f"--pip-requirements-path={MERGED_REQUIREMENTS_FILE_NAME}"
+            )
+
+        process_args.extend(
+            ["--columns", "name", "version", "licenses", "package_manager"]
         )
+        process_args.extend(["--enabled-package-managers", *package_managers])
+        process_args.extend(["--aggregate-paths", *aggregate_paths])
+
+        __run_license_finder(process_args, package_managers, cwd=output_dir)
 
-    subprocess.run(process_args, check=True, cwd=working_dir)
+        for row in __iter_output_rows(output_file_path, 4):
+            package_manager = row[3].strip().lower()
+            if package_manager not in result:
+                print(f"Ignoring dependency of unknown package manager: {row}")
+                continue
+            result[package_manager].append(
+                DependencyInfo(row[0], row[1], __to_license_names(row[2]))
+            )
 
-    result.extend(__read_output_file("/tmp/license-finder/dependencies-notice"))
+    if result_cache is not None:
+        for package_manager, key in cache_keys.items():
+            result_cache.put(key, result[package_manager])
 
     return result
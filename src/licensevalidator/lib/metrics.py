@@ -0,0 +1,287 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Collects metrics about the costs of a license check run.
+
+The metrics are plain counters, minimums and phase durations, which are
+cheap to record from any thread. At the end of a run they are written as a
+Markdown table (e.g. to the GitHub step summary) and as JSON, so they can
+be aggregated across runs and repositories.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from licensevalidator.lib.tracing import span
+
+try:
+    import resource
+except ModuleNotFoundError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+METRICS_FILE_VERSION = 1
+
+# metrics present in every run, so runs can be aggregated
+# even if e.g. no subprocess was executed
+_DEFAULT_VALUES: dict[str, Any] = {
+    "subprocess.count": 0,
+    "subprocess.seconds": 0.0,
+    "result_cache.hits": 0,
+    "result_cache.misses": 0,
+    "github.requests": 0,
+    "github.cache_hits": 0,
+    "github.cache_misses": 0,
+    "github.not_modified": 0,
+    "github.rate_limit_remaining": None,
+}
+
+
+class Metrics:
+    """Thread safe collection of the metrics of a run.
+
+    Metric names are dotted paths (e.g. "github.requests"),
+    which form the nested structure of the JSON output.
+    """
+
+    def __init__(self):
+        """Create a new instance, the run duration starts with its creation."""
+        self.__start = time.perf_counter()
+        self.__lock = threading.Lock()
+        self.__values: dict[str, Any] = dict(_DEFAULT_VALUES)
+        self.__phases: dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add the given value to a counter.
+
+        Args:
+            name (str): The name of the counter.
+            value (float, optional): The value to add. Defaults to 1.
+        """
+        with self.__lock:
+            self.__values[name] = self.__values.get(name, 0) + value
+
+    def record_minimum(self, name: str, value: float) -> None:
+        """Keep the lowest of all values recorded for a metric.
+
+        Args:
+            name (str): The name of the metric.
+            value (float): The recorded value.
+        """
+        with self.__lock:
+            current = self.__values.get(name)
+            self.__values[name] = value if current is None else min(current, value)
+
+    def set_value(self, name: str, value: Any) -> None:
+        """Set a metric to the given value.
+
+        Args:
+            name (str): The name of the metric.
+            value (Any): The JSON serializable value.
+        """
+        with self.__lock:
+            self.__values[name] = value
+
+    def add_phase_duration(self, name: str, seconds: float) -> None:
+        """Add the given duration to a phase.
+
+        Args:
+            name (str): The name of the phase.
+            seconds (float): The duration in seconds.
+        """
+        with self.__lock:
+            self.__phases[name] = self.__phases.get(name, 0.0) + seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return all metrics as nested dict.
+
+        The run duration and the peak memory usage are taken
+        at the time of the call.
+
+        Returns:
+            dict[str, Any]: The JSON serializable metrics.
+        """
+        peak_rss, peak_rss_children = get_peak_rss()
+        result: dict[str, Any] = {
+            "version": METRICS_FILE_VERSION,
+            "duration_seconds": time.perf_counter() - self.__start,
+            "peak_rss_bytes": peak_rss,
+            "peak_rss_children_bytes": peak_rss_children,
+        }
+        with self.__lock:
+            result["phases"] = dict(self.__phases)
+            for name, value in sorted(self.__values.items()):
+                *parents, key = name.split(".")
+                node = result
+                for parent in parents:
+                    node = node.setdefault(parent, {})
+                node[key] = value
+        return result
+
+
+def get_peak_rss() -> tuple[Optional[int], Optional[int]]:
+    """Return the peak resident memory of this process and of its children.
+
+    Returns:
+        tuple[Optional[int], Optional[int]]: The peak resident memory in
+            bytes of the process and of its largest terminated child
+            process, e.g. the license finder. None if not available.
+    """
+    if resource is None:
+        return None, None
+    # macOS reports bytes, Linux kibibytes
+    unit = 1 if sys.platform == "darwin" else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit,
+    )
+
+
+__metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """Return the metrics of the current run."""
+    return __metrics
+
+
+def reset_metrics() -> Metrics:
+    """Start collecting the metrics of a new run.
+
+    Returns:
+        Metrics: The metrics of the new run.
+    """
+    global __metrics
+    __metrics = Metrics()
+    return __metrics
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Add the given value to a counter of the current run.
+
+    See Metrics.increment for the arguments.
+    """
+    __metrics.increment(name, value)
+
+
+def record_minimum(name: str, value: float) -> None:
+    """Keep the lowest of all values recorded for a metric of the current run.
+
+    See Metrics.record_minimum for the arguments.
+    """
+    __metrics.record_minimum(name, value)
+
+
+def set_value(name: str, value: Any) -> None:
+    """Set a metric of the current run.
+
+    See Metrics.set_value for the arguments.
+    """
+    __metrics.set_value(name, value)
+
+
+@contextlib.contextmanager
+def phase(name: str, **args: Any) -> Iterator[None]:
+    """Measure the duration of a phase of the run, also recording a span.
+
+    Args:
+        name (str): The name of the phase.
+        **args (Any): JSON serializable details of the span.
+    """
+    start = time.perf_counter()
+    try:
+        with span(name, "phase", **args):
+            yield
+    finally:
+        __metrics.add_phase_duration(name, time.perf_counter() - start)
+
+
+def __flatten(values: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    for key, value in values.items():
+        if isinstance(value, dict):
+            yield from __flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def __format_value(name: str, value: Any) -> str:
+    if value is None:
+        return "n/a"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    if name.endswith("_bytes"):
+        return f"{value / 1024 / 1024:.1f} MiB"
+    return str(value)
+
+
+def render_summary(metrics: dict[str, Any]) -> str:
+    """Render the metrics as Markdown tables.
+
+    Args:
+        metrics (dict[str, Any]): The metrics as returned by Metrics.to_dict.
+
+    Returns:
+        str: The Markdown.
+    """
+    lines = [
+        "### License check metrics\n",
+        "\n",
+        "| Metric | Value |\n",
+        "|:-------|------:|\n",
+    ]
+    for name, value in __flatten(metrics):
+        if name != "version" and not name.startswith("phases."):
+            lines.append(f"| {name} | {__format_value(name, value)} |\n")
+
+    if metrics.get("phases"):
+        lines.extend(["\n", "| Phase | Duration [s] |\n", "|:------|-------------:|\n"])
+        for name, seconds in metrics["phases"].items():
+            lines.append(f"| {name} | {seconds:.2f} |\n")
+    return "".join(lines)
+
+
+def write_metrics_file(path: str, metrics: dict[str, Any]) -> None:
+    """Write the metrics to a JSON file.
+
+    Args:
+        path (str): The path of the metrics file.
+        metrics (dict[str, Any]): The metrics as returned by Metrics.to_dict.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(metrics, file, indent=2)
+        file.write("\n")
+
+
+def write_step_summary(metrics: dict[str, Any]) -> bool:
+    """Append the metrics to the summary of the current GitHub Actions step.
+
+    Args:
+        metrics (dict[str, Any]): The metrics as returned by Metrics.to_dict.
+
+    Returns:
+        bool: False if not running in GitHub Actions, i.e. GITHUB_STEP_SUMMARY
+            is not set.
+    """
+    summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
+    if not summary_path:
+        return False
+
+    with open(summary_path, "a", encoding="utf-8") as file:
+        file.write(render_summary(metrics))
+    return True
@@ -0,0 +1,375 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Native scanner for the licenses of JavaScript dependencies.
+
+Reads the "packages" map of a package-lock.json (lockfileVersion 2 and 3)
+as a stream, so even very large lock files are never fully loaded into
+memory. No npm installation is needed.
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterator
+from typing import Any, Optional, TextIO
+
+from licensevalidator.lib.dependency import DependencyInfo
+
+_SPECIAL_CHARACTER_PATTERN = re.compile(r'[{}\[\]"]')
+_STRING_REST_PATTERN = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+_WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonStream:
+    """Incremental reader for a JSON document.
+
+    Only the part of the document which is currently processed is held in
+    memory. Values can either be decoded or skipped without decoding them.
+    """
+
+    def __init__(self, text_io: TextIO, chunk_size: int = 1 << 16):
+        """Create a new instance.
+
+        Args:
+            text_io (TextIO): The io object to read the document from.
+            chunk_size (int, optional): Number of characters read at once.
+        """
+        self.__text_io = text_io
+        self.__chunk_size = chunk_size
+        self.__buffer = ""
+        self.__position = 0
+        self.__eof = False
+        self.__decoder = json.JSONDecoder()
+
+    def __fill(self) -> bool:
+        """Read the next chunk, dropping the already consumed part of the buffer.
+
+        Returns:
+            bool: False if the end of the document was reached before.
+        """
+        if self.__eof:
+            return False
+        chunk = self.__text_io.read(self.__chunk_size)
+        if chunk == "":
+            self.__eof = True
+            return False
+        self.__buffer = self.__buffer[self.__position :] + chunk
+        self.__position = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it.
+
+        Returns:
+            str: The character or an empty string at the end of the document.
+        """
+        while True:
+            self.__position = _WHITESPACE_PATTERN.match(
+                self.__buffer, self.__position
+            ).end()
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if not self.__fill():
+                return ""
+
+    def expect(self, character: str) -> None:
+        """Consume the given character, which must come next.
+
+        Raises:
+            ValueError: If a different character comes next.
+        """
+        found = self.peek()
+        if found != character:
+            raise ValueError(f"Malformed JSON: expected '{character}', got '{found}'")
+        self.__position += 1
+
+    def read_value(self) -> Any:
+        """Decode and consume the next value.
+
+        Returns:
+            Any: The decoded value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+                # a number at the end of the buffer might be incomplete
+                if end < len(self.__buffer) or self.__eof:
+                    self.__position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+            self.__fill()
+
+    def skip_value(self) -> None:
+        """Consume the next value without decoding it."""
+        if self.peek() not in "{[":
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            match = _SPECIAL_CHARACTER_PATTERN.search(self.__buffer, self.__position)
+            if match is None:
+                self.__position = len(self.__buffer)
+                if not self.__fill():
+                    raise ValueError("Malformed JSON: unexpected end of document")
+                continue
+
+            character = match.group()
+            if character == '"':
+                string_end = _STRING_REST_PATTERN.match(self.__buffer, match.end())
+                if string_end is None:
+                    # the string continues in the next chunk
+                    self.__position = match.start()
+                    if not self.__fill():
+                        raise ValueError("Malformed JSON: unterminated string")
+                    continue
+                self.__position = string_end.end()
+                continue
+
+            self.__position = match.end()
+            depth += 1 if character in "{[" else -1
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the next object.
+
+        After each key, the caller must consume the value of the key
+        by either reading or skipping it.
+
+        Yields:
+            str: The keys of the object.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.__position += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+
+            separator = self.peek()
+            self.__position += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed JSON: unexpected '{separator}'")
+
+
+def iter_package_lock_entries(
+    text_io: TextIO, chunk_size: int = 1 << 16
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Iterate over the entries of the "packages" map of a package lock.
+
+    All other top level values (e.g. the legacy "dependencies" tree) are
+    skipped without decoding them.
+
+    Args:
+        text_io (TextIO): The io object to read the package lock from.
+        chunk_size (int, optional): Number of characters read at once.
+
+    Raises:
+        ValueError: In case the lock file has no "packages" map,
+            i.e. it has lockfileVersion 1.
+
+    Yields:
+        tuple[str, dict[str, Any]]: The path of each package
+            (e.g. "node_modules/typescript") and its lock entry.
+    """
+    stream = _JsonStream(text_io, chunk_size)
+    has_packages = False
+    for key in stream.iter_object():
+        if key != "packages":
+            stream.skip_value()
+            continue
+
+        has_packages = True
+        for package_path in stream.iter_object():
+            yield package_path, stream.read_value()
+
+    if not has_packages:
+        raise ValueError(
+            "Package lock has no 'packages' map, lockfileVersion 1 is not supported"
+        )
+
+
+def get_licenses_from_package(package: dict[str, Any]) -> list[str]:
+    """Return the licenses declared by a lock entry or a package.json.
+
+    Args:
+        package (dict[str, Any]): The lock entry or parsed package.json.
+
+    Returns:
+        list[str]: The declared licenses. Empty if not declared.
+    """
+    license_info = package.get("license")
+    if license_info is None and isinstance(package.get("licenses"), list):
+        # deprecated notation: "licenses": [{"type": "MIT", ...}, ...]
+        return [
+            license_name
+            for entry in package["licenses"]
+            if (license_name := _get_license_name(entry))
+        ]
+
+    license_name = _get_license_name(license_info)
+    return [license_name] if license_name else []
+
+
+def _get_license_name(license_info: Any) -> Optional[str]:
+    if isinstance(license_info, dict):
+        license_info = license_info.get("type")
+    if isinstance(license_info, str) and license_info.strip():
+        return license_info.strip()
+    return None
+
+
+def _read_installed_package(project_dir: str, package_path: str) -> dict[str, Any]:
+    try:
+        with open(
+            os.path.join(project_dir, package_path, "package.json"),
+            "r",
+            encoding="utf-8",
+        ) as file:
+            package = json.load(file)
+            return package if isinstance(package, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def get_lock_file_path(project_dir: str) -> str:
+    """Return the path of the package lock of a project.
+
+    Args:
+        project_dir (str): The directory of the project.
+
+    Returns:
+        str: The path of npm-shrinkwrap.json, if present,
+            otherwise the path of package-lock.json.
+    """
+    lock_file_path = os.path.join(project_dir, "npm-shrinkwrap.json")
+    if not os.path.isfile(lock_file_path):
+        lock_file_path = os.path.join(project_dir, "package-lock.json")
+    return lock_file_path
+
+
+def is_relevant_lock_entry(
+    package_path: str, entry: dict[str, Any], include_dev_dependencies: bool = True
+) -> bool:
+    """Return True if the lock entry describes a dependency to check.
+
+    The project itself (the "" entry) and its workspace packages
+    (e.g. "packages/ws") are not dependencies, only installed packages are.
+
+    Args:
+        package_path (str): The path of the package, e.g. "node_modules/a".
+        entry (dict[str, Any]): The lock entry.
+        include_dev_dependencies (bool, optional): If set to False,
+            packages only needed for development are not relevant.
+    """
+    if "node_modules/" not in package_path:
+        return False
+    # links point to a workspace package which has its own entry
+    if entry.get("link") or entry.get("extraneous"):
+        return False
+    return include_dev_dependencies or not entry.get("dev")
+
+
+def get_package_name(project_dir: str, package_path: str, entry: dict[str, Any]) -> str:
+    """Return the name of the package of a lock entry.
+
+    Args:
+        project_dir (str): The directory containing the package lock.
+        package_path (str): The path of the package, e.g. "node_modules/a".
+        entry (dict[str, Any]): The lock entry.
+
+    Returns:
+        str: The name recorded in the entry or derived from the path.
+    """
+    return (
+        entry.get("name")
+        or package_path.rsplit("node_modules/", 1)[-1]
+        or os.path.basename(os.path.abspath(project_dir))
+    )
+
+
+def get_dependency_from_lock_entry(
+    project_dir: str, package_path: str, entry: dict[str, Any]
+) -> DependencyInfo:
+    """Return the dependency described by a lock entry.
+
+    The license is taken from the lock entry or, if not recorded there,
+    from the package.json of the installed package in node_modules.
+
+    Args:
+        project_dir (str): The directory containing the package lock.
+        package_path (str): The path of the package, e.g. "node_modules/a".
+        entry (dict[str, Any]): The lock entry.
+
+    Returns:
+        DependencyInfo: The dependency along with its licenses.
+    """
+    licenses = get_licenses_from_package(entry)
+    if len(licenses) == 0:
+        licenses = get_licenses_from_package(
+            _read_installed_package(project_dir, package_path)
+        )
+    return DependencyInfo(
+        get_package_name(project_dir, package_path, entry),
+        entry.get("version", ""),
+        licenses,
+    )
+
+
+def scan_npm_dependencies(
+    project_dir: str, include_dev_dependencies: bool = True
+) -> list[DependencyInfo]:
+    """Find all dependencies of an npm project along with their licenses.
+
+    Args:
+        project_dir (str): The directory containing the package lock.
+        include_dev_dependencies (bool, optional): If set to False,
+            packages only needed for development are skipped.
+            Defaults to True.
+
+    Raises:
+        FileNotFoundError: In case there is no package lock.
+        ValueError: In case the package lock is not supported.
+
+    Returns:
+        list[DependencyInfo]: The found dependencies.
+    """
+    result: dict[tuple[str, str], DependencyInfo] = {}
+    with open(get_lock_file_path(project_dir), "r", encoding="utf-8") as file:
+        for package_path, entry in iter_package_lock_entries(file):
+            if not is_relevant_lock_entry(
+                package_path, entry, include_dev_dependencies
+            ):
+                continue
+
+            key = (
+                get_package_name(project_dir, package_path, entry),
+                entry.get("version", ""),
+            )
+            if key not in result:
+                result[key] = get_dependency_from_lock_entry(
+                    project_dir, package_path, entry
+                )
+
+    return list(result.values())
@@ -0,0 +1,425 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Native scanner for the licenses of Python dependencies.
+
+Reads requirement files and resolves the license of each requirement from
+package metadata which is already present, either from installed
+distributions (e.g. a site-packages directory) or from a wheelhouse.
+No package is installed and no external process is executed.
+"""
+
+import email.parser
+import glob
+import importlib.metadata
+import os
+import re
+import zipfile
+from email.message import Message
+from typing import Callable, Optional
+
+from packaging.markers import InvalidMarker, Marker
+
+from licensevalidator.lib.dependency import DependencyInfo
+
+_REQUIREMENT_PATTERN = re.compile(
+    r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*"
+    r"(?:\[(?P<extras>[^\]]*)\])?\s*"
+    r"(?:\(?\s*(?P<specifier>[^;()@]*?)\s*\)?)?\s*"
+    r"(?:@[^;]*)?"
+    r"(?:;(?P<marker>.*))?$"
+)
+
+_INCLUDE_PATTERN = re.compile(r"^(?:-r|--requirement)(?:\s+|=)(?P<path>\S+)")
+
+
+class Requirement:
+    """A single requirement of a requirements file or of a distribution."""
+
+    def __init__(
+        self,
+        name: str,
+        version: Optional[str],
+        extras: frozenset[str] = frozenset(),
+        marker: Optional[str] = None,
+    ):
+        """Create a new instance.
+
+        Args:
+            name (str): Name of the required distribution.
+            version (Optional[str]): The pinned version, if any.
+            extras (frozenset[str], optional): The requested extras.
+            marker (Optional[str], optional): The environment marker, if any.
+        """
+        self.name = name
+        self.version = version
+        self.extras = extras
+        self.marker = marker
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distribution name as described by PEP 503.
+
+    Args:
+        name (str): The distribution name.
+
+    Returns:
+        str: The normalized name.
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parse_requirement(requirement_string: str) -> Optional[Requirement]:
+    """Parse a single PEP 508 requirement string.
+
+    Args:
+        requirement_string (str): The requirement, e.g. "yarl[idna]==1.9.4".
+
+    Returns:
+        Optional[Requirement]: The requirement or None if it cannot be parsed.
+    """
+    match = _REQUIREMENT_PATTERN.match(requirement_string.strip())
+    if match is None:
+        return None
+
+    version = None
+    specifier = match["specifier"] or ""
+    pinned = re.fullmatch(r"===?\s*([^\s,*]+)", specifier.strip())
+    if pinned:
+        version = pinned[1]
+
+    extras = frozenset(
+        normalize_name(extra.strip())
+        for extra in (match["extras"] or "").split(",")
+        if extra.strip()
+    )
+    marker = match["marker"].strip() if match["marker"] else None
+    return Requirement(match["name"], version, extras, marker)
+
+
+def _read_text_file(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def read_requirements(
+    requirements_path: str, read_file: Callable[[str], str] = _read_text_file
+) -> list[Requirement]:
+    """Read all requirements from a requirements file.
+
+    Files included with -r/--requirement are read as well, relative
+    to the including file. Options, editable installs, URLs and hashes
+    are ignored.
+
+    Args:
+        requirements_path (str): The path of the requirements file.
+        read_file (Callable[[str], str], optional): Returns the contents
+            of a file. Defaults to reading from the file system.
+
+    Raises:
+        FileNotFoundError: In case the requirements file does not exist.
+
+    Returns:
+        list[Requirement]: The requirements in order of appearance.
+    """
+    result: list[Requirement] = []
+    visited: set[str] = set()
+
+    def read_requirements_file(path: str) -> None:
+        path = os.path.normpath(path)
+        if path in visited:
+            return
+        visited.add(path)
+
+        content = read_file(path).replace("\\\n", " ")
+
+        for line in content.splitlines():
+            line = re.sub(r"(^|\s)#.*$", "", line).strip()
+            if not line:
+                continue
+
+            include = _INCLUDE_PATTERN.match(line)
+            if include:
+                read_requirements_file(
+                    os.path.join(os.path.dirname(path), include["path"])
+                )
+                continue
+            if line.startswith("-"):
+                continue
+
+            requirement = parse_requirement(re.sub(r"\s--hash[=\s]\S+", "", line))
+            if requirement is not None:
+                result.append(requirement)
+
+    read_requirements_file(requirements_path)
+    return result
+
+
+def get_unpinned_requirements(requirements_path: str) -> list[str]:
+    """Return the names of the requirements which are not pinned.
+
+    The dependencies resolved for such requirements may change without
+    any change of the requirements file, e.g. after a new release.
+
+    Args:
+        requirements_path (str): The path of the requirements file.
+
+    Returns:
+        list[str]: The sorted names of all requirements without a pinned
+            version. Empty if the requirements file does not exist.
+    """
+    try:
+        requirements = read_requirements(requirements_path)
+    except FileNotFoundError:
+        return []
+    return sorted(
+        {
+            requirement.name
+            for requirement in requirements
+            if requirement.version is None
+        }
+    )
+
+
+def get_metadata_files(metadata_paths: list[str]) -> list[str]:
+    """Return the files a MetadataIndex of the given paths reads metadata from.
+
+    Args:
+        metadata_paths (list[str]): The paths to index.
+
+    Returns:
+        list[str]: The sorted paths of all wheels and metadata files.
+    """
+    result: list[str] = []
+    for metadata_path in metadata_paths:
+        for pattern in ["*.whl", "*.dist-info/METADATA", "*.egg-info/PKG-INFO"]:
+            result.extend(glob.glob(os.path.join(metadata_path, pattern)))
+    return sorted(result)
+
+
+def get_licenses_from_metadata(metadata: Message) -> list[str]:
+    """Extract the license names from the core metadata of a distribution.
+
+    The License-Expression field is preferred, followed by a short License
+    field and the license classifiers.
+
+    Args:
+        metadata (Message): The core metadata of the distribution.
+
+    Returns:
+        list[str]: The license names. Empty if no license is declared.
+    """
+    license_expression = metadata.get("License-Expression")
+    if license_expression:
+        return [license_expression.strip()]
+
+    license_field = (metadata.get("License") or "").strip()
+    if license_field.upper() == "UNKNOWN":
+        license_field = ""
+
+    # the license field sometimes contains the whole license text
+    if license_field and "\n" not in license_field and len(license_field) <= 100:
+        return [license_field]
+
+    classifier_licenses = [
+        classifier.split("::")[-1].strip()
+        for classifier in metadata.get_all("Classifier") or []
+        if classifier.startswith("License ::") and classifier.count("::") > 1
+    ]
+    if classifier_licenses:
+        return classifier_licenses
+
+    if license_field:
+        return [license_field.splitlines()[0].strip()]
+    return []
+
+
+class MetadataIndex:
+    """Index of the core metadata of all distributions found in the given paths.
+
+    A path can either be a directory containing installed distributions
+    (*.dist-info/*.egg-info, e.g. site-packages) or a wheelhouse
+    containing *.whl files.
+    """
+
+    def __init__(self, metadata_paths: list[str]):
+        """Create a new instance.
+
+        Args:
+            metadata_paths (list[str]): The paths to index.
+        """
+        self.__distributions: dict[str, dict[str, Message]] = {}
+
+        for metadata_path in metadata_paths:
+            wheels = sorted(glob.glob(os.path.join(metadata_path, "*.whl")))
+            for wheel in wheels:
+                self.__add_wheel(wheel)
+            self.__add_installed([metadata_path])
+
+    def __add(self, metadata: Message) -> None:
+        name = metadata.get("Name")
+        version = metadata.get("Version")
+        if name and version:
+            versions = self.__distributions.setdefault(normalize_name(name), {})
+            versions.setdefault(version, metadata)
+
+    def __add_installed(self, paths: list[str]) -> None:
+        for distribution in importlib.metadata.distributions(path=paths):
+            self.__add(distribution.metadata)  # type: ignore[arg-type]
+
+    def __add_wheel(self, wheel_path: str) -> None:
+        try:
+            with zipfile.ZipFile(wheel_path) as wheel:
+                for entry in wheel.namelist():
+                    if re.fullmatch(r"[^/]+\.dist-info/METADATA", entry):
+                        self.__add(
+                            email.parser.Parser().parsestr(
+                                wheel.read(entry).decode("utf-8")
+                            )
+                        )
+                        break
+        except (OSError, zipfile.BadZipFile, UnicodeDecodeError) as err:
+            print(f"::warning::Unable to read wheel '{wheel_path}': {err}")
+
+    def find(self, name: str, version: Optional[str] = None) -> Optional[Message]:
+        """Find the metadata of a distribution.
+
+        Args:
+            name (str): The distribution name.
+            version (Optional[str], optional): The requested version.
+                If not given, any version of the distribution is returned.
+
+        Returns:
+            Optional[Message]: The metadata or None if the distribution
+                (in the requested version) is not available.
+        """
+        versions = self.__distributions.get(normalize_name(name), {})
+        if version is not None:
+            return versions.get(version)
+        if len(versions) == 0:
+            return None
+        return versions[max(versions.keys(), key=_get_version_sort_key)]
+
+
+def _get_version_sort_key(version: str) -> tuple:
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in re.split(r"[.+-]", version)
+    )
+
+
+def _is_required_for_extras(marker: Optional[str], extras: frozenset[str]) -> bool:
+    """Return True if a dependency with the given marker is required.
+
+    Dependencies which are only needed for extras are only considered if
+    one of those extras is requested. Other markers are not evaluated.
+    """
+    if marker is None:
+        return True
+    required_extras = re.findall(r"extra\s*==\s*['\"]([^'\"]+)['\"]", marker)
+    if len(required_extras) == 0:
+        return True
+    return any(normalize_name(extra) in extras for extra in required_extras)
+
+
+def _is_marker_satisfied(marker: Optional[str], extras: frozenset[str]) -> bool:
+    """Return True if the given environment marker applies to the running
+    interpreter.
+
+    Args:
+        marker (Optional[str]): The environment marker, if any.
+        extras (frozenset[str]): The extras requested for the distribution
+            which declares the marker.
+
+    Returns:
+        bool: False only if the marker is known not to apply. Markers
+            which cannot be parsed are considered satisfied.
+    """
+    if marker is None:
+        return True
+    try:
+        parsed_marker = Marker(marker)
+    except InvalidMarker:
+        return True
+    return any(
+        parsed_marker.evaluate({"extra": extra}) for extra in sorted(extras) or [""]
+    )
+
+
+def scan_python_dependencies(
+    requirements_path: str, metadata_index: MetadataIndex
+) -> list[DependencyInfo]:
+    """Find all dependencies of a requirements file along with their licenses.
+
+    Transitive dependencies are resolved from the Requires-Dist metadata
+    of the available distributions.
+
+    Args:
+        requirements_path (str): The path of the requirements file.
+        metadata_index (MetadataIndex): The index to read the metadata from.
+
+    Raises:
+        FileNotFoundError: In case the requirements file does not exist.
+
+    Returns:
+        list[DependencyInfo]: The found dependencies.
+    """
+    result: dict[str, DependencyInfo] = {}
+    # each requirement along with the extras requested for the distribution
+    # requiring it, which its marker is evaluated with
+    pending: list[tuple[Requirement, frozenset[str]]] = [
+        (requirement, frozenset())
+        for requirement in read_requirements(requirements_path)
+    ]
+    requested_extras: dict[str, frozenset[str]] = {}
+
+    while pending:
+        requirement, parent_extras = pending.pop(0)
+        key = normalize_name(requirement.name)
+        known_extras = requested_extras.get(key)
+        if known_extras is not None and requirement.extras <= known_extras:
+            continue
+        requested_extras[key] = (known_extras or frozenset()) | requirement.extras
+
+        metadata = metadata_index.find(requirement.name, requirement.version)
+        if metadata is None:
+            # a missing distribution is only expected if its marker does
+            # not apply, all others are reported without a license
+            if key not in result and _is_marker_satisfied(
+                requirement.marker, parent_extras
+            ):
+                print(
+                    f"::warning::No metadata available for Python package "
+                    f"'{requirement.name}'"
+                )
+                result[key] = DependencyInfo(
+                    requirement.name, requirement.version or "", []
+                )
+            continue
+
+        result[key] = DependencyInfo(
+            metadata["Name"],
+            metadata["Version"],
+            get_licenses_from_metadata(metadata),
+        )
+
+        for requires_dist in metadata.get_all("Requires-Dist") or []:
+            dependency = parse_requirement(requires_dist)
+            if dependency is not None and _is_required_for_extras(
+                dependency.marker, requested_extras[key]
+            ):
+                dependency.version = None
+                pending.append((dependency, requested_extras[key]))
+
+    return list(result.values())
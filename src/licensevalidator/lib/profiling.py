@@ -0,0 +1,297 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Profiling of the CPU time and memory allocations of a run.
+
+The CPU time is profiled with cProfile and written as .prof file (e.g. for
+snakeviz or pstats) and as collapsed stacks (e.g. for flamegraph.pl or
+speedscope). Memory allocations are traced with tracemalloc, taking a
+snapshot at the start of each step, so the top allocating sites can be
+reported per step.
+"""
+
+import contextlib
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from licensevalidator.lib.utils import add_step_listener, remove_step_listener
+
+PROFILE_FILE_NAME = "profile.prof"
+COLLAPSED_STACKS_FILE_NAME = "profile.collapsed"
+MEMORY_REPORT_FILE_NAME = "memory.txt"
+
+# number of frames recorded per allocation by tracemalloc
+TRACEMALLOC_FRAMES = 10
+
+# paths of the collapsed stacks with less than this share
+# of the total time are dropped
+_MIN_STACK_SHARE = 0.0001
+
+
+class Profiler:
+    """Profiles the CPU time and/or the memory allocations of the process.
+
+    For CPU profiling, every thread started while profiling (e.g. the
+    workers of the scan jobs) gets a profiler of its own, as cProfile only
+    profiles the thread it is enabled in before Python 3.12.
+    """
+
+    def __init__(self, cpu: bool = True, memory: bool = False, top_count: int = 10):
+        """Create a new instance.
+
+        Args:
+            cpu (bool, optional): Profile the CPU time. Defaults to True.
+            memory (bool, optional): Trace memory allocations.
+                Defaults to False.
+            top_count (int, optional): Number of allocating sites
+                reported per step.
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self.top_count = top_count
+        self.__profilers: list[cProfile.Profile] = []
+        self.__stats: Optional[pstats.Stats] = None
+        self.__lock = threading.Lock()
+        self.__step: Optional[tuple[str, tracemalloc.Snapshot]] = None
+        self.__memory_report: list[str] = []
+
+    def __start_thread_profiler(self, *_: Any) -> None:
+        """Profile hook of new threads, replacing itself by a profiler."""
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        with self.__lock:
+            self.__profilers.append(profiler)
+        profiler.enable()
+
+    def start(self) -> None:
+        """Start profiling."""
+        if self.memory:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self.__step = ("Start", tracemalloc.take_snapshot())
+            add_step_listener(self.__on_step)
+
+        if self.cpu:
+            profiler = cProfile.Profile()
+            self.__profilers.append(profiler)
+            if sys.version_info < (3, 12):
+                threading.setprofile(self.__start_thread_profiler)
+            profiler.enable()
+
+    def stop(self) -> None:
+        """Stop profiling."""
+        if self.cpu:
+            if sys.version_info < (3, 12):
+                threading.setprofile(None)  # type: ignore[arg-type]
+            with self.__lock:
+                # the profiler of this thread is disabled last
+                for profiler in reversed(self.__profilers):
+                    profiler.disable()
+                # threads may outlive the profiling, e.g. the workers of a
+                # pool, and before Python 3.12 disable() only unhooks the
+                # profiler of the calling thread, so the stats are frozen
+                self.__stats = self.__combine_stats()
+
+        if self.memory:
+            remove_step_listener(self.__on_step)
+            self.__on_step("End")
+            tracemalloc.stop()
+
+    def __on_step(self, step_description: str) -> None:
+        """Report the allocations of the previous step and start a new one.
+
+        Args:
+            step_description (str): The description of the new step.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        if self.__step is not None:
+            name, previous_snapshot = self.__step
+            self.__memory_report.append(
+                f"## {name}\n\nPeak traced memory: {peak / 1024 / 1024:.1f} MiB\n\n"
+                f"Top {self.top_count} allocating sites (size, count):\n"
+            )
+            for statistic in snapshot.compare_to(previous_snapshot, "lineno")[
+                : self.top_count
+            ]:
+                self.__memory_report.append(f"{statistic}\n")
+            self.__memory_report.append("\n")
+        self.__step = (step_description, snapshot)
+
+    def get_stats(self) -> pstats.Stats:
+        """Return the combined CPU profile of all threads, up to stop().
+
+        Returns:
+            pstats.Stats: The statistics.
+        """
+        with self.__lock:
+            if self.__stats is not None:
+                return self.__stats
+            return self.__combine_stats()
+
+    def __combine_stats(self) -> pstats.Stats:
+        """Return the combined statistics of all profilers, with the lock held."""
+        stats = pstats.Stats(self.__profilers[0])
+        for profiler in self.__profilers[1:]:
+            stats.add(profiler)
+        return stats
+
+    def write(self, output_dir: str) -> list[str]:
+        """Write the results of the profiling.
+
+        Args:
+            output_dir (str): The directory to write the results to.
+
+        Returns:
+            list[str]: The paths of the written files.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        if self.cpu:
+            stats = self.get_stats()
+            paths.append(os.path.join(output_dir, PROFILE_FILE_NAME))
+            stats.dump_stats(paths[-1])
+            paths.append(os.path.join(output_dir, COLLAPSED_STACKS_FILE_NAME))
+            write_collapsed_stacks(stats, paths[-1])
+
+        if self.memory:
+            paths.append(os.path.join(output_dir, MEMORY_REPORT_FILE_NAME))
+            with open(paths[-1], "w", encoding="utf-8") as file:
+                file.write("# Memory allocations per step\n\n")
+                file.writelines(self.__memory_report)
+        return paths
+
+
+def __get_function_label(function: tuple[str, int, str]) -> str:
+    file_name, line_number, function_name = function
+    if file_name == "~":
+        label = function_name
+    else:
+        label = f"{function_name} ({os.path.basename(file_name)}:{line_number})"
+    return label.replace(";", ",")
+
+
+def get_collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    """Derive collapsed stacks from a CPU profile.
+
+    cProfile only records the time per caller and callee pair, so the time
+    of a function is distributed to the stacks it was reached through in
+    proportion to the time spent in each of its callers.
+
+    Args:
+        stats (pstats.Stats): The statistics of the profile.
+
+    Returns:
+        dict[str, float]: Maps the stack, as semicolon separated function
+            labels from the root, to the time in seconds spent in its
+            innermost function.
+    """
+    entries: dict[Any, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Any, dict[Any, float]] = {}
+    # functions called from outside of the profile (e.g. by the function
+    # which started the profiler) along with the time spent in those calls
+    roots: dict[Any, float] = {}
+    for function, (_, _, _, cumulative_time, callers) in entries.items():
+        known_callers = [caller for caller in callers if caller in entries]
+        for caller in known_callers:
+            callees.setdefault(caller, {})[function] = callers[caller][3]
+        if len(known_callers) == 0:
+            roots[function] = cumulative_time
+        else:
+            unknown_time = cumulative_time - sum(
+                callers[caller][3] for caller in known_callers
+            )
+            if unknown_time > 0:
+                roots[function] = unknown_time
+
+    total_time = sum(
+        time
+        for function, time in roots.items()
+        if not any(caller in entries for caller in entries[function][4])
+    )
+    min_time = total_time * _MIN_STACK_SHARE
+    result: dict[str, float] = {}
+
+    def walk(function: Any, stack: list[Any], labels: str, time: float) -> None:
+        cumulative_time = entries[function][3]
+        share = time / cumulative_time if cumulative_time > 0 else 0.0
+        self_time = entries[function][2] * share
+        if self_time > 0:
+            result[labels] = result.get(labels, 0.0) + self_time
+
+        for callee, callee_time in callees.get(function, {}).items():
+            if callee in stack or callee_time * share < min_time:
+                continue
+            stack.append(callee)
+            walk(
+                callee,
+                stack,
+                f"{labels};{__get_function_label(callee)}",
+                callee_time * share,
+            )
+            stack.pop()
+
+    for root, time in roots.items():
+        if time >= min_time:
+            walk(root, [root], __get_function_label(root), time)
+    return result
+
+
+def write_collapsed_stacks(stats: pstats.Stats, path: str) -> None:
+    """Write a CPU profile in the collapsed stack format.
+
+    Each line contains a stack and the time spent in it in microseconds.
+
+    Args:
+        stats (pstats.Stats): The statistics of the profile.
+        path (str): The path of the output file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        for stack, seconds in sorted(get_collapsed_stacks(stats).items()):
+            microseconds = round(seconds * 1_000_000)
+            if microseconds > 0:
+                file.write(f"{stack} {microseconds}\n")
+
+
+@contextlib.contextmanager
+def profiling(
+    output_dir: str, cpu: bool = True, memory: bool = False
+) -> Iterator[Profiler]:
+    """Profile the with block and write the results afterwards.
+
+    Args:
+        output_dir (str): The directory to write the results to.
+        cpu (bool, optional): Profile the CPU time. Defaults to True.
+        memory (bool, optional): Trace memory allocations. Defaults to False.
+
+    Yields:
+        Profiler: The running profiler.
+    """
+    profiler = Profiler(cpu, memory)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        for path in profiler.write(output_dir):
+            print(f"Profile written to '{path}'")
@@ -0,0 +1,125 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent, content-addressed cache for found dependencies."""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.metrics import increment
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 digest of the file at the given path.
+
+    Args:
+        path (str): The path of the file to hash.
+
+    Returns:
+        str: The hex digest of the file contents or "missing"
+            if there is no such file.
+    """
+    if not os.path.isfile(path):
+        return "missing"
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(1 << 16):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_key(parts: dict[str, Any]) -> str:
+    """Compute a cache key from the passed key parts.
+
+    Args:
+        parts (dict[str, Any]): JSON serializable parts making up the key.
+
+    Returns:
+        str: The cache key.
+    """
+    serialized = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Stores lists of dependencies on disk, addressed by a key
+    which is derived from all inputs which led to the list."""
+
+    def __init__(self, cache_dir: str):
+        """Create a new instance.
+
+        Args:
+            cache_dir (str): The directory in which cache entries are stored.
+        """
+        self.cache_dir = cache_dir
+
+    def __get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[list[DependencyInfo]]:
+        """Return the cached dependencies for the given key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[list[DependencyInfo]]: The cached dependencies
+                or None in case of a cache miss.
+        """
+        try:
+            with open(self.__get_entry_path(key), "r", encoding="utf-8") as file:
+                entries = json.load(file)["dependencies"]
+        except (OSError, ValueError, KeyError):
+            increment("result_cache.misses")
+            return None
+
+        increment("result_cache.hits")
+        return DependencyInfo.from_rows(entries)
+
+    def put(self, key: str, dependencies: list[DependencyInfo]) -> None:
+        """Store the dependencies for the given key.
+
+        Args:
+            key (str): The cache key.
+            dependencies (list[DependencyInfo]): The dependencies to store.
+        """
+        entry_path = self.__get_entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+
+        # write to a temporary file first, so concurrent readers
+        # never see a partially written entry
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(entry_path), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "dependencies": [
+                            [dep.name, dep.version, list(dep.licenses)]
+                            for dep in dependencies
+                        ]
+                    },
+                    file,
+                )
+            os.replace(temp_path, entry_path)
+        except OSError as err:
+            print(f"::warning::Unable to write cache entry: {err}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,184 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Parser and evaluator for SPDX license expressions."""
+
+import re
+from functools import lru_cache
+from typing import Callable
+
+_TOKEN_PATTERN = re.compile(r"\(|\)|[^\s()]+")
+# SPDX allows operators either in upper or in lower case
+_OPERATORS = ("AND", "OR", "WITH")
+_OPERATOR_SPELLINGS = _OPERATORS + tuple(operator.lower() for operator in _OPERATORS)
+
+
+class SpdxExpression:
+    """A node of a parsed SPDX license expression.
+
+    Leaves are licenses (operator "LICENSE", operands [name]) or licenses
+    with an exception (operator "WITH", operands [name, exception]).
+    Inner nodes combine their operands with "AND" or "OR".
+    """
+
+    def __init__(self, operator: str, operands: list):
+        """Create a new instance.
+
+        Args:
+            operator (str): One of "LICENSE", "WITH", "AND" or "OR".
+            operands (list): The license names or sub expressions.
+        """
+        self.operator = operator
+        self.operands = operands
+
+    def __repr__(self) -> str:
+        return f"SpdxExpression({self.operator}, {self.operands})"
+
+    def evaluate(
+        self, is_license_valid: Callable[[str], bool], is_list_inclusive: bool = True
+    ) -> bool:
+        """Evaluate the expression.
+
+        OR branches are evaluated lazily, so evaluation stops at the first
+        valid alternative. If the valid licenses are given by a whitelist, a
+        license with an exception is valid if either the full
+        "<license> WITH <exception>" or the license itself is valid. If they
+        are given by a blacklist, both must be valid, so an exception does
+        not lift a blacklisted license.
+
+        Args:
+            is_license_valid (Callable[[str], bool]): Returns if a single
+                license is valid.
+            is_list_inclusive (bool, optional): False if is_license_valid
+                is based on a blacklist. Defaults to True.
+
+        Returns:
+            bool: True if the expression is satisfied by valid licenses.
+        """
+        if self.operator == "LICENSE":
+            return is_license_valid(self.operands[0])
+        if self.operator == "WITH":
+            results = (
+                is_license_valid(f"{self.operands[0]} WITH {self.operands[1]}"),
+                is_license_valid(self.operands[0]),
+            )
+            return any(results) if is_list_inclusive else all(results)
+        if self.operator == "OR":
+            return any(
+                operand.evaluate(is_license_valid, is_list_inclusive)
+                for operand in self.operands
+            )
+        return all(
+            operand.evaluate(is_license_valid, is_list_inclusive)
+            for operand in self.operands
+        )
+
+
+def _tokenize(expression: str) -> list[str]:
+    """Split an expression into parentheses, operators and license names.
+
+    Consecutive words which are no operators form a single license name,
+    so license names containing spaces (e.g. "Apache 2.0") are supported.
+    """
+    tokens: list[str] = []
+    joinable = False
+    for token in _TOKEN_PATTERN.findall(expression):
+        is_name = token not in "()" and token not in _OPERATOR_SPELLINGS
+        if is_name and joinable:
+            tokens[-1] = f"{tokens[-1]} {token}"
+        elif is_name:
+            tokens.append(token)
+        else:
+            tokens.append(token if token in "()" else token.upper())
+        joinable = is_name
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser for tokenized SPDX expressions."""
+
+    def __init__(self, tokens: list[str]):
+        self.__tokens = tokens
+        self.__position = 0
+
+    def __peek(self) -> str:
+        if self.__position < len(self.__tokens):
+            return self.__tokens[self.__position]
+        return ""
+
+    def __next(self) -> str:
+        token = self.__peek()
+        if token == "":
+            raise ValueError("Unexpected end of license expression")
+        self.__position += 1
+        return token
+
+    def __license_name(self) -> str:
+        token = self.__next()
+        if token in "()" or token in _OPERATORS:
+            raise ValueError(f"Expected license name, got '{token}'")
+        return token
+
+    def parse(self) -> SpdxExpression:
+        expression = self.__or_expression()
+        if self.__peek() != "":
+            raise ValueError(f"Unexpected '{self.__peek()}' in license expression")
+        return expression
+
+    def __or_expression(self) -> SpdxExpression:
+        operands = [self.__and_expression()]
+        while self.__peek() == "OR":
+            self.__next()
+            operands.append(self.__and_expression())
+        return operands[0] if len(operands) == 1 else SpdxExpression("OR", operands)
+
+    def __and_expression(self) -> SpdxExpression:
+        operands = [self.__with_expression()]
+        while self.__peek() == "AND":
+            self.__next()
+            operands.append(self.__with_expression())
+        return operands[0] if len(operands) == 1 else SpdxExpression("AND", operands)
+
+    def __with_expression(self) -> SpdxExpression:
+        if self.__peek() == "(":
+            self.__next()
+            expression = self.__or_expression()
+            if self.__next() != ")":
+                raise ValueError("Expected ')' in license expression")
+            return expression
+
+        license_name = self.__license_name()
+        if self.__peek() == "WITH":
+            self.__next()
+            return SpdxExpression("WITH", [license_name, self.__license_name()])
+        return SpdxExpression("LICENSE", [license_name])
+
+
+@lru_cache(maxsize=4096)
+def parse_expression(expression: str) -> SpdxExpression:
+    """Parse an SPDX license expression.
+
+    Parsed expressions are cached, as dependencies share only a few
+    distinct expressions. The returned expression must not be modified.
+
+    Args:
+        expression (str): The expression, e.g. "MIT OR (Apache-2.0 AND BSD-3-Clause)".
+
+    Raises:
+        ValueError: In case the expression is malformed.
+
+    Returns:
+        SpdxExpression: The root node of the parsed expression.
+    """
+    return _Parser(_tokenize(expression)).parse()
@@ -0,0 +1,221 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Records spans of the work done by the license checker.
+
+The spans are written in the trace event format, which can be opened in
+Perfetto (https://ui.perfetto.dev) or chrome://tracing. Tracing is disabled
+by default, in which case recording a span has next to no costs.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Optional
+
+
+class Tracer:
+    """Collects the spans of all threads of the process."""
+
+    def __init__(self):
+        """Create a new instance, timestamps are relative to its creation."""
+        self.__origin = time.perf_counter()
+        self.__pid = os.getpid()
+        self.__lock = threading.Lock()
+        self.__events: list[dict[str, Any]] = []
+        self.__track_ids: dict[Any, int] = {}
+
+    def __get_track_id(self, track: Any, track_name: str) -> int:
+        """Return the id of a track, adding its name to the trace on first use.
+
+        Must be called with the lock held.
+        """
+        track_id = self.__track_ids.get(track)
+        if track_id is None:
+            track_id = len(self.__track_ids) + 1
+            self.__track_ids[track] = track_id
+            self.__events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self.__pid,
+                    "tid": track_id,
+                    "args": {"name": track_name},
+                }
+            )
+        return track_id
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        track: Optional[str] = None,
+        **args: Any,
+    ) -> None:
+        """Add a span which already ended.
+
+        Args:
+            name (str): The name of the span.
+            category (str): The category of the span, e.g. "subprocess".
+            start (float): The start time as returned by time.perf_counter.
+            end (float): The end time as returned by time.perf_counter.
+            track (Optional[str], optional): The name of the track to show
+                the span on. Defaults to the track of the current thread.
+            **args (Any): JSON serializable details of the span.
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.__origin) * 1_000_000,
+            "dur": (end - start) * 1_000_000,
+            "pid": self.__pid,
+            "args": args,
+        }
+        with self.__lock:
+            if track is None:
+                thread = threading.current_thread()
+                event["tid"] = self.__get_track_id(thread.ident, thread.name)
+            else:
+                event["tid"] = self.__get_track_id(("track", track), track)
+            self.__events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Record a span for the duration of the with block.
+
+        Args:
+            name (str): The name of the span.
+            category (str): The category of the span, e.g. "subprocess".
+            **args (Any): JSON serializable details of the span.
+
+        Yields:
+            dict[str, Any]: The details of the span, which can be extended
+                within the with block, e.g. by the exit code of a process.
+        """
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as err:
+            args["error"] = repr(err)
+            raise
+        finally:
+            self.add_span(name, category, start, time.perf_counter(), **args)
+
+    def get_events(self) -> list[dict[str, Any]]:
+        """Return a copy of all recorded events.
+
+        Returns:
+            list[dict[str, Any]]: The events in the trace event format.
+        """
+        with self.__lock:
+            return list(self.__events)
+
+    def write(self, path: str) -> None:
+        """Write the recorded spans to a trace event JSON file.
+
+        Args:
+            path (str): The path of the trace file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"traceEvents": self.get_events(), "displayTimeUnit": "ms"},
+                file,
+                default=str,
+            )
+
+
+__tracer: Optional[Tracer] = None
+
+
+def enable_tracing() -> Tracer:
+    """Start recording spans, discarding any previously recorded ones.
+
+    Returns:
+        Tracer: The tracer recording the spans.
+    """
+    global __tracer
+    __tracer = Tracer()
+    return __tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """Stop recording spans.
+
+    Returns:
+        Optional[Tracer]: The tracer which recorded the spans, if any.
+    """
+    global __tracer
+    tracer, __tracer = __tracer, None
+    return tracer
+
+
+def is_tracing_enabled() -> bool:
+    """Return True if spans are recorded."""
+    return __tracer is not None
+
+
+@contextlib.contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """Record a span for the duration of the with block, if tracing is enabled.
+
+    Args:
+        name (str): The name of the span.
+        category (str): The category of the span, e.g. "subprocess".
+        **args (Any): JSON serializable details of the span.
+
+    Yields:
+        dict[str, Any]: The details of the span, which can be extended
+            within the with block, e.g. by the exit code of a process.
+    """
+    tracer = __tracer
+    if tracer is None:
+        yield args
+        return
+
+    with tracer.span(name, category, **args) as span_args:
+        yield span_args
+
+
+def add_span(
+    name: str,
+    category: str,
+    start: float,
+    end: float,
+    track: Optional[str] = None,
+    **args: Any,
+) -> None:
+    """Add a span which already ended, if tracing is enabled.
+
+    See Tracer.add_span for the arguments.
+    """
+    tracer = __tracer
+    if tracer is not None:
+        tracer.add_span(name, category, start, end, track, **args)
+
+
+def write_trace(path: str) -> None:
+    """Write the spans recorded so far to a trace event JSON file.
+
+    Args:
+        path (str): The path of the trace file.
+    """
+    tracer = __tracer
+    if tracer is not None:
+        tracer.write(path)
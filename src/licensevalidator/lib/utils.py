@@ -14,6 +14,28 @@
 
 """Provides utility methods required by various modules."""
 
+from typing import Callable
+
+__step_listeners: list[Callable[[str], None]] = []
+
+
+def add_step_listener(listener: Callable[[str], None]) -> None:
+    """Register a function which is called at the start of each step.
+
+    Args:
+        listener (Callable[[str], None]): Called with the step description.
+    """
+    __step_listeners.append(listener)
+
+
+def remove_step_listener(listener: Callable[[str], None]) -> None:
+    """Unregister a function registered by add_step_listener.
+
+    Args:
+        listener (Callable[[str], None]): The registered function.
+    """
+    __step_listeners.remove(listener)
+
 
 def print_step(step_description: str) -> None:
     """Pretty-prints the step description passed to the method to stdout.
@@ -21,6 +43,8 @@ def print_step(step_description: str) -> None:
     Args:
         step_description (str): A textual description of the step.
     """
+    for listener in list(__step_listeners):
+        listener(step_description)
     print("##########################################################")
     print(f"### {step_description:<50} ###")
     print("##########################################################")
@@ -14,15 +14,30 @@
 
 """Methods to read licenses from github workflows."""
 
+import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, TextIO
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 from yaml.loader import SafeLoader
 
 from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.githubcache import GitHubLicenseCache
+from licensevalidator.lib.metrics import increment, record_minimum
+from licensevalidator.lib.tracing import span
+
+# upper bound of concurrent requests to the GitHub API
+MAX_CONCURRENT_REQUESTS = 8
+
+# timeout in seconds for a single request to the GitHub API
+REQUEST_TIMEOUT = 30
+
+# maximum number of repositories resolved by a single GraphQL query
+GRAPHQL_BATCH_SIZE = 100
 
 
 class _ActionInfo:
@@ -151,56 +166,315 @@ def _get_used_actions(project_root: str) -> set[DependencyInfo]:
     return used_actions
 
 
+def _get_api_url() -> str:
+    """Return the base URL of the GitHub REST API.
+
+    Returns:
+        str: The URL provided by the runner or the one of github.com.
+    """
+    return os.environ.get("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+
+
+def _get_graphql_url() -> str:
+    """Return the URL of the GitHub GraphQL API.
+
+    Returns:
+        str: The URL provided by the runner or the one of github.com.
+    """
+    return os.environ.get("GITHUB_GRAPHQL_URL", f"{_get_api_url()}/graphql")
+
+
+def _record_rate_limit(response: requests.Response) -> None:
+    """Record the remaining GitHub API rate limit reported by a response.
+
+    Args:
+        response (requests.Response): The response of the GitHub API.
+    """
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is not None and remaining.isdigit():
+        record_minimum("github.rate_limit_remaining", int(remaining))
+
+
+def _create_session(github_token: str = None) -> requests.Session:
+    """Create a session for requests to the GitHub API.
+
+    The session keeps connections alive and its pool is large enough
+    to serve all concurrent requests.
+
+    Args:
+        github-token (str):
+            GitHub token to do authorized API requests (overcoming rate limiting)
+
+    Returns:
+        requests.Session: The session.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS),
+    )
+    session.headers["Accept"] = "application/vnd.github.v3+json"
+    if github_token is not None:
+        session.headers["authorization"] = github_token
+    return session
+
+
 def __get_license_for_action(
-    action_repo: str, github_token: str = None
+    action_repo: str,
+    session: requests.Session,
+    license_cache: Optional[GitHubLicenseCache] = None,
 ) -> Optional[str]:
     """Get the license for a single github action.
 
     Args:
         action_repo (str): The action repository name
-        github-token (str):
-            GitHub token to do authorized API requests (overcoming rate limiting)
+        session (requests.Session): The session to do the request with.
+        license_cache (Optional[GitHubLicenseCache]): Cache of already known
+            licenses. Expired entries are revalidated by a conditional request.
 
     Returns:
         str: The name of the license, if available.
     """
-    request_headers = {"Accept": "application/vnd.github.v3+json"}
-    if github_token is not None:
-        request_headers["authorization"] = github_token
+    cache_entry = None
+    request_headers = {}
+    if license_cache is not None:
+        cache_entry = license_cache.get(action_repo)
+        if cache_entry is not None and (
+            license_cache.offline or license_cache.is_fresh(cache_entry)
+        ):
+            return cache_entry["license"]
+        if license_cache.offline:
+            print(f"::warning::No cached license of '{action_repo}' (offline mode)")
+            return None
+        request_headers = license_cache.get_conditional_headers(cache_entry)
+
+    try:
+        with span(
+            f"GET /repos/{action_repo}",
+            "github",
+            conditional=len(request_headers) > 0,
+        ) as span_args:
+            increment("github.requests")
+            result = session.get(
+                f"{_get_api_url()}/repos/{action_repo}",
+                headers=request_headers,
+                timeout=REQUEST_TIMEOUT,
+            )
+            span_args["status"] = result.status_code
+        _record_rate_limit(result)
+    except requests.RequestException as err:
+        print("Error getting workflow license info from github.com:")
+        print(f"\t{err}")
+        print(f"\t{action_repo}")
+        return None
+
+    if license_cache is not None and cache_entry is not None:
+        if result.status_code == 304:
+            # not modified - conditional requests do not count
+            # against the rate limit of the GitHub API
+            increment("github.not_modified")
+            license_cache.touch(action_repo)
+            return cache_entry["license"]
 
-    result = requests.get(
-        f"https://api.github.com/repos/{action_repo}",
-        headers=request_headers,
-    )
     try:
-        return result.json()["license"]["name"]
-    except (KeyError, ValueError) as err:
+        license_info = result.json()["license"]
+        license_name = license_info["name"] if license_info is not None else None
+        if license_cache is not None and result.status_code == 200:
+            license_cache.put(
+                action_repo,
+                license_name,
+                result.headers.get("ETag"),
+                result.headers.get("Last-Modified"),
+            )
+        return license_name
+    except (KeyError, TypeError, ValueError) as err:
         print("Error getting workflow license info from github.com:")
         print(f"\t{err}")
         print(f"\t{action_repo}")
-        print(f"\t{result.json()}")
+        print(f"\t{result.text}")
 
     return None
 
 
+def _get_licenses_via_graphql(
+    repositories: list[str], session: requests.Session, github_token: str
+) -> dict[str, Optional[str]]:
+    """Get the licenses of the given repositories using batched GraphQL queries.
+
+    Each query resolves up to GRAPHQL_BATCH_SIZE repositories by using
+    one aliased repository field per repository.
+
+    Args:
+        repositories (list[str]): The names of the repositories.
+        session (requests.Session): The session to do the requests with.
+        github_token (str): The token to authorize the queries with.
+
+    Returns:
+        dict[str, Optional[str]]: Mapping of repository name to license name.
+            Repositories which could not be resolved are not contained.
+    """
+    result: dict[str, Optional[str]] = {}
+    # the GraphQL API expects the bearer scheme, unlike the session's
+    # header used for the REST API
+    headers = {"authorization": f"bearer {github_token.split()[-1]}"}
+    for batch_start in range(0, len(repositories), GRAPHQL_BATCH_SIZE):
+        batch = repositories[batch_start : batch_start + GRAPHQL_BATCH_SIZE]
+
+        fields = []
+        for index, repository in enumerate(batch):
+            owner, _, name = repository.partition("/")
+            fields.append(
+                f"r{index}: repository(owner: {json.dumps(owner)}, "
+                f"name: {json.dumps(name)}) {{ licenseInfo {{ name }} }}"
+            )
+
+        try:
+            with span("POST /graphql", "github", repositories=len(batch)) as span_args:
+                increment("github.requests")
+                response = session.post(
+                    _get_graphql_url(),
+                    json={"query": f"query {{ {' '.join(fields)} }}"},
+                    headers=headers,
+                    timeout=REQUEST_TIMEOUT,
+                )
+                span_args["status"] = response.status_code
+            _record_rate_limit(response)
+            data = response.json().get("data") or {}
+        except (requests.RequestException, AttributeError, ValueError) as err:
+            print(f"Error getting workflow license info via GraphQL: {err}")
+            continue
+
+        for index, repository in enumerate(batch):
+            repository_info = data.get(f"r{index}")
+            if repository_info is None:
+                continue
+            license_info = repository_info.get("licenseInfo")
+            result[repository] = (
+                license_info["name"] if license_info is not None else None
+            )
+
+    return result
+
+
+def _get_licenses_for_repositories(
+    repositories: set[str],
+    github_token: str = None,
+    license_cache: Optional[GitHubLicenseCache] = None,
+) -> dict[str, Optional[str]]:
+    """Get the licenses of the given repositories.
+
+    Licenses not present in the cache are resolved by batched GraphQL
+    queries, if a GitHub token is available (the GraphQL API requires
+    authentication). Expired cache entries and the remaining repositories
+    are looked up concurrently via the REST API over a shared session, so
+    expired entries are revalidated by conditional requests.
+
+    Args:
+        repositories (set[str]): The names of the repositories.
+        github-token (str):
+            GitHub token to do authorized API requests (overcoming rate limiting)
+        license_cache (Optional[GitHubLicenseCache]):
+            Cache of already known licenses. Updated and saved afterwards.
+
+    Returns:
+        dict[str, Optional[str]]: Mapping of repository name to license name.
+    """
+    if len(repositories) == 0:
+        return {}
+
+    result: dict[str, Optional[str]] = {}
+    pending_repositories: list[str] = []
+    for repository in sorted(repositories):
+        cache_entry = license_cache.get(repository) if license_cache else None
+        if cache_entry is not None and (
+            license_cache.offline or license_cache.is_fresh(cache_entry)
+        ):
+            result[repository] = cache_entry["license"]
+        else:
+            pending_repositories.append(repository)
+
+    if license_cache is not None:
+        increment("github.cache_hits", len(result))
+        increment("github.cache_misses", len(pending_repositories))
+
+    if len(pending_repositories) == 0:
+        return result
+
+    with _create_session(github_token) as session:
+        if github_token and not (license_cache and license_cache.offline):
+            # GraphQL responses have no validators, so only cache misses
+            # are queried and expired entries keep their ETag
+            graphql_result = _get_licenses_via_graphql(
+                [
+                    repository
+                    for repository in pending_repositories
+                    if license_cache is None or license_cache.get(repository) is None
+                ],
+                session,
+                github_token,
+            )
+            for repository, license_name in graphql_result.items():
+                result[repository] = license_name
+                if license_cache is not None:
+                    license_cache.put(repository, license_name, None, None)
+            pending_repositories = [
+                repository
+                for repository in pending_repositories
+                if repository not in graphql_result
+            ]
+
+        if len(pending_repositories) > 0:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_CONCURRENT_REQUESTS, len(pending_repositories))
+            ) as executor:
+                result.update(
+                    zip(
+                        pending_repositories,
+                        executor.map(
+                            lambda repository: __get_license_for_action(
+                                repository, session, license_cache
+                            ),
+                            pending_repositories,
+                        ),
+                    )
+                )
+
+    if license_cache is not None and not license_cache.offline:
+        license_cache.save()
+
+    return result
+
+
 def get_workflow_dependencies(
-    project_root: str, github_token: str = None
+    project_root: str,
+    github_token: str = None,
+    license_cache: Optional[GitHubLicenseCache] = None,
 ) -> list[DependencyInfo]:
     """Get all dependencies used by all workflows.
 
+    Each repository is only looked up once, even if several
+    versions of its actions are used.
+
     Args:
         project_root (str): The project root in which to search for workflows.
         github-token (str):
             GitHub token to do authorized API requests (overcoming rate limiting)
+        license_cache (Optional[GitHubLicenseCache]):
+            Cache of already known licenses of the action repositories.
 
     Returns:
         list[DependencyInfo]: A list of all unique dependencies.
     """
+    used_actions = _get_used_actions(project_root)
+    repository_licenses = _get_licenses_for_repositories(
+        {dep_info.name for dep_info in used_actions}, github_token, license_cache
+    )
+
     result: list[DependencyInfo] = []
-    for dep_infos in _get_used_actions(project_root):
-        license_name = __get_license_for_action(dep_infos.name, github_token)
+    for dep_infos in used_actions:
+        license_name = repository_licenses[dep_infos.name]
         if license_name is not None:
-            dep_infos.licenses = [license_name]
+            dep_infos = dep_infos.with_licenses([license_name])
         result.append(dep_infos)
     return result
 
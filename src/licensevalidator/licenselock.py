@@ -0,0 +1,209 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Methods to read and write the license lock file.
+
+The lock file records the hashes of all inputs of the license finding
+along with the found dependencies. As long as the inputs match, the
+dependencies can be taken from the lock file instead of finding them.
+"""
+
+import json
+import os
+from typing import Any, Optional
+
+from licensevalidator.findlicenses import KNOWN_MANIFEST_FILES
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.dependencystore import DependencyStore
+from licensevalidator.lib.incremental import (
+    get_blob_id,
+    get_scan_dir_input_files,
+    get_tool_versions,
+    get_unpinned_requirements,
+    get_workflow_input_files,
+)
+from licensevalidator.lib.tracing import span
+
+LOCK_FILE_VERSION = 2
+
+
+def get_lock_inputs(
+    project_root: str, scan_directories_config: list[Any], aggregate: bool = False
+) -> dict[str, Any]:
+    """Return the inputs of the license finding as recorded in the lock file.
+
+    Args:
+        project_root (str):
+            The path to the project's root.
+        scan_directories_config (list[Any]):
+            A list of directories to scan and their respective configurations.
+        aggregate (bool):
+            True if the license finder runs are aggregated.
+
+    Returns:
+        dict[str, Any]: The versions of the tools, the configuration, the git
+            blob ids of all input files and the unpinned requirements of each
+            scan directory and the git blob ids of the workflows.
+    """
+    return {
+        "aggregate": aggregate,
+        "tools": get_tool_versions(),
+        "scan_dirs": [
+            {
+                "config": scan_directory_config,
+                "input_files": {
+                    path: get_blob_id(os.path.join(project_root, path))
+                    for path in get_scan_dir_input_files(
+                        project_root, scan_directory_config, KNOWN_MANIFEST_FILES
+                    )
+                },
+                "unpinned_requirements": get_unpinned_requirements(
+                    project_root, scan_directory_config
+                ),
+            }
+            for scan_directory_config in scan_directories_config
+        ],
+        "workflows": {
+            path: get_blob_id(os.path.join(project_root, path))
+            for path in get_workflow_input_files(project_root)
+        },
+    }
+
+
+def read_license_lock(path: str) -> Optional[dict[str, Any]]:
+    """Read the lock file at the given path.
+
+    Args:
+        path (str): The path of the lock file.
+
+    Returns:
+        Optional[dict[str, Any]]: The contents of the lock file or None
+            if it is missing, unreadable or of another version.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            lock = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        print(f"::warning::Ignoring unreadable license lock '{path}': {err}")
+        return None
+
+    if not isinstance(lock, dict) or lock.get("version") != LOCK_FILE_VERSION:
+        print(f"::warning::Ignoring license lock '{path}' of unsupported version")
+        return None
+    return lock
+
+
+def has_unpinned_requirements(inputs: dict[str, Any]) -> bool:
+    """Return True if any scan directory has requirements which are not pinned.
+
+    The dependencies resolved for such requirements may change without any
+    change of the inputs, so a lock must not be trusted for them.
+
+    Args:
+        inputs (dict[str, Any]): The current inputs, see get_lock_inputs.
+    """
+    return any(scan_dir["unpinned_requirements"] for scan_dir in inputs["scan_dirs"])
+
+
+def is_license_lock_up_to_date(
+    lock: Optional[dict[str, Any]], inputs: dict[str, Any]
+) -> bool:
+    """Return True if the lock was created from the given inputs and can be
+    trusted, i.e. all requirements are pinned.
+
+    Args:
+        lock (Optional[dict[str, Any]]): The contents of the lock file.
+        inputs (dict[str, Any]): The current inputs, see get_lock_inputs.
+    """
+    return (
+        lock is not None
+        and lock.get("inputs") == inputs
+        and not has_unpinned_requirements(inputs)
+    )
+
+
+def get_locked_dependencies(lock: dict[str, Any]) -> DependencyStore:
+    """Return the dependencies recorded in the lock.
+
+    Args:
+        lock (dict[str, Any]): The contents of the lock file.
+
+    Returns:
+        DependencyStore: The recorded dependencies.
+    """
+    result = DependencyStore()
+    for origin_entry in lock.get("origins", []):
+        for name, version, licenses, scan_dirs in origin_entry["dependencies"]:
+            result.add(
+                origin_entry["origin"],
+                [DependencyInfo(name, version, licenses)],
+                scan_dirs,
+            )
+    return result
+
+
+def write_license_lock(
+    path: str,
+    inputs: dict[str, Any],
+    origin_to_deps: DependencyStore,
+) -> bool:
+    """Write the lock file, unless its contents would not change.
+
+    Args:
+        path (str): The path of the lock file.
+        inputs (dict[str, Any]): The inputs, see get_lock_inputs.
+        origin_to_deps (DependencyStore): The dependencies found for the inputs.
+
+    Returns:
+        bool: True if the lock file was written.
+    """
+    lock = {
+        "version": LOCK_FILE_VERSION,
+        "inputs": inputs,
+        # a list keeps the order of the origins
+        "origins": [
+            {
+                "origin": origin,
+                "dependencies": [
+                    [
+                        dep_info.name,
+                        dep_info.version,
+                        list(dep_info.licenses),
+                        origin_to_deps.get_scan_dirs(
+                            origin, dep_info.name, dep_info.version
+                        ),
+                    ]
+                    for dep_info in dep_infos
+                ],
+            }
+            for origin, dep_infos in origin_to_deps.items()
+        ],
+    }
+    content = json.dumps(lock, indent=2, sort_keys=True) + "\n"
+
+    with span("write_license_lock", "output", path=path) as span_args:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                if file.read() == content:
+                    span_args["changed"] = False
+                    return False
+        except OSError:
+            pass
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        span_args["changed"] = True
+        return True
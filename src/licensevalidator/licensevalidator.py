@@ -15,12 +15,29 @@
 """Entry point for the license validator."""
 
 import os
-from typing import Any
+from concurrent.futures import Executor
+from typing import Any, Optional
 
-from licensevalidator.checklicenses import check_licenses, read_license_list
-from licensevalidator.findlicenses import find_licenses
-from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.checklicenses import (
+    LicenseValidator,
+    check_licenses,
+    read_license_list,
+)
+from licensevalidator.findlicenses import find_licenses, get_license_cache_file
+from licensevalidator.lib.dependencydelta import DependencyDelta, get_dependency_delta
+from licensevalidator.lib.dependencystore import DependencyStore
+from licensevalidator.lib.githubcache import DEFAULT_TTL, GitHubLicenseCache
+from licensevalidator.lib.metrics import phase
 from licensevalidator.lib.utils import print_step
+from licensevalidator.lib.workflowlicenses import get_workflow_dependencies
+from licensevalidator.licenselock import (
+    get_lock_inputs,
+    get_locked_dependencies,
+    has_unpinned_requirements,
+    is_license_lock_up_to_date,
+    read_license_lock,
+    write_license_lock,
+)
 
 
 def validate_used_licenses(
@@ -28,7 +45,17 @@ def validate_used_licenses(
     scan_directories_config: list[Any],
     whitelist_file_path: str,
     github_token: str = None,
-) -> tuple[bool, dict[str, list[DependencyInfo]]]:
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    github_cache_ttl: Optional[float] = None,
+    github_offline: bool = False,
+    aggregate: bool = False,
+    incremental_base_ref: Optional[str] = None,
+    license_lock_file: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    license_cache: Optional[GitHubLicenseCache] = None,
+    validator: Optional[LicenseValidator] = None,
+) -> tuple[bool, DependencyStore]:
     """Run the license validation.
 
     Args:
@@ -41,15 +68,48 @@ def validate_used_licenses(
             (relative to project root).
         github-token (str):
             GitHub token to do authorized API requests (overcoming rate limiting)
+        max_workers (Optional[int]):
+            Maximum number of scan jobs executed concurrently.
+            Defaults to the number of CPU cores.
+        cache_dir (Optional[str]):
+            Directory of the persistent result cache
+            (relative to project root). If not set, no results are cached.
+        github_cache_ttl (Optional[float]):
+            Time in seconds for which cached licenses of workflow actions are
+            used without revalidation. Defaults to one day.
+        github_offline (bool):
+            If set to True, licenses of workflow actions are only read from
+            the cache and the GitHub API is not contacted.
+        aggregate (bool):
+            If set to True, the license finder is executed once per group
+            of compatible scan directories instead of once per
+            directory, language and requirement file.
+        incremental_base_ref (Optional[str]):
+            If set, only the scan directories and workflows whose inputs
+            changed since this git ref are scanned again. Requires cache_dir.
+        license_lock_file (Optional[str]):
+            Path to the license lock file (relative to project root).
+            If the inputs recorded in it match the current ones, the
+            dependencies are taken from it instead of finding them.
+            Otherwise, it is updated with the found dependencies.
+        executor (Optional[Executor]):
+            Pool executing the scan jobs, e.g. one kept alive across runs.
+            If not given, a pool is created for this run.
+        license_cache (Optional[GitHubLicenseCache]):
+            Cache of the licenses of workflow actions, e.g. one kept in
+            memory across runs. If not given, it is read from cache_dir.
+        validator (Optional[LicenseValidator]):
+            Validator for the licenses of the whitelist, e.g. one kept in
+            memory across runs. If not given, the whitelist is read.
 
     Raises:
         FileNotFoundError: In case the whitelist file is not present.
 
     Returns:
-         tuple[bool, dict[str, list[DependencyInfo]]]:
+         tuple[bool, DependencyStore]:
             A tuple consisting of a pair of
             - True if all used licenses are whitelisted, False otherwise.
-            - Dict containing mappings from
+            - Store containing mappings from
               origin -> list of dependencies. Where origin can be
               Python, Github Workflows or other programming/markup languages.
     """
@@ -59,17 +119,167 @@ def validate_used_licenses(
             f'Whitelist file "{abs_path_to_whitelist}" does not exist!'
         )
 
-    print_step("Finding licenses")
-    origin_vs_deps = find_licenses(project_root, scan_directories_config, github_token)
+    if cache_dir:
+        cache_dir = os.path.join(project_root, cache_dir)
 
-    print_step("Checking licenses")
-    whitelisted_licenses = read_license_list(abs_path_to_whitelist)
+    origin_vs_deps: Optional[DependencyStore] = None
+    lock_inputs = None
+    if license_lock_file:
+        license_lock_file = os.path.join(project_root, license_lock_file)
+        print_step("Checking license lock")
+        with phase("Checking license lock"):
+            lock_inputs = get_lock_inputs(
+                project_root, scan_directories_config, aggregate
+            )
+            lock = read_license_lock(license_lock_file)
+        if is_license_lock_up_to_date(lock, lock_inputs):
+            print("License lock is up to date, skipping finding licenses")
+            origin_vs_deps = get_locked_dependencies(lock)
+        elif has_unpinned_requirements(lock_inputs):
+            print("License lock is not used, as not all requirements are pinned")
+        else:
+            print("License lock is missing or outdated")
+
+    if validator is None:
+        validator = LicenseValidator(read_license_list(abs_path_to_whitelist), True)
+
+    if origin_vs_deps is None:
+        print_step("Finding licenses")
+        with phase("Finding licenses"):
+            origin_vs_deps = find_licenses(
+                project_root,
+                scan_directories_config,
+                github_token,
+                max_workers,
+                cache_dir,
+                github_cache_ttl,
+                github_offline,
+                aggregate,
+                incremental_base_ref,
+                executor,
+                license_cache,
+            )
 
+    if lock_inputs is not None and write_license_lock(
+        license_lock_file, lock_inputs, origin_vs_deps
+    ):
+        print(f"Updated license lock '{license_lock_file}'")
+
+    print_step("Checking licenses")
     result = True
-    for origin, dependencies in origin_vs_deps.items():
-        result = check_licenses(origin, dependencies, whitelisted_licenses) and result
+    with phase("Checking licenses"):
+        for origin, dependencies in origin_vs_deps.items():
+            result = check_licenses(origin, dependencies, validator) and result
 
     return (
         result,
         origin_vs_deps,
     )
+
+
+def validate_license_delta(
+    project_root: str,
+    scan_directories_config: list[Any],
+    whitelist_file_path: str,
+    base_ref: str,
+    head_ref: str = "HEAD",
+    github_token: str = None,
+    cache_dir: Optional[str] = None,
+    github_cache_ttl: Optional[float] = None,
+    github_offline: bool = False,
+) -> tuple[bool, DependencyDelta]:
+    """Run the license validation only for dependencies new since a revision.
+
+    The locked dependencies of both revisions are compared and only the
+    licenses of added dependencies and of new versions of changed
+    dependencies are looked up and checked. The actions used by the
+    workflows are not locked, so all of them are checked.
+
+    Args:
+        project_root (str):
+            The path to the project root, which must be a git repository.
+        scan_directories_config (list[Any]):
+            A list of directories to scan and their respective configurations.
+        whitelist_file_path (str):
+            The path to the whitelist file
+            (relative to project root).
+        base_ref (str):
+            The base revision, e.g. the base SHA of a PR.
+        head_ref (str):
+            The head revision. Defaults to "HEAD".
+        github-token (str):
+            GitHub token to do authorized API requests (overcoming rate limiting)
+        cache_dir (Optional[str]):
+            Directory of the persistent result cache
+            (relative to project root), holding the cached licenses
+            of workflow actions.
+        github_cache_ttl (Optional[float]):
+            Time in seconds for which cached licenses of workflow actions are
+            used without revalidation. Defaults to one day.
+        github_offline (bool):
+            If set to True, licenses of workflow actions are only read from
+            the cache and the GitHub API is not contacted.
+
+    Raises:
+        FileNotFoundError: In case the whitelist file is not present.
+        ValueError: In case a requirement file is not fully pinned.
+
+    Returns:
+         tuple[bool, DependencyDelta]:
+            A tuple consisting of a pair of
+            - True if all new licenses are whitelisted, False otherwise.
+            - The added, changed and removed dependencies.
+    """
+    abs_path_to_whitelist = os.path.join(project_root, whitelist_file_path)
+    if not os.path.isfile(abs_path_to_whitelist):
+        raise FileNotFoundError(
+            f'Whitelist file "{abs_path_to_whitelist}" does not exist!'
+        )
+
+    print_step(f"Finding dependency changes since '{base_ref}'")
+    with phase("Finding dependency changes", base_ref=base_ref):
+        delta = get_dependency_delta(
+            project_root, scan_directories_config, base_ref, head_ref
+        )
+    for origin, dependencies in delta.removed.items():
+        for dep_info in dependencies:
+            print(f'Removed {origin} dependency "{dep_info.name}" {dep_info.version}')
+    for origin, dependencies in delta.changed.items():
+        for dep_info in dependencies:
+            previous_versions = ", ".join(
+                delta.previous_versions.get((origin, dep_info.name), [])
+            )
+            print(
+                f'Changed {origin} dependency "{dep_info.name}" '
+                f"from {previous_versions} to {dep_info.version}"
+            )
+
+    print_step("Finding licenses of workflow actions")
+    license_cache = None
+    if cache_dir:
+        license_cache = GitHubLicenseCache(
+            get_license_cache_file(os.path.join(project_root, cache_dir)),
+            github_cache_ttl if github_cache_ttl is not None else DEFAULT_TTL,
+            github_offline,
+        )
+    with phase("Finding licenses of workflow actions"):
+        workflow_dependencies = get_workflow_dependencies(
+            project_root, github_token, license_cache
+        )
+
+    print_step("Checking licenses of new dependencies")
+    validator = LicenseValidator(read_license_list(abs_path_to_whitelist), True)
+
+    result = True
+    with phase("Checking licenses"):
+        for origin, dependencies in delta.get_new_dependencies().items():
+            result = check_licenses(origin, dependencies, validator) and result
+        if len(workflow_dependencies) > 0:
+            result = (
+                check_licenses("Workflows", workflow_dependencies, validator) and result
+            )
+
+    return (
+        result,
+        delta,
+    )
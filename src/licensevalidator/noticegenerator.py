@@ -14,28 +14,123 @@
 
 """Methods to generate a notice file from given dependencies."""
 
+import difflib
+from collections.abc import Iterator, Mapping
+from typing import Optional
+
 from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.tracing import span
+
+
+def iter_notice_lines(
+    origin_to_dependencies: Mapping[str, list[DependencyInfo]],
+) -> Iterator[str]:
+    """Iterate over the lines of the notice for the given dependencies.
+
+    Args:
+        origin_to_dependencies (Mapping[str, list[DependencyInfo]]):
+            Maps the origin (language name or path) to the list of
+            dependencies used.
+
+    Yields:
+        str: The lines of the notice file, including the line breaks.
+    """
+    yield "# Licenses Notice\n"
+    yield "*Note*: This file is auto-generated. Do not modify it manually.\n"
+    for origin, dep_infos in origin_to_dependencies.items():
+        yield f"## {origin}\n"
+        yield "| Dependency | Version | License |\n"
+        yield "|:-----------|:-------:|--------:|\n"
+        for dep_info in dep_infos:
+            licenses_str = "<br/>".join(dep_info.licenses)
+            yield f"|{dep_info.name}|{dep_info.version}|{licenses_str}|\n"
+
+
+def render_notice(origin_to_dependencies: Mapping[str, list[DependencyInfo]]) -> str:
+    """Render the notice for the given dependencies.
+
+    Args:
+        origin_to_dependencies (Mapping[str, list[DependencyInfo]]):
+            Maps the origin (language name or path) to the list of
+            dependencies used.
+
+    Returns:
+        str: The contents of the notice file.
+    """
+    return "".join(iter_notice_lines(origin_to_dependencies))
 
 
 def generate_notice_file(
-    origin_to_dependencies: dict[str, list[DependencyInfo]], path_to_notice_file: str
+    origin_to_dependencies: Mapping[str, list[DependencyInfo]],
+    path_to_notice_file: str,
 ) -> None:
     """Generate a notice file from the given dependencies.
 
     Args:
-        origin_to_dependencies (dict[str, list[DependencyInfo]]):
+        origin_to_dependencies (Mapping[str, list[DependencyInfo]]):
             Maps the origin (language name or path) to the list of
             dependencies used.
         path_to_notice_file (str):
             The path at which to output the notice file.
     """
-    with open(path_to_notice_file, "w", encoding="utf-8") as file:
-        file.write("# Licenses Notice\n")
-        file.write("*Note*: This file is auto-generated. Do not modify it manually.\n")
-        for origin, dep_infos in origin_to_dependencies.items():
-            file.write(f"## {origin}\n")
-            file.write("| Dependency | Version | License |\n")
-            file.write("|:-----------|:-------:|--------:|\n")
-            for dep_info in dep_infos:
-                licenses_str = "<br/>".join(dep_info.licenses)
-                file.write(f"|{dep_info.name}|{dep_info.version}|{licenses_str}|\n")
+    with span("generate_notice_file", "output", path=path_to_notice_file):
+        with open(path_to_notice_file, "w", encoding="utf-8") as file:
+            file.writelines(iter_notice_lines(origin_to_dependencies))
+
+
+def update_notice_file(
+    origin_to_dependencies: Mapping[str, list[DependencyInfo]],
+    path_to_notice_file: str,
+    notice_file_name: Optional[str] = None,
+) -> Optional[str]:
+    """Update the notice file, if its contents differ from the rendered notice.
+
+    The file is only written if its contents change. Line endings are
+    ignored, like git does for files normalized on checkout.
+
+    Args:
+        origin_to_dependencies (Mapping[str, list[DependencyInfo]]):
+            Maps the origin (language name or path) to the list of
+            dependencies used.
+        path_to_notice_file (str):
+            The path of the notice file.
+        notice_file_name (Optional[str]):
+            The name of the notice file used in the diff.
+            Defaults to the path of the notice file.
+
+    Returns:
+        Optional[str]: A unified diff from the previous to the new contents,
+            from /dev/null if the file did not exist, or None if the
+            contents did not change.
+    """
+    with span("update_notice_file", "output", path=path_to_notice_file) as span_args:
+        new_content = render_notice(origin_to_dependencies).encode("utf-8")
+        old_content: Optional[bytes] = None
+        try:
+            with open(path_to_notice_file, "rb") as file:
+                # the file may be checked out with CRLF line endings, e.g.
+                # by core.autocrlf or .gitattributes, which git ignores
+                old_content = file.read().replace(b"\r\n", b"\n")
+        except FileNotFoundError:
+            pass
+
+        span_args["changed"] = old_content != new_content
+        if old_content == new_content:
+            return None
+
+        with open(path_to_notice_file, "wb") as file:
+            file.write(new_content)
+
+    name = notice_file_name or path_to_notice_file
+    return "".join(
+        # mark a missing newline at the end of file like git does
+        line if line.endswith("\n") else f"{line}\n\\ No newline at end of file\n"
+        for line in difflib.unified_diff(
+            (old_content or b"")
+            .decode("utf-8", errors="replace")
+            .splitlines(keepends=True),
+            new_content.decode("utf-8").splitlines(keepends=True),
+            fromfile=f"a/{name}" if old_content is not None else "/dev/null",
+            tofile=f"b/{name}",
+        )
+    )
@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for cargoscanner."""
+
+import pytest
+
+from licensevalidator.lib.cargoscanner import scan_cargo_dependencies
+from licensevalidator.lib.dependency import DependencyInfo
+
+CARGO_LOCK = """
+version = 3
+
+[[package]]
+name = "my-app"
+version = "0.1.0"
+dependencies = ["futures", "protobuf"]
+
+[[package]]
+name = "my-lib"
+version = "0.2.0"
+
+[[package]]
+name = "protobuf"
+version = "3.4.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+
+[[package]]
+name = "futures"
+version = "0.3.30"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+
+[[package]]
+name = "vendored"
+version = "1.0.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+
+[[package]]
+name = "unknown"
+version = "1.0.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+"""
+
+
+def _write_manifest(directory, name: str, version: str, license_line: str) -> None:
+    directory.mkdir(parents=True)
+    (directory / "Cargo.toml").write_text(
+        f'[package]\nname = "{name}"\nversion = "{version}"\n{license_line}\n',
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def cargo_project(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "Cargo.lock").write_text(CARGO_LOCK, encoding="utf-8")
+    (project / "Cargo.toml").write_text(
+        '[package]\nname = "my-app"\nversion = "0.1.0"\nlicense = "Apache-2.0"\n'
+        '[workspace]\nmembers = ["crates/*"]\n'
+        '[workspace.package]\nlicense = "EPL-2.0"\n',
+        encoding="utf-8",
+    )
+    _write_manifest(
+        project / "crates" / "my-lib", "my-lib", "0.2.0", "license.workspace = true"
+    )
+    _write_manifest(
+        project / "vendor" / "vendored", "vendored", "1.0.0", 'license = "ISC"'
+    )
+
+    registry = tmp_path / "cargo" / "registry" / "src" / "index.crates.io-1234"
+    _write_manifest(registry / "protobuf-3.4.0", "protobuf", "3.4.0", 'license = "MIT"')
+    _write_manifest(
+        registry / "futures-0.3.30",
+        "futures",
+        "0.3.30",
+        'license = "MIT/Apache-2.0"',
+    )
+    return project
+
+
+def test_scan_cargo_dependencies(cargo_project, tmp_path):
+    """Test reading all licenses from registry, vendor dir and workspace."""
+    dependencies = scan_cargo_dependencies(
+        str(cargo_project), cargo_home=str(tmp_path / "cargo")
+    )
+
+    assert dependencies == [
+        DependencyInfo("futures", "0.3.30", ["MIT OR Apache-2.0"]),
+        DependencyInfo("my-app", "0.1.0", ["Apache-2.0"]),
+        DependencyInfo("my-lib", "0.2.0", ["EPL-2.0"]),
+        DependencyInfo("protobuf", "3.4.0", ["MIT"]),
+        DependencyInfo("unknown", "1.0.0", []),
+        DependencyInfo("vendored", "1.0.0", ["ISC"]),
+    ]
+
+
+def test_scan_without_lock_file(tmp_path):
+    """Test that a missing Cargo.lock is reported."""
+    with pytest.raises(FileNotFoundError):
+        scan_cargo_dependencies(str(tmp_path), cargo_home=str(tmp_path))
@@ -15,6 +15,7 @@
 """Unit tests for dependency."""
 
 import pytest
+
 from licensevalidator.lib.dependency import DependencyInfo
 
 
@@ -40,3 +41,33 @@ def test_inequality(test_input: DependencyInfo):
     dep = DependencyInfo("Dep 1", "Version 1", ["License 1"])
 
     assert dep != test_input
+
+
+def test_licenses_are_immutable_tuple():
+    """Test that licenses are stored as tuple and instances are immutable."""
+    dep = DependencyInfo("Dep 1", "Version 1", ["License 1"])
+
+    assert dep.licenses == ("License 1",)
+    assert DependencyInfo("Dep 1", "Version 1", "License 1") == dep
+    with pytest.raises(AttributeError):
+        dep.licenses = ("License 2",)
+    with pytest.raises(AttributeError):
+        dep.other = "value"
+
+
+def test_with_licenses():
+    """Test that a copy with other licenses can be created."""
+    dep = DependencyInfo("Dep 1", "Version 1", [])
+
+    assert dep.with_licenses(["License 1"]) == DependencyInfo(
+        "Dep 1", "Version 1", ["License 1"]
+    )
+    assert dep.licenses == ()
+
+
+def test_from_rows():
+    """Test the creation from parsed rows."""
+    deps = DependencyInfo.from_rows([("Dep 1", "Version 1", ["A", "B"])])
+
+    assert deps == [DependencyInfo("Dep 1", "Version 1", ("A", "B"))]
+    assert len({deps[0], DependencyInfo("Dep 1", "Version 1", ["A", "B"])}) == 1
@@ -0,0 +1,130 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for dependencydelta."""
+
+import json
+import zipfile
+
+import git
+import pytest
+
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.dependencydelta import get_dependency_delta
+
+
+def _cargo_lock(*packages: tuple[str, str]) -> str:
+    return "".join(
+        f'[[package]]\nname = "{name}"\nversion = "{version}"\n'
+        'source = "registry+https://github.com/rust-lang/crates.io-index"\n'
+        for name, version in packages
+    )
+
+
+def _package_lock(*packages: tuple[str, str, str]) -> str:
+    return json.dumps(
+        {
+            "lockfileVersion": 3,
+            "packages": {
+                "": {"name": "app"},
+                **{
+                    f"node_modules/{name}": {"version": version, "license": license}
+                    for name, version, license in packages
+                },
+            },
+        }
+    )
+
+
+def _commit(repo: git.Repo, files: dict[str, str]) -> str:
+    for path, content in files.items():
+        with open(f"{repo.working_tree_dir}/{path}", "w", encoding="utf-8") as file:
+            file.write(content)
+    repo.index.add(list(files.keys()))
+    return repo.index.commit("Update dependencies").hexsha
+
+
+def test_delta_between_revisions(tmp_path):
+    """Tests that only new dependencies are looked up and reported."""
+    repo = git.Repo.init(tmp_path)
+    base_ref = _commit(
+        repo,
+        {
+            "Cargo.lock": _cargo_lock(("serde", "1.0.0"), ("libc", "0.2.0")),
+            "package-lock.json": _package_lock(("left-pad", "1.0.0", "WTFPL")),
+            "requirements.txt": "six==1.16.0\nidna==3.6\n",
+        },
+    )
+    _commit(
+        repo,
+        {
+            "Cargo.lock": _cargo_lock(("serde", "1.0.1"), ("libc", "0.2.0")),
+            "package-lock.json": _package_lock(
+                ("left-pad", "1.0.0", "WTFPL"), ("typescript", "5.0.0", "Apache-2.0")
+            ),
+            "requirements.txt": "six==1.16.0\n",
+        },
+    )
+
+    # metadata of the new dependencies is only present in the working tree
+    crate_dir = tmp_path / "vendor" / "serde"
+    crate_dir.mkdir(parents=True)
+    (crate_dir / "Cargo.toml").write_text(
+        '[package]\nname = "serde"\nversion = "1.0.1"\nlicense = "MIT/Apache-2.0"\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "wheels").mkdir()
+    with zipfile.ZipFile(tmp_path / "wheels" / "six.whl", "w") as wheel:
+        wheel.writestr(
+            "six-1.16.0.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: six\nVersion: 1.16.0\nLicense: MIT\n",
+        )
+
+    delta = get_dependency_delta(
+        str(tmp_path),
+        [{"path": ".", "python-metadata-paths": ["wheels"]}],
+        base_ref,
+    )
+
+    assert delta.added == {
+        "JavaScript": [DependencyInfo("typescript", "5.0.0", ["Apache-2.0"])]
+    }
+    assert delta.changed == {
+        "Rust": [DependencyInfo("serde", "1.0.1", ["MIT OR Apache-2.0"])]
+    }
+    assert delta.previous_versions == {("Rust", "serde"): ["1.0.0"]}
+    assert delta.removed == {"Python": [DependencyInfo("idna", "3.6", [])]}
+    assert list(delta.get_new_dependencies().keys()) == ["JavaScript", "Rust"]
+
+
+def test_delta_refuses_unpinned_requirements(tmp_path):
+    """Tests that unpinned requirements are refused, as their version can
+    change without any change of the requirement file."""
+    repo = git.Repo.init(tmp_path)
+    base_ref = _commit(repo, {"requirements.txt": "six==1.16.0\n"})
+    _commit(repo, {"requirements.txt": "six==1.16.0\nidna>=3\n"})
+
+    with pytest.raises(ValueError, match="'idna'"):
+        get_dependency_delta(str(tmp_path), [{"path": "."}], base_ref)
+
+
+def test_delta_requires_python_metadata_paths(tmp_path):
+    """Tests that new Python dependencies are not looked up in the packages
+    of the interpreter running the check."""
+    repo = git.Repo.init(tmp_path)
+    base_ref = _commit(repo, {"requirements.txt": "six==1.16.0\n"})
+    _commit(repo, {"requirements.txt": "six==1.16.0\npytest==8.0.0\n"})
+
+    with pytest.raises(ValueError, match="python-metadata-paths"):
+        get_dependency_delta(str(tmp_path), [{"path": "."}], base_ref)
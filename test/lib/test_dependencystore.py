@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for dependencystore."""
+
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.dependencystore import DependencyStore
+
+
+def test_store_sorts_and_merges():
+    """Tests the sorted iteration and the merge of duplicate dependencies."""
+    store = DependencyStore()
+    store.add(
+        "Rust",
+        [DependencyInfo("serde", "1.0", ["MIT"]), DependencyInfo("Anyhow", "1.0", [])],
+        ["a"],
+    )
+    store.add("Python", [DependencyInfo("six", "1.16.0", ["MIT"])], ["a"])
+    store.add("Rust", [DependencyInfo("serde", "1.0", ["Apache-2.0"])], ["b"])
+    store.add("JavaScript", [], ["b"])
+
+    assert list(store) == ["Rust", "Python"]
+    assert store["Rust"] == [
+        DependencyInfo("Anyhow", "1.0", []),
+        DependencyInfo("serde", "1.0", ["MIT", "Apache-2.0"]),
+    ]
+    assert store.get_dependency("Rust", "serde", "1.0") == store["Rust"][1]
+    assert store.get_dependency("Rust", "serde", "2.0") is None
+    assert store.get_scan_dirs("Rust", "serde", "1.0") == ["a", "b"]
+    assert store == {"Rust": store["Rust"], "Python": store["Python"]}
@@ -14,7 +14,18 @@
 
 """Unit tests for licensefinder."""
 
-from licensevalidator.lib.licensefinder import execute_license_finder
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from licensevalidator.lib import licensefinder
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.licensefinder import (
+    execute_aggregated_license_finder,
+    execute_license_finder,
+)
+from licensevalidator.lib.resultcache import ResultCache
 
 
 def test_execution_python():
@@ -32,17 +43,153 @@ def test_execution_python():
     # idna required by yarl
     assert result[0].name == "idna"
     assert result[0].version == "3.7"
-    assert result[0].licenses == ["BSD"]
+    assert result[0].licenses == ("BSD",)
 
     # multidict required by yarl
     assert result[1].name == "multidict"
     assert result[1].version == "6.0.5"
-    assert result[1].licenses == ["Apache 2.0"]
+    assert result[1].licenses == ("Apache 2.0",)
 
     assert result[2].name == "six"
     assert result[2].version == "1.16.0"
-    assert result[2].licenses == ["MIT"]
+    assert result[2].licenses == ("MIT",)
 
     assert result[3].name == "yarl"
     assert result[3].version == "1.9.4"
-    assert result[3].licenses == ["Apache 2.0"]
+    assert result[3].licenses == ("Apache 2.0",)
+
+
+def test_cached_execution_skips_license_finder(tmp_path, monkeypatch):
+    """Tests that a cache hit does not execute the license finder."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "requirements.txt").write_text("-r base.txt\n", encoding="utf-8")
+    (project_dir / "base.txt").write_text("six==1.16.0\n", encoding="utf-8")
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    executions = []
+
+    def fake_run(process_args, **kwargs):
+        executions.append(process_args)
+        save_path = process_args[2][len("--save=") :]
+        with open(save_path, "w", encoding="utf-8") as file:
+            file.write('six,1.16.0,"MIT"\n')
+
+    monkeypatch.setattr(licensefinder.subprocess, "run", fake_run)
+    monkeypatch.setattr(licensefinder, "get_license_finder_version", lambda: "7.2.1")
+
+    for _ in range(2):
+        result = execute_license_finder(
+            str(project_dir), package_managers=["pip"], result_cache=cache
+        )
+        assert result == [DependencyInfo("six", "1.16.0", ["MIT"])]
+    assert len(executions) == 1
+
+    # changing an included requirements file invalidates the entry
+    (project_dir / "base.txt").write_text("six==1.17.0\n", encoding="utf-8")
+    execute_license_finder(
+        str(project_dir), package_managers=["pip"], result_cache=cache
+    )
+    assert len(executions) == 2
+
+
+def test_unpinned_requirements_are_not_cached(tmp_path, monkeypatch):
+    """Tests that the result for unpinned requirements is never reused, as
+    pip may resolve another version without any change of the files."""
+    (tmp_path / "requirements.txt").write_text("six>=1.0\n", encoding="utf-8")
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    executions = []
+
+    def fake_run(process_args, **kwargs):
+        executions.append(process_args)
+        save_path = process_args[2][len("--save=") :]
+        with open(save_path, "w", encoding="utf-8") as file:
+            file.write('six,1.16.0,"MIT"\n')
+
+    monkeypatch.setattr(licensefinder.subprocess, "run", fake_run)
+    monkeypatch.setattr(licensefinder, "get_license_finder_version", lambda: "7.2.1")
+
+    for _ in range(2):
+        execute_license_finder(
+            str(tmp_path), package_managers=["pip"], result_cache=cache
+        )
+    assert len(executions) == 2
+
+
+def test_aggregated_execution_runs_license_finder_once(tmp_path, monkeypatch):
+    """Tests that all dirs and requirement files are scanned by a single run."""
+    requirement_files = []
+    for name in ["service", "tool"]:
+        (tmp_path / name).mkdir()
+        requirement_file = tmp_path / name / "requirements.txt"
+        requirement_file.write_text("six==1.16.0\n", encoding="utf-8")
+        requirement_files.append(str(requirement_file))
+
+    executions = []
+
+    def fake_run(process_args, **kwargs):
+        executions.append(process_args)
+        # the merged requirements file is scanned in a directory of its own
+        requirements_dir = process_args[-1]
+        with open(
+            os.path.join(requirements_dir, "merged-requirements.txt"), encoding="utf-8"
+        ) as file:
+            assert file.read().splitlines() == [f"-r {p}" for p in requirement_files]
+
+        save_path = process_args[2][len("--save=") :]
+        with open(save_path, "w", encoding="utf-8") as file:
+            file.write('six,1.16.0,"MIT",pip\n')
+            file.write('serde,1.0.0,"MIT,Apache-2.0",cargo\n')
+
+    monkeypatch.setattr(licensefinder.subprocess, "run", fake_run)
+    monkeypatch.setattr(licensefinder, "get_license_finder_version", lambda: "7.2.1")
+
+    result = execute_aggregated_license_finder(
+        [str(tmp_path / "service"), str(tmp_path / "tool")],
+        requirement_files,
+        package_managers=["pip", "cargo"],
+    )
+
+    assert len(executions) == 1
+    assert "--enabled-package-managers" in executions[0]
+    assert result == {
+        "cargo": [DependencyInfo("serde", "1.0.0", ["MIT", "Apache-2.0"])],
+        "pip": [DependencyInfo("six", "1.16.0", ["MIT"])],
+    }
+
+
+def test_preparing_pip_is_serialized(tmp_path, monkeypatch):
+    """Tests that executions preparing pip never run concurrently, as they
+    install into the same interpreter, while other executions may."""
+    lock = threading.Lock()
+    running = {"pip": 0, "cargo": 0}
+    max_running = {"pip": 0, "cargo": 0}
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_run(process_args, **kwargs):
+        package_manager = process_args[-1].rsplit("=", 1)[-1]
+        with lock:
+            running[package_manager] += 1
+            max_running[package_manager] = max(
+                max_running[package_manager], running[package_manager]
+            )
+        if package_manager == "cargo":
+            # only passes if both cargo executions run at the same time
+            barrier.wait()
+        time.sleep(0.01)
+        with lock:
+            running[package_manager] -= 1
+
+    monkeypatch.setattr(licensefinder.subprocess, "run", fake_run)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        jobs = [
+            executor.submit(
+                execute_license_finder, str(tmp_path), package_managers=[manager]
+            )
+            for manager in ["pip", "pip", "cargo", "cargo"]
+        ]
+        for job in jobs:
+            job.result()
+
+    assert max_running == {"pip": 1, "cargo": 2}
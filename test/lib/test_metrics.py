@@ -0,0 +1,113 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for metrics."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from licensevalidator.lib import metrics
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.resultcache import ResultCache
+
+
+@pytest.fixture
+def run_metrics():
+    yield metrics.reset_metrics()
+    metrics.reset_metrics()
+
+
+def test_metrics_are_nested_by_name(run_metrics):
+    """Test that dotted metric names form nested dicts."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in executor.map(
+            lambda _: metrics.increment("github.requests"), range(100)
+        ):
+            pass
+    metrics.record_minimum("github.rate_limit_remaining", 4990)
+    metrics.record_minimum("github.rate_limit_remaining", 4980)
+    metrics.record_minimum("github.rate_limit_remaining", 4985)
+    metrics.set_value("dependencies.Python", 4)
+
+    result = run_metrics.to_dict()
+
+    assert result["version"] == metrics.METRICS_FILE_VERSION
+    assert result["github"]["requests"] == 100
+    assert result["github"]["rate_limit_remaining"] == 4980
+    assert result["dependencies"] == {"Python": 4}
+    assert result["subprocess"] == {"count": 0, "seconds": 0.0}
+    assert result["duration_seconds"] >= 0
+    json.dumps(result)
+
+
+def test_phase_durations_are_summed(run_metrics):
+    """Test that the durations of repeated phases are added up."""
+    for _ in range(2):
+        with metrics.phase("Checking licenses"):
+            pass
+
+    with pytest.raises(ValueError):
+        with metrics.phase("Finding licenses"):
+            raise ValueError()
+
+    phases = run_metrics.to_dict()["phases"]
+    assert list(phases) == ["Checking licenses", "Finding licenses"]
+    assert all(seconds >= 0 for seconds in phases.values())
+
+
+def test_result_cache_hits_and_misses(tmp_path, run_metrics):
+    """Test that lookups of the result cache are counted."""
+    cache = ResultCache(str(tmp_path))
+    cache.get("0123")
+    cache.put("0123", [DependencyInfo("six", "1.16.0", ["MIT"])])
+    cache.get("0123")
+    cache.get("0123")
+
+    assert run_metrics.to_dict()["result_cache"] == {"hits": 2, "misses": 1}
+
+
+def test_step_summary(tmp_path, monkeypatch, run_metrics):
+    """Test that the metrics are appended to the step summary as Markdown."""
+    summary_path = tmp_path / "summary.md"
+    summary_path.write_text("previous step\n", encoding="utf-8")
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary_path))
+    metrics.set_value("dependencies.Rust", 3)
+    with metrics.phase("Finding licenses"):
+        pass
+
+    assert metrics.write_step_summary(run_metrics.to_dict())
+
+    summary = summary_path.read_text(encoding="utf-8")
+    assert summary.startswith("previous step\n### License check metrics\n")
+    assert "| dependencies.Rust | 3 |\n" in summary
+    assert "| github.rate_limit_remaining | n/a |\n" in summary
+    assert "| Finding licenses | 0.00 |\n" in summary
+
+
+def test_no_step_summary_outside_of_github(monkeypatch, run_metrics):
+    """Test that no summary is written if GITHUB_STEP_SUMMARY is not set."""
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+
+    assert not metrics.write_step_summary(run_metrics.to_dict())
+
+
+def test_write_metrics_file(tmp_path, run_metrics):
+    """Test that the metrics file contains the metrics as JSON."""
+    metrics.increment("subprocess.count")
+    metrics.write_metrics_file(str(tmp_path / "metrics.json"), run_metrics.to_dict())
+
+    with open(tmp_path / "metrics.json", "r", encoding="utf-8") as file:
+        assert json.load(file)["subprocess"]["count"] == 1
@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for npmscanner."""
+
+import json
+from io import StringIO
+
+import pytest
+
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.npmscanner import (
+    iter_package_lock_entries,
+    scan_npm_dependencies,
+)
+
+PACKAGE_LOCK = {
+    "name": "my-app",
+    "version": "1.0.0",
+    "lockfileVersion": 3,
+    "requires": True,
+    "dependencies": {"ignored": {"version": "1.0.0", "requires": {"a": '[{\\"}'}}},
+    "packages": {
+        "": {"name": "my-app", "version": "1.0.0", "license": "Apache-2.0"},
+        "node_modules/@scope/pkg": {"version": "2.0.0", "license": "MIT"},
+        "node_modules/a": {"version": "1.0.0", "license": {"type": "ISC"}},
+        "node_modules/a/node_modules/b": {"version": "0.1.0"},
+        "node_modules/c": {"version": "3.0.0", "dev": True, "license": "BSD-2-Clause"},
+        "node_modules/d": {"version": "1.0.0", "license": "MIT"},
+        "node_modules/d/node_modules/d": {"version": "1.0.0", "license": "MIT"},
+        "node_modules/my-workspace": {"resolved": "packages/ws", "link": True},
+        "packages/ws": {"name": "my-workspace", "version": "0.0.1", "license": "0BSD"},
+    },
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_iter_package_lock_entries(chunk_size):
+    """Test that streaming yields all entries regardless of chunk boundaries."""
+    text_io = StringIO(json.dumps(PACKAGE_LOCK, indent=2))
+
+    entries = list(iter_package_lock_entries(text_io, chunk_size))
+
+    assert entries == list(PACKAGE_LOCK["packages"].items())
+
+
+def test_iter_lockfile_version_1():
+    """Test that lock files without a packages map are rejected."""
+    text_io = StringIO(json.dumps({"lockfileVersion": 1, "dependencies": {}}))
+
+    with pytest.raises(ValueError):
+        list(iter_package_lock_entries(text_io))
+
+
+@pytest.mark.parametrize("include_dev_dependencies", [True, False])
+def test_scan_npm_dependencies(tmp_path, include_dev_dependencies):
+    """Test scanning with license fallback to installed packages."""
+    (tmp_path / "package-lock.json").write_text(
+        json.dumps(PACKAGE_LOCK), encoding="utf-8"
+    )
+    installed_package = tmp_path / "node_modules" / "a" / "node_modules" / "b"
+    installed_package.mkdir(parents=True)
+    (installed_package / "package.json").write_text(
+        json.dumps({"name": "b", "version": "0.1.0", "licenses": [{"type": "MIT"}]}),
+        encoding="utf-8",
+    )
+
+    dependencies = scan_npm_dependencies(str(tmp_path), include_dev_dependencies)
+
+    expected = [
+        DependencyInfo("@scope/pkg", "2.0.0", ["MIT"]),
+        DependencyInfo("a", "1.0.0", ["ISC"]),
+        DependencyInfo("b", "0.1.0", ["MIT"]),
+        DependencyInfo("c", "3.0.0", ["BSD-2-Clause"]),
+        DependencyInfo("d", "1.0.0", ["MIT"]),
+    ]
+    if not include_dev_dependencies:
+        expected.remove(DependencyInfo("c", "3.0.0", ["BSD-2-Clause"]))
+    assert dependencies == expected
+
+
+def test_scan_testbench():
+    """Test scanning the lock file of the javascript testbench."""
+    dependencies = scan_npm_dependencies("./testbench/javascript-npm")
+
+    assert [(dep.name, dep.version) for dep in dependencies] == [
+        ("typescript", "4.6.3"),
+    ]
@@ -0,0 +1,150 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for pipscanner."""
+
+import zipfile
+
+import pytest
+
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.pipscanner import (
+    MetadataIndex,
+    parse_requirement,
+    read_requirements,
+    scan_python_dependencies,
+)
+
+
+def _metadata(name: str, version: str, *fields: str) -> str:
+    return "\n".join(
+        ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}", *fields]
+    )
+
+
+def _write_wheel(directory, name: str, version: str, *fields: str) -> None:
+    with zipfile.ZipFile(directory / f"{name}-{version}-py3-none-any.whl", "w") as whl:
+        whl.writestr(
+            f"{name}-{version}.dist-info/METADATA", _metadata(name, version, *fields)
+        )
+
+
+@pytest.mark.parametrize(
+    "requirement_string, name, version, extras, marker",
+    [
+        ("yarl==1.9.4", "yarl", "1.9.4", set(), None),
+        (
+            "yarl[idna, x] == 1.9.4 ; python_version>'3'",
+            "yarl",
+            "1.9.4",
+            {"idna", "x"},
+            "python_version>'3'",
+        ),
+        ("idna (>=2.0)", "idna", None, set(), None),
+        ("pkg @ https://example.com/pkg.whl", "pkg", None, set(), None),
+    ],
+)
+def test_parse_requirement(requirement_string, name, version, extras, marker):
+    """Test parsing of single requirements."""
+    requirement = parse_requirement(requirement_string)
+
+    assert requirement.name == name
+    assert requirement.version == version
+    assert requirement.extras == extras
+    assert requirement.marker == marker
+
+
+def test_read_requirements_with_includes(tmp_path):
+    """Test reading a requirements file which includes another one."""
+    (tmp_path / "requirements.txt").write_text(
+        "# comment\n-r base.txt\n--index-url https://example.com\nsix==1.16.0 \\\n"
+        "    --hash=sha256:abc\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "base.txt").write_text("yarl==1.9.4  # pinned\n", encoding="utf-8")
+
+    requirements = read_requirements(str(tmp_path / "requirements.txt"))
+
+    assert [(req.name, req.version) for req in requirements] == [
+        ("yarl", "1.9.4"),
+        ("six", "1.16.0"),
+    ]
+
+
+def test_scan_from_wheelhouse(tmp_path):
+    """Test scanning with transitive dependencies and license fallbacks."""
+    _write_wheel(
+        tmp_path,
+        "yarl",
+        "1.9.4",
+        "License: Apache-2.0",
+        "Requires-Dist: idna>=2.0",
+        "Requires-Dist: multidict>=4.0",
+        "Requires-Dist: pytest; extra == 'test'",
+    )
+    _write_wheel(
+        tmp_path,
+        "idna",
+        "3.7",
+        "Classifier: License :: OSI Approved :: BSD License",
+    )
+    _write_wheel(tmp_path, "multidict", "6.0.5", "License-Expression: Apache-2.0")
+    _write_wheel(tmp_path, "multidict", "5.0.0", "License-Expression: Apache-2.0")
+    (tmp_path / "requirements.txt").write_text("yarl==1.9.4\n", encoding="utf-8")
+
+    dependencies = scan_python_dependencies(
+        str(tmp_path / "requirements.txt"), MetadataIndex([str(tmp_path)])
+    )
+
+    assert sorted(dependencies, key=lambda dep: dep.name) == [
+        DependencyInfo("idna", "3.7", ["BSD License"]),
+        DependencyInfo("multidict", "6.0.5", ["Apache-2.0"]),
+        DependencyInfo("yarl", "1.9.4", ["Apache-2.0"]),
+    ]
+
+
+def test_scan_from_site_packages(tmp_path):
+    """Test scanning installed distributions and reporting missing ones."""
+    dist_info = tmp_path / "six-1.16.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        _metadata("six", "1.16.0", "License: MIT"), encoding="utf-8"
+    )
+    (tmp_path / "requirements.txt").write_text(
+        "six==1.16.0\nmissing==1.0\n", encoding="utf-8"
+    )
+
+    dependencies = scan_python_dependencies(
+        str(tmp_path / "requirements.txt"), MetadataIndex([str(tmp_path)])
+    )
+
+    assert dependencies == [
+        DependencyInfo("six", "1.16.0", ["MIT"]),
+        DependencyInfo("missing", "1.0", []),
+    ]
+
+
+def test_missing_requirements_with_markers(tmp_path):
+    """Test that a missing requirement is only skipped if its marker does
+    not apply, otherwise it is reported without a license."""
+    (tmp_path / "requirements.txt").write_text(
+        'gplpkg==1.0 ; python_version >= "3.0"\nlegacy==1.0 ; python_version < "3.0"\n',
+        encoding="utf-8",
+    )
+
+    dependencies = scan_python_dependencies(
+        str(tmp_path / "requirements.txt"), MetadataIndex([str(tmp_path)])
+    )
+
+    assert dependencies == [DependencyInfo("gplpkg", "1.0", [])]
@@ -0,0 +1,137 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for profiling."""
+
+import pstats
+import threading
+
+from licensevalidator.lib import profiling
+from licensevalidator.lib.utils import print_step
+
+
+def _busy_leaf() -> int:
+    return sum(i * i for i in range(20000))
+
+
+def _busy_caller() -> int:
+    return _busy_leaf() + _busy_leaf()
+
+
+def test_cpu_profile_is_written(tmp_path):
+    """Test that the profile and the collapsed stacks are written,
+    including the functions executed in other threads."""
+    with profiling.profiling(str(tmp_path)):
+        _busy_caller()
+        thread = threading.Thread(target=_busy_leaf)
+        thread.start()
+        thread.join()
+
+    stats = pstats.Stats(str(tmp_path / profiling.PROFILE_FILE_NAME))
+    function_names = {function[2] for function in stats.stats}  # type: ignore
+    assert {"_busy_caller", "_busy_leaf"} <= function_names
+
+    collapsed = (tmp_path / profiling.COLLAPSED_STACKS_FILE_NAME).read_text()
+    lines = collapsed.splitlines()
+    assert len(lines) > 0
+    for line in lines:
+        stack, microseconds = line.rsplit(" ", 1)
+        assert int(microseconds) > 0
+        assert stack
+    assert any(
+        "_busy_caller (test_profiling.py" in line
+        and line.split(";")[-1].startswith("_busy_leaf")
+        for line in lines
+    )
+    assert not (tmp_path / profiling.MEMORY_REPORT_FILE_NAME).exists()
+
+
+def test_collapsed_stacks_distribute_time_to_callers():
+    """Test that the time of a function is split among the stacks."""
+    profiler = profiling.Profiler()
+    profiler.start()
+    _busy_caller()
+    _busy_leaf()
+    profiler.stop()
+
+    stacks = profiling.get_collapsed_stacks(profiler.get_stats())
+    leaf_stacks = {
+        stack: time
+        for stack, time in stacks.items()
+        if stack.split(";")[-1].startswith("_busy_leaf")
+    }
+    via_caller = [stack for stack in leaf_stacks if "_busy_caller" in stack]
+    direct = [stack for stack in leaf_stacks if "_busy_caller" not in stack]
+    assert len(via_caller) == 1
+    assert len(direct) == 1
+    assert leaf_stacks[via_caller[0]] > leaf_stacks[direct[0]]
+
+
+def _after_profiling() -> int:
+    return _busy_leaf()
+
+
+def test_threads_outliving_the_profiling_are_not_profiled():
+    """Test that stopping the profiling stops the profilers of all threads."""
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def worker() -> None:
+        _busy_leaf()
+        started.set()
+        stopped.wait()
+        _after_profiling()
+
+    profiler = profiling.Profiler()
+    profiler.start()
+    thread = threading.Thread(target=worker)
+    thread.start()
+    started.wait()
+    profiler.stop()
+    stopped.set()
+    thread.join()
+
+    function_names = {
+        function[2]
+        for function in profiler.get_stats().stats  # type: ignore[attr-defined]
+    }
+    assert "_busy_leaf" in function_names
+    assert "_after_profiling" not in function_names
+
+
+def test_memory_report_per_step(tmp_path):
+    """Test that the allocations are reported for each printed step."""
+    with profiling.profiling(str(tmp_path), cpu=False, memory=True):
+        print_step("Allocating")
+        data = [str(i) * 10 for i in range(10000)]
+        print_step("Releasing")
+        del data
+
+    assert not (tmp_path / profiling.PROFILE_FILE_NAME).exists()
+    report = (tmp_path / profiling.MEMORY_REPORT_FILE_NAME).read_text()
+    assert "## Start" in report
+    assert "## Allocating" in report
+    assert "## Releasing" in report
+    allocating = report.split("## Allocating")[1].split("## Releasing")[0]
+    assert "test_profiling.py" in allocating
+
+
+def test_step_listener_is_removed_after_profiling(tmp_path):
+    """Test that no snapshots are taken once profiling stopped."""
+    with profiling.profiling(str(tmp_path), cpu=False, memory=True):
+        pass
+
+    print_step("After profiling")
+    report = (tmp_path / profiling.MEMORY_REPORT_FILE_NAME).read_text()
+    assert "After profiling" not in report
@@ -0,0 +1,45 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for resultcache."""
+
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.resultcache import ResultCache, compute_key
+
+
+def test_cache_miss(tmp_path):
+    """Test lookup of an unknown key."""
+    cache = ResultCache(str(tmp_path))
+
+    assert cache.get(compute_key({"a": 1})) is None
+
+
+def test_cache_round_trip(tmp_path):
+    """Test that stored dependencies are returned unchanged."""
+    cache = ResultCache(str(tmp_path))
+    deps = [
+        DependencyInfo("Dep 1", "Version 1", ["License 1"]),
+        DependencyInfo("Dep 2", "Version 2", ["License 2", "License 3"]),
+    ]
+
+    key = compute_key({"a": 1})
+    cache.put(key, deps)
+
+    assert ResultCache(str(tmp_path)).get(key) == deps
+
+
+def test_compute_key_is_order_independent():
+    """Test that the key does not depend on the insertion order of its parts."""
+    assert compute_key({"a": 1, "b": 2}) == compute_key({"b": 2, "a": 1})
+    assert compute_key({"a": 1, "b": 2}) != compute_key({"a": 2, "b": 1})
@@ -0,0 +1,93 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for spdx."""
+
+import pytest
+
+from licensevalidator.lib.spdx import parse_expression
+
+
+def test_parse_precedence():
+    """Tests that AND binds stronger than OR and WITH binds strongest."""
+    expression = parse_expression(
+        "MIT or Apache-2.0 AND GPL-2.0 WITH Classpath-exception-2.0"
+    )
+
+    assert expression.operator == "OR"
+    assert expression.operands[0].operands == ["MIT"]
+    assert expression.operands[1].operator == "AND"
+    assert expression.operands[1].operands[1].operator == "WITH"
+    assert expression.operands[1].operands[1].operands == [
+        "GPL-2.0",
+        "Classpath-exception-2.0",
+    ]
+
+
+def test_parse_license_names_with_spaces():
+    """Tests that license names may contain spaces."""
+    expression = parse_expression("(Apache License 2.0 OR MIT License)")
+
+    assert expression.operator == "OR"
+    assert [operand.operands[0] for operand in expression.operands] == [
+        "Apache License 2.0",
+        "MIT License",
+    ]
+
+
+@pytest.mark.parametrize("expression", ["MIT OR", "(MIT", "MIT)", "AND MIT", ""])
+def test_parse_malformed(expression):
+    """Tests that malformed expressions are rejected."""
+    with pytest.raises(ValueError):
+        parse_expression(expression)
+
+
+def test_parse_is_cached():
+    """Tests that parsing the same expression twice returns the same result."""
+    assert parse_expression("MIT AND ISC") is parse_expression("MIT AND ISC")
+
+
+def test_evaluate_short_circuits_or():
+    """Tests that OR stops at the first valid alternative."""
+    checked = []
+
+    def is_license_valid(license_name):
+        checked.append(license_name)
+        return license_name == "MIT"
+
+    assert parse_expression("MIT OR GPL-3.0").evaluate(is_license_valid)
+    assert checked == ["MIT"]
+    assert not parse_expression("MIT AND GPL-3.0").evaluate(is_license_valid)
+
+
+def test_evaluate_with_exception():
+    """Tests that an exception is valid if listed or if the license is valid."""
+    expression = parse_expression("GPL-2.0 WITH Classpath-exception-2.0")
+
+    assert expression.evaluate(
+        lambda name: name == "GPL-2.0 WITH Classpath-exception-2.0"
+    )
+    assert expression.evaluate(lambda name: name == "GPL-2.0")
+    assert not expression.evaluate(lambda name: name == "MIT")
+
+
+def test_evaluate_with_exception_on_blacklist():
+    """Tests that an exception does not lift a blacklisted license."""
+    expression = parse_expression("GPL-2.0 WITH Classpath-exception-2.0")
+
+    assert not expression.evaluate(lambda name: name != "GPL-2.0", False)
+    assert not expression.evaluate(
+        lambda name: name != "GPL-2.0 WITH Classpath-exception-2.0", False
+    )
+    assert expression.evaluate(lambda name: name != "MIT", False)
@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for tracing."""
+
+import json
+import threading
+
+import pytest
+
+from licensevalidator.lib import tracing
+
+
+@pytest.fixture
+def tracer():
+    yield tracing.enable_tracing()
+    tracing.disable_tracing()
+
+
+def test_span_is_not_recorded_if_disabled():
+    """Test that spans only record their arguments if tracing is disabled."""
+    with tracing.span("name", "category", value=1) as span_args:
+        span_args["exit_code"] = 0
+
+    assert not tracing.is_tracing_enabled()
+    assert span_args == {"value": 1, "exit_code": 0}
+
+
+def test_spans_are_recorded_per_thread(tracer):
+    """Test that spans are recorded on the track of their thread."""
+    with tracing.span("outer", "phase"):
+        with tracing.span("inner", "subprocess", argv=["a"]) as span_args:
+            span_args["exit_code"] = 1
+
+    def run_in_thread():
+        with tracing.span("threaded", "phase"):
+            pass
+
+    thread = threading.Thread(target=run_in_thread, name="Worker")
+    thread.start()
+    thread.join()
+
+    events = tracer.get_events()
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    track_names = {
+        event["tid"]: event["args"]["name"] for event in events if event["ph"] == "M"
+    }
+    assert list(spans) == ["inner", "outer", "threaded"]
+    assert spans["inner"]["args"] == {"argv": ["a"], "exit_code": 1}
+    assert spans["inner"]["cat"] == "subprocess"
+    assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+    assert (
+        spans["inner"]["ts"] + spans["inner"]["dur"]
+        <= spans["outer"]["ts"] + spans["outer"]["dur"]
+    )
+    assert track_names[spans["outer"]["tid"]] == threading.current_thread().name
+    assert track_names[spans["threaded"]["tid"]] == "Worker"
+
+
+def test_span_records_errors(tracer):
+    """Test that an exception raised within a span is recorded."""
+    with pytest.raises(ValueError):
+        with tracing.span("failing", "phase"):
+            raise ValueError("broken")
+
+    (event,) = [event for event in tracer.get_events() if event["ph"] == "X"]
+    assert event["args"]["error"] == "ValueError('broken')"
+
+
+def test_write_trace(tmp_path, tracer):
+    """Test that the written file is in the trace event format."""
+    tracing.add_span("Scan dir 'a'", "scan_dir", 1.0, 1.5, track="Scan dir 'a'")
+    tracing.write_trace(str(tmp_path / "trace.json"))
+
+    with open(tmp_path / "trace.json", "r", encoding="utf-8") as file:
+        trace = json.load(file)
+
+    assert trace["traceEvents"][0] == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": trace["traceEvents"][1]["pid"],
+        "tid": trace["traceEvents"][1]["tid"],
+        "args": {"name": "Scan dir 'a'"},
+    }
+    assert trace["traceEvents"][1]["dur"] == pytest.approx(500_000)
@@ -14,17 +14,62 @@
 
 """Unit tests for workflowlicenses."""
 
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import StringIO
 
 import pytest
 
+from licensevalidator.lib import workflowlicenses
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.githubcache import GitHubLicenseCache
+from licensevalidator.lib.metrics import reset_metrics
 from licensevalidator.lib.workflowlicenses import (
     _extract_action_info,
     _get_all_workflow_file_paths,
     _read_used_actions_from_yaml,
+    get_workflow_dependencies,
 )
 
 
+class _FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200, headers: dict = None):
+        self.payload = payload
+        self.text = str(payload)
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class _FakeSession:
+    """Session answering every request with the MIT license."""
+
+    def __init__(self):
+        self.requested_urls: list[str] = []
+        self.request_headers: list[dict] = []
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def get(self, url: str, **kwargs) -> _FakeResponse:
+        with self.lock:
+            self.requested_urls.append(url)
+            self.request_headers.append(kwargs.get("headers", {}))
+        if kwargs.get("headers", {}).get("If-None-Match") == '"etag-1"':
+            return _FakeResponse({}, status_code=304)
+        return _FakeResponse(
+            {"license": {"name": "MIT License"}}, headers={"ETag": '"etag-1"'}
+        )
+
+
 def test_extract_action_info_with_relative_path():
     """Test valid extraction of info with a relative path."""
     action_info = _extract_action_info("github/codeql-action/init@v2")
@@ -126,3 +171,204 @@ def test_find_all_workflow_file_paths():
         "./testbench/python-with-workflows/.github/workflows/my-workflow.yml"
         in file_paths
     )
+
+
+def test_each_repository_is_looked_up_once(monkeypatch):
+    """Test that several versions of an action share a single lookup."""
+    session = _FakeSession()
+    monkeypatch.setattr(workflowlicenses, "_create_session", lambda *_: session)
+    monkeypatch.setattr(
+        workflowlicenses,
+        "_get_used_actions",
+        lambda _: {
+            DependencyInfo("actions/checkout", "v2", []),
+            DependencyInfo("actions/checkout", "v4", []),
+            DependencyInfo("actions/cache", "v4", []),
+        },
+    )
+
+    dependencies = get_workflow_dependencies(".")
+
+    assert sorted(session.requested_urls) == [
+        "https://api.github.com/repos/actions/cache",
+        "https://api.github.com/repos/actions/checkout",
+    ]
+    assert len(dependencies) == 3
+    assert all(dep.licenses == ("MIT License",) for dep in dependencies)
+
+
+@pytest.fixture
+def single_action(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(workflowlicenses, "_create_session", lambda *_: session)
+    monkeypatch.setattr(
+        workflowlicenses,
+        "_get_used_actions",
+        lambda _: {DependencyInfo("actions/checkout", "v4", [])},
+    )
+    return session
+
+
+def test_cached_license_is_revalidated_with_etag(tmp_path, single_action):
+    """Test that an expired entry is revalidated by a conditional request."""
+    cache_file = str(tmp_path / "github-licenses.json")
+
+    get_workflow_dependencies(".", license_cache=GitHubLicenseCache(cache_file))
+    assert single_action.request_headers == [{}]
+
+    # fresh entries are used without any request
+    dependencies = get_workflow_dependencies(
+        ".", license_cache=GitHubLicenseCache(cache_file)
+    )
+    assert len(single_action.requested_urls) == 1
+    assert dependencies[0].licenses == ("MIT License",)
+
+    # expired entries are revalidated
+    dependencies = get_workflow_dependencies(
+        ".", license_cache=GitHubLicenseCache(cache_file, ttl=0)
+    )
+    assert single_action.request_headers[1] == {"If-None-Match": '"etag-1"'}
+    assert dependencies[0].licenses == ("MIT License",)
+
+
+def test_offline_mode_only_reads_cache(tmp_path, single_action):
+    """Test that no requests are done in offline mode."""
+    cache_file = str(tmp_path / "github-licenses.json")
+
+    dependencies = get_workflow_dependencies(
+        ".", license_cache=GitHubLicenseCache(cache_file, offline=True)
+    )
+    assert dependencies[0].licenses == ()
+
+    get_workflow_dependencies(".", license_cache=GitHubLicenseCache(cache_file))
+    dependencies = get_workflow_dependencies(
+        ".", license_cache=GitHubLicenseCache(cache_file, ttl=0, offline=True)
+    )
+    assert dependencies[0].licenses == ("MIT License",)
+    assert len(single_action.requested_urls) == 1
+
+
+class _GitHubStubHandler(BaseHTTPRequestHandler):
+    """Serves GraphQL queries and REST requests like the GitHub API."""
+
+    licenses = {
+        "actions/checkout": "MIT License",
+        "actions/cache": "MIT License",
+        "my-org/private-action": "Apache License 2.0",
+    }
+    graphql_hidden = {"my-org/private-action"}
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.server.requests.append(("POST", self.path))
+        self.server.authorizations.append(self.headers.get("Authorization"))
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        data = {}
+        for alias, owner, name in re.findall(
+            r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)',
+            query["query"],
+        ):
+            repository = f"{owner}/{name}"
+            if repository in self.licenses and repository not in self.graphql_hidden:
+                data[alias] = {"licenseInfo": {"name": self.licenses[repository]}}
+            else:
+                data[alias] = None
+        self._send_json(200, {"data": data})
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path))
+        repository = self.path[len("/repos/") :]
+        etag = f'"{repository}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"license": {"name": self.licenses[repository]}})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def github_stub_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GitHubStubHandler)
+    server.requests = []
+    server.authorizations = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("GITHUB_API_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.delenv("GITHUB_GRAPHQL_URL", raising=False)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_licenses_are_resolved_by_batched_graphql_query(
+    github_stub_server, monkeypatch
+):
+    """Test that one GraphQL query resolves all repositories, with REST fallback."""
+    monkeypatch.setattr(
+        workflowlicenses,
+        "_get_used_actions",
+        lambda _: {
+            DependencyInfo("actions/checkout", "v4", []),
+            DependencyInfo("actions/cache", "v4", []),
+            DependencyInfo("my-org/private-action", "v1", []),
+        },
+    )
+
+    dependencies = get_workflow_dependencies(".", github_token="secret")
+
+    assert github_stub_server.requests == [
+        ("POST", "/graphql"),
+        ("GET", "/repos/my-org/private-action"),
+    ]
+    assert github_stub_server.authorizations == ["bearer secret"]
+    licenses = {dep.name: dep.licenses for dep in dependencies}
+    assert licenses == {
+        "actions/checkout": ("MIT License",),
+        "actions/cache": ("MIT License",),
+        "my-org/private-action": ("Apache License 2.0",),
+    }
+
+
+def test_expired_entries_are_revalidated_instead_of_queried(
+    github_stub_server, monkeypatch, tmp_path
+):
+    """Test that only cache misses are resolved by GraphQL, so expired
+    entries are revalidated by conditional REST requests."""
+    monkeypatch.setattr(
+        workflowlicenses,
+        "_get_used_actions",
+        lambda _: {DependencyInfo("actions/checkout", "v4", [])},
+    )
+    cache_file = str(tmp_path / "github-licenses.json")
+    metrics = reset_metrics()
+
+    for _ in range(3):
+        dependencies = get_workflow_dependencies(
+            ".", "token", GitHubLicenseCache(cache_file, ttl=0)
+        )
+        assert dependencies[0].licenses == ("MIT License",)
+
+    assert github_stub_server.requests == [
+        ("POST", "/graphql"),
+        ("GET", "/repos/actions/checkout"),
+        ("GET", "/repos/actions/checkout"),
+    ]
+    assert metrics.to_dict()["github"]["not_modified"] == 1
+    cache_entry = GitHubLicenseCache(cache_file).get("actions/checkout")
+    assert cache_entry["etag"] == '"actions/checkout"'
@@ -14,7 +14,7 @@
 
 """Unit tests for checklicenses."""
 
-from licensevalidator.checklicenses import check_licenses
+from licensevalidator.checklicenses import LicenseValidator, check_licenses
 from licensevalidator.lib.dependency import DependencyInfo
 
 
@@ -58,3 +58,63 @@ def test_whitelisted_licenses_does_not_contain_all_licenses():
     )
 
     assert result is False
+
+
+def test_license_spellings_are_folded():
+    """Test that different spellings of a whitelisted license are accepted."""
+    validator = LicenseValidator(["Apache-2.0", "MIT", "BSD 3-Clause"])
+
+    assert validator.is_license_valid("Apache 2.0")
+    assert validator.is_license_valid("Apache License 2.0")
+    assert validator.is_license_valid("apache  license,  version 2.0")
+    assert validator.is_license_valid("MIT License")
+    assert validator.is_license_valid("New BSD License")
+    assert not validator.is_license_valid("GPL-3.0")
+    assert not validator.is_license_valid(None)
+
+
+def test_license_versions_are_not_guessed():
+    """Test that names without a version are not folded to a versioned id."""
+    validator = LicenseValidator(["Apache-2.0", "PSF-2.0", "MIT"])
+
+    assert not validator.is_license_valid("Apache Software License")
+    assert not validator.is_license_valid("PSF")
+    assert not validator.is_license_valid("Python Software Foundation License")
+    # only a trailing "License" is ignored
+    assert not validator.is_license_valid("MIT License Variant")
+
+
+def test_blacklist_validator():
+    """Test that a blacklist rejects listed licenses in any spelling."""
+    validator = LicenseValidator(["GPL-3.0"], is_licenses_list_inclusive=False)
+
+    assert not validator.is_license_valid("gpl-3.0")
+    assert validator.is_license_valid("MIT")
+
+
+def test_shared_validator():
+    """Test that a validator can be shared between several checks."""
+    validator = LicenseValidator(["MIT"])
+
+    assert check_licenses(
+        "Test", [DependencyInfo("Dep 1", "Version 1", ["MIT License"])], validator
+    )
+    assert not check_licenses(
+        "Test", [DependencyInfo("Dep 2", "Version 2", ["GPL"])], validator
+    )
+
+
+def test_spdx_expressions():
+    """Test that SPDX expressions are evaluated against the whitelist."""
+    validator = LicenseValidator(["MIT", "Apache-2.0"])
+
+    assert validator.is_license_valid("MIT OR GPL-3.0")
+    assert validator.is_license_valid("(MIT AND Apache License 2.0)")
+    assert not validator.is_license_valid("MIT AND GPL-3.0")
+    assert not validator.is_license_valid("MIT AND (")
+
+    blacklist = LicenseValidator(["GPL-3.0"], is_licenses_list_inclusive=False)
+    assert blacklist.is_license_valid("MIT OR GPL-3.0")
+    assert not blacklist.is_license_valid("MIT AND GPL-3.0")
+    assert not blacklist.is_license_valid("GPL-3.0 WITH GCC-exception-3.1")
+    assert blacklist.is_license_valid("MIT OR GPL-3.0 WITH GCC-exception-3.1")
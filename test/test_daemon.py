@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for the license check daemon."""
+
+import io
+import json
+import os
+import threading
+
+import pytest
+
+from licensevalidator import daemonclient
+from licensevalidator.daemon import LicenseCheckDaemon, serve
+
+
+def _create_project(path, whitelist: str = "MIT") -> str:
+    path.mkdir()
+    (path / "whitelist.txt").write_text(whitelist, encoding="utf-8")
+    (path / "package-lock.json").write_text(
+        json.dumps(
+            {
+                "lockfileVersion": 3,
+                "packages": {
+                    "": {"name": "project", "version": "1.0.0", "license": "MIT"},
+                    "node_modules/left-pad": {"version": "1.3.0", "license": "WTFPL"},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    config_file = path / ".licensechecker.yml"
+    config_file.write_text(
+        "whitelist-file-path: whitelist.txt\n"
+        "scan-dirs:\n"
+        "  - path: .\n"
+        "    javascript-scanner: native\n",
+        encoding="utf-8",
+    )
+    return str(config_file)
+
+
+@pytest.fixture
+def daemon():
+    daemon = LicenseCheckDaemon(max_workers=2)
+    yield daemon
+    daemon.close()
+
+
+@pytest.fixture
+def socket_path(tmp_path, daemon):
+    socket_path = str(tmp_path / "daemon.sock")
+    thread = threading.Thread(target=serve, args=(daemon, socket_path))
+    thread.start()
+    while not os.path.exists(socket_path):
+        thread.join(0.01)
+    yield socket_path
+    daemonclient.shutdown(socket_path)
+    thread.join()
+    assert not os.path.exists(socket_path)
+
+
+def test_scans_are_served(tmp_path, socket_path):
+    """Test that several projects are scanned by the same daemon."""
+    results = []
+    for name, whitelist in [("valid", "MIT\nWTFPL"), ("invalid", "MIT")]:
+        config_file = _create_project(tmp_path / name, whitelist)
+        output = io.StringIO()
+        results.append(
+            daemonclient.scan(
+                socket_path, str(tmp_path / name), config_file, output=output
+            )
+        )
+        assert 'Checking licenses from "JavaScript"' in output.getvalue()
+
+    assert [result["licenses_valid"] for result in results] == [True, False]
+    assert results[0]["dependencies"] == {
+        "JavaScript": [["left-pad", "1.3.0", ["WTFPL"]]]
+    }
+    assert results[0]["metrics"]["dependencies"] == {"JavaScript": 1}
+    assert "Finding licenses" in results[1]["metrics"]["phases"]
+
+
+def test_errors_are_reported(tmp_path, socket_path):
+    """Test that a failing scan is reported and the daemon keeps serving."""
+    config_file = _create_project(tmp_path / "project")
+    with pytest.raises(daemonclient.DaemonError, match="FileNotFoundError"):
+        daemonclient.scan(
+            socket_path, str(tmp_path / "project"), str(tmp_path / "missing.yml")
+        )
+
+    os.remove(tmp_path / "project" / "whitelist.txt")
+    with pytest.raises(daemonclient.DaemonError, match="Whitelist file"):
+        daemonclient.scan(socket_path, str(tmp_path / "project"), config_file)
+
+
+def test_unexpected_errors_are_reported(tmp_path, daemon, socket_path, monkeypatch):
+    """Test that any exception of a scan is answered with an error."""
+
+    def fail(*_):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(daemon, "scan", fail)
+    config_file = _create_project(tmp_path / "project")
+    with pytest.raises(daemonclient.DaemonError, match="RuntimeError: unexpected"):
+        daemonclient.scan(socket_path, str(tmp_path / "project"), config_file)
+
+
+def test_validator_is_reused_until_whitelist_changes(tmp_path, daemon):
+    """Test that the whitelist is only read again once it is modified."""
+    whitelist = tmp_path / "whitelist.txt"
+    whitelist.write_text("MIT", encoding="utf-8")
+
+    validator = daemon.get_validator(str(whitelist))
+    assert daemon.get_validator(str(whitelist)) is validator
+    assert not validator.is_license_valid("WTFPL")
+
+    whitelist.write_text("MIT\nWTFPL", encoding="utf-8")
+    updated_validator = daemon.get_validator(str(whitelist))
+    assert updated_validator is not validator
+    assert updated_validator.is_license_valid("WTFPL")
+
+
+def test_license_cache_is_kept_in_memory(tmp_path, daemon):
+    """Test that the license cache of a cache dir is only read once."""
+    license_cache = daemon.get_license_cache(str(tmp_path))
+    license_cache.put("actions/checkout", "MIT", None, None)
+
+    same_cache = daemon.get_license_cache(str(tmp_path), ttl=10, offline=True)
+    assert same_cache is license_cache
+    assert same_cache.ttl == 10
+    assert same_cache.offline
+    assert same_cache.get("actions/checkout")["license"] == "MIT"
+    assert daemon.get_license_cache(str(tmp_path / "other")) is not license_cache
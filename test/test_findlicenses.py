@@ -0,0 +1,403 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for findlicenses."""
+
+import os
+import random
+import subprocess
+import time
+
+import git
+import pytest
+
+from licensevalidator import findlicenses
+from licensevalidator.lib import incremental, tracing
+from licensevalidator.lib.dependency import DependencyInfo
+
+
+def _fake_license_finder(working_dir: str, **kwargs) -> list[DependencyInfo]:
+    """Return fake dependencies derived from the arguments after a random delay."""
+    time.sleep(random.uniform(0, 0.01))
+    package_manager = kwargs["package_managers"][0]
+    scan_dir = os.path.basename(os.path.normpath(working_dir))
+    return [
+        DependencyInfo(f"{package_manager}-{scan_dir}-b", "1.0", ["MIT"]),
+        DependencyInfo(f"{package_manager}-{scan_dir}-a", "2.0", ["MIT"]),
+    ]
+
+
+@pytest.fixture
+def fake_license_finder(monkeypatch):
+    monkeypatch.setattr(findlicenses, "execute_license_finder", _fake_license_finder)
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+
+
+def _create_scan_dir(path, *manifests: str) -> None:
+    path.mkdir()
+    for manifest in manifests:
+        (path / manifest).write_text("", encoding="utf-8")
+
+
+def test_parallel_scan_is_deterministic(tmp_path, fake_license_finder):
+    """Test that concurrent scanning yields the same result as a sequential one."""
+    config = [{"path": f"dir{index}"} for index in range(8)]
+    for index in range(8):
+        _create_scan_dir(
+            tmp_path / f"dir{index}", "requirements.txt", "Cargo.toml", "package.json"
+        )
+
+    sequential = findlicenses.find_licenses(str(tmp_path), config, max_workers=1)
+    for _ in range(3):
+        assert findlicenses.find_licenses(str(tmp_path), config, max_workers=8) == (
+            sequential
+        )
+
+    assert list(sequential.keys()) == ["Python", "Rust", "JavaScript"]
+    # the dependencies of all scan dirs are merged
+    assert [dep.name for dep in sequential["Rust"]] == [
+        f"cargo-dir{index}-{suffix}" for index in range(8) for suffix in "ab"
+    ]
+
+
+def test_trace_contains_scan_dir_spans(tmp_path, fake_license_finder):
+    """Test that a span is recorded per scan dir and per language check."""
+    for name in ["dir0", "dir1"]:
+        _create_scan_dir(tmp_path / name, "requirements.txt", "Cargo.toml")
+
+    tracer = tracing.enable_tracing()
+    try:
+        findlicenses.find_licenses(
+            str(tmp_path), [{"path": "dir0"}, {"path": "dir1"}], max_workers=2
+        )
+    finally:
+        tracing.disable_tracing()
+
+    spans = [event for event in tracer.get_events() if event["ph"] == "X"]
+    assert sorted(
+        (span["name"], span["args"]["scan_dir"])
+        for span in spans
+        if span["cat"] == "language_check"
+    ) == [
+        ("Python check", "dir0"),
+        ("Python check", "dir1"),
+        ("Rust check", "dir0"),
+        ("Rust check", "dir1"),
+    ]
+    assert sorted(
+        (span["name"], span["args"]["jobs"])
+        for span in spans
+        if span["cat"] == "scan_dir"
+    ) == [("Scan dir 'dir0'", 2), ("Scan dir 'dir1'", 2)]
+
+
+def test_aggregated_scan_combines_all_directories(tmp_path, monkeypatch):
+    """Test that aggregated mode scans compatible dirs in a single job."""
+    executions = []
+
+    def fake_aggregated_license_finder(working_dirs, requirement_files, **kwargs):
+        executions.append((working_dirs, requirement_files))
+        assert kwargs["package_managers"] == ["cargo"]
+        return {
+            "pip": [DependencyInfo("six", "1.16.0", ["MIT"])],
+            "cargo": [
+                DependencyInfo(f"crate-{os.path.basename(working_dir)}", "1.0", [])
+                for working_dir in working_dirs
+            ],
+        }
+
+    monkeypatch.setattr(
+        findlicenses,
+        "execute_aggregated_license_finder",
+        fake_aggregated_license_finder,
+    )
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+    for name in ["dir0", "dir1"]:
+        _create_scan_dir(tmp_path / name, "requirements.txt", "Cargo.toml")
+
+    result = findlicenses.find_licenses(
+        str(tmp_path), [{"path": "dir0"}, {"path": "dir1"}], aggregate=True
+    )
+
+    assert len(executions) == 1
+    assert len(executions[0][1]) == 2
+    assert list(result.keys()) == ["Python", "Rust"]
+    assert result["Python"] == [DependencyInfo("six", "1.16.0", ["MIT"])]
+    assert [dep.name for dep in result["Rust"]] == ["crate-dir0", "crate-dir1"]
+    # the scan dir bringing in a dependency is unknown
+    assert result.get_scan_dirs("Rust", "crate-dir0", "1.0") == []
+
+
+def test_dependencies_are_merged_across_scan_dirs(tmp_path, monkeypatch):
+    """Test that a dependency found in several dirs is only listed once."""
+
+    def fake_license_finder(working_dir: str, **kwargs) -> list[DependencyInfo]:
+        if kwargs["package_managers"] != ["pip"]:
+            return []
+        if working_dir.endswith("service"):
+            return [DependencyInfo("six", "1.16.0", ["MIT"])]
+        return [
+            DependencyInfo("six", "1.16.0", ["MIT", "BSD"]),
+            DependencyInfo("idna", "3.7", ["BSD"]),
+        ]
+
+    monkeypatch.setattr(findlicenses, "execute_license_finder", fake_license_finder)
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+
+    _create_scan_dir(tmp_path / "service", "requirements.txt")
+    _create_scan_dir(tmp_path / "tool", "requirements.txt")
+
+    result = findlicenses.find_licenses(
+        str(tmp_path), [{"path": "./service"}, {"path": "tool"}]
+    )
+
+    assert list(result.keys()) == ["Python"]
+    assert result["Python"] == [
+        DependencyInfo("idna", "3.7", ["BSD"]),
+        DependencyInfo("six", "1.16.0", ["MIT", "BSD"]),
+    ]
+    assert result.get_scan_dirs("Python", "six", "1.16.0") == ["service", "tool"]
+
+
+def test_only_detected_languages_are_checked(tmp_path, monkeypatch):
+    """Test that languages without manifests in a scan dir are skipped."""
+    executions = []
+
+    def fake_license_finder(working_dir: str, **kwargs) -> list[DependencyInfo]:
+        executions.append(
+            (os.path.basename(working_dir), kwargs["package_managers"][0])
+        )
+        return []
+
+    monkeypatch.setattr(findlicenses, "execute_license_finder", fake_license_finder)
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+    _create_scan_dir(tmp_path / "rust", "Cargo.toml")
+    _create_scan_dir(tmp_path / "web", "package-lock.json")
+    _create_scan_dir(tmp_path / "empty")
+    (tmp_path / "python").mkdir()
+    _create_scan_dir(tmp_path / "python" / "requirements", "dev.txt")
+
+    findlicenses.find_licenses(
+        str(tmp_path),
+        [
+            {"path": "rust"},
+            {"path": "web"},
+            {"path": "empty"},
+            {
+                "path": "python",
+                "python-pip-included-requirement-files": ["requirements/dev.txt"],
+            },
+        ],
+    )
+
+    assert sorted(executions) == [
+        ("python", "pip"),
+        ("rust", "cargo"),
+        ("web", "npm"),
+    ]
+
+
+def test_incremental_scan_skips_unchanged_dirs(tmp_path, monkeypatch):
+    """Test that only dirs with changed inputs are scanned again."""
+    executions = []
+
+    def fake_license_finder(working_dir: str, **kwargs) -> list[DependencyInfo]:
+        executions.append(os.path.basename(working_dir))
+        return [DependencyInfo(os.path.basename(working_dir), "1.0", ["MIT"])]
+
+    workflow_executions = []
+
+    def fake_workflow_dependencies(*_) -> list[DependencyInfo]:
+        workflow_executions.append(True)
+        return [DependencyInfo("actions/checkout", "v4", ["MIT License"])]
+
+    monkeypatch.setattr(findlicenses, "execute_license_finder", fake_license_finder)
+    monkeypatch.setattr(
+        findlicenses, "get_workflow_dependencies", fake_workflow_dependencies
+    )
+
+    repo = git.Repo.init(tmp_path)
+    for name in ["service", "tool"]:
+        _create_scan_dir(tmp_path / name, "requirements.txt")
+    repo.index.add(["service/requirements.txt", "tool/requirements.txt"])
+    base_ref = repo.index.commit("Initial commit").hexsha
+
+    config = [{"path": "service"}, {"path": "tool"}]
+    cache_dir = str(tmp_path / ".cache")
+
+    # nothing is cached yet, so everything is scanned
+    first = findlicenses.find_licenses(
+        str(tmp_path), config, cache_dir=cache_dir, incremental_base_ref=base_ref
+    )
+    assert sorted(executions) == ["service", "tool"]
+    assert len(workflow_executions) == 1
+
+    executions.clear()
+    (tmp_path / "tool" / "requirements.txt").write_text("six\n", encoding="utf-8")
+    second = findlicenses.find_licenses(
+        str(tmp_path), config, cache_dir=cache_dir, incremental_base_ref=base_ref
+    )
+    assert executions == ["tool"]
+    assert len(workflow_executions) == 1
+    assert second == first
+
+    # an upgrade of the license finder invalidates all cached results
+    executions.clear()
+    monkeypatch.setattr(incremental, "get_license_finder_version", lambda: "99.0")
+    findlicenses.find_licenses(
+        str(tmp_path), config, cache_dir=cache_dir, incremental_base_ref=base_ref
+    )
+    assert sorted(executions) == ["service", "tool"]
+    assert len(workflow_executions) == 2
+
+
+def test_incremental_scan_with_unknown_ref_scans_everything(tmp_path, monkeypatch):
+    """Test that an unknown base ref leads to a full scan."""
+    executions = []
+    monkeypatch.setattr(
+        findlicenses,
+        "execute_license_finder",
+        lambda working_dir, **_: executions.append(working_dir) or [],
+    )
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+    git.Repo.init(tmp_path)
+    _create_scan_dir(tmp_path / "service", "requirements.txt")
+
+    findlicenses.find_licenses(
+        str(tmp_path),
+        [{"path": "service"}],
+        cache_dir=str(tmp_path / ".cache"),
+        incremental_base_ref="does-not-exist",
+    )
+
+    assert len(executions) == 1
+
+
+def test_failing_aggregated_scan_falls_back_to_single_dirs(tmp_path, monkeypatch):
+    """Test that the dirs of a failing aggregated scan are scanned one by one."""
+
+    def failing_aggregated_license_finder(working_dirs, requirement_files, **kwargs):
+        raise subprocess.CalledProcessError(1, ["license_finder"])
+
+    monkeypatch.setattr(
+        findlicenses,
+        "execute_aggregated_license_finder",
+        failing_aggregated_license_finder,
+    )
+    monkeypatch.setattr(findlicenses, "execute_license_finder", _fake_license_finder)
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+    for name in ["dir0", "dir1"]:
+        _create_scan_dir(tmp_path / name, "requirements.txt", "Cargo.toml")
+
+    result = findlicenses.find_licenses(
+        str(tmp_path), [{"path": "dir0"}, {"path": "dir1"}], aggregate=True
+    )
+
+    assert list(result.keys()) == ["Python", "Rust"]
+    assert [dep.name for dep in result["Rust"]] == [
+        f"cargo-dir{index}-{suffix}" for index in range(2) for suffix in "ab"
+    ]
+    assert len(result["Python"]) == 4
+
+
+def test_native_python_scanner_requires_metadata_paths(
+    tmp_path, fake_license_finder, capsys
+):
+    """Test that the native Python scanner does not read the metadata of the
+    interpreter running the check, but falls back to the License Finder."""
+    _create_scan_dir(tmp_path / "app", "requirements.txt")
+    (tmp_path / "app" / "requirements.txt").write_text("pytest\n", encoding="utf-8")
+
+    result = findlicenses.find_licenses(
+        str(tmp_path), [{"path": "app", "python-scanner": "native"}]
+    )
+
+    assert result["Python"] == [
+        DependencyInfo("pip-app-a", "2.0", ["MIT"]),
+        DependencyInfo("pip-app-b", "1.0", ["MIT"]),
+    ]
+    assert "requires 'python-metadata-paths'" in capsys.readouterr().out
+
+
+def test_incremental_scan_of_unpinned_requirements(tmp_path, monkeypatch):
+    """Test that unpinned requirements are always scanned again, as pip
+    may resolve other versions without any change of the inputs."""
+    executions = []
+
+    def fake_license_finder(working_dir: str, **kwargs) -> list[DependencyInfo]:
+        executions.append(os.path.basename(working_dir))
+        return []
+
+    monkeypatch.setattr(findlicenses, "execute_license_finder", fake_license_finder)
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+
+    repo = git.Repo.init(tmp_path)
+    _create_scan_dir(tmp_path / "app", "requirements.txt")
+    (tmp_path / "app" / "requirements.txt").write_text("six>=1.0\n", "utf-8")
+    repo.index.add(["app/requirements.txt"])
+    base_ref = repo.index.commit("Initial commit").hexsha
+
+    for _ in range(2):
+        findlicenses.find_licenses(
+            str(tmp_path),
+            [{"path": "app"}],
+            cache_dir=str(tmp_path / ".cache"),
+            incremental_base_ref=base_ref,
+        )
+    assert executions == ["app", "app"]
+
+
+def test_incremental_scan_of_changed_python_metadata(tmp_path, monkeypatch):
+    """Test that a change of the package metadata read by the native
+    Python scanner invalidates the cached result."""
+    executions = []
+
+    def fake_scan(requirements_path, metadata_index) -> list[DependencyInfo]:
+        executions.append(requirements_path)
+        return []
+
+    monkeypatch.setattr(findlicenses, "scan_python_dependencies", fake_scan)
+    monkeypatch.setattr(findlicenses, "get_workflow_dependencies", lambda *_: [])
+
+    repo = git.Repo.init(tmp_path)
+    _create_scan_dir(tmp_path / "app", "requirements.txt")
+    (tmp_path / "app" / "requirements.txt").write_text("six==1.16.0\n", "utf-8")
+    (tmp_path / ".gitignore").write_text(".cache/\nwheels/\n", encoding="utf-8")
+    repo.index.add(["app/requirements.txt", ".gitignore"])
+    base_ref = repo.index.commit("Initial commit").hexsha
+    wheels_dir = tmp_path / "app" / "wheels"
+    wheels_dir.mkdir()
+    (wheels_dir / "six-1.16.0-py3-none-any.whl").write_bytes(b"first")
+
+    def scan():
+        findlicenses.find_licenses(
+            str(tmp_path),
+            [
+                {
+                    "path": "app",
+                    "python-scanner": "native",
+                    "python-metadata-paths": ["wheels"],
+                }
+            ],
+            cache_dir=str(tmp_path / ".cache"),
+            incremental_base_ref=base_ref,
+        )
+
+    scan()
+    scan()
+    assert len(executions) == 1
+
+    (wheels_dir / "six-1.16.0-py3-none-any.whl").write_bytes(b"second")
+    scan()
+    assert len(executions) == 2
@@ -0,0 +1,102 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for licenselock."""
+
+from licensevalidator import licenselock, licensevalidator
+from licensevalidator.lib import incremental
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.lib.dependencystore import DependencyStore
+
+
+def test_up_to_date_lock_skips_finding(tmp_path, monkeypatch):
+    """Tests that the dependencies are taken from an up to date lock."""
+    executions = []
+
+    def fake_find_licenses(*_):
+        executions.append(True)
+        result = DependencyStore()
+        result.add("Python", [DependencyInfo("six", "1.16.0", ["MIT"])], ["src"])
+        result.add("Workflows", [DependencyInfo("actions/checkout", "v4", ["MIT"])])
+        return result
+
+    monkeypatch.setattr(licensevalidator, "find_licenses", fake_find_licenses)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "requirements.txt").write_text("six==1.16.0\n", "utf-8")
+    (tmp_path / "whitelist.txt").write_text("MIT\n", encoding="utf-8")
+
+    def validate():
+        return licensevalidator.validate_used_licenses(
+            str(tmp_path),
+            [{"path": "src"}],
+            "whitelist.txt",
+            license_lock_file="licenses.lock.json",
+        )
+
+    valid, found = validate()
+    assert valid is True
+    assert len(executions) == 1
+    assert (tmp_path / "licenses.lock.json").is_file()
+
+    # the current whitelist is still applied
+    (tmp_path / "whitelist.txt").write_text("BSD\n", encoding="utf-8")
+    valid, locked = validate()
+    assert valid is False
+    assert len(executions) == 1
+    assert list(locked.keys()) == ["Python", "Workflows"]
+    assert locked == found
+    assert locked.get_scan_dirs("Python", "six", "1.16.0") == ["src"]
+
+    # changed inputs invalidate the lock
+    (tmp_path / "src" / "requirements.txt").write_text("six==1.17.0\n", "utf-8")
+    validate()
+    assert len(executions) == 2
+
+
+def test_lock_is_not_trusted_for_unpinned_requirements(tmp_path, monkeypatch):
+    """Tests that the lock is not used if a requirement is not pinned."""
+    executions = []
+
+    def fake_find_licenses(*_):
+        executions.append(True)
+        result = DependencyStore()
+        result.add("Python", [DependencyInfo("six", "1.16.0", ["MIT"])], ["src"])
+        return result
+
+    monkeypatch.setattr(licensevalidator, "find_licenses", fake_find_licenses)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "requirements.txt").write_text("six\n", encoding="utf-8")
+    (tmp_path / "whitelist.txt").write_text("MIT\n", encoding="utf-8")
+
+    for _ in range(2):
+        licensevalidator.validate_used_licenses(
+            str(tmp_path),
+            [{"path": "src"}],
+            "whitelist.txt",
+            license_lock_file="licenses.lock.json",
+        )
+    assert len(executions) == 2
+
+
+def test_tool_versions_invalidate_the_lock(tmp_path, monkeypatch):
+    """Tests that a new license finder version invalidates the lock."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "requirements.txt").write_text("six==1.16.0\n", "utf-8")
+    inputs = licenselock.get_lock_inputs(str(tmp_path), [{"path": "src"}])
+    lock = {"version": licenselock.LOCK_FILE_VERSION, "inputs": inputs}
+    assert licenselock.is_license_lock_up_to_date(lock, inputs)
+
+    monkeypatch.setattr(incremental, "get_license_finder_version", lambda: "99.0")
+    inputs = licenselock.get_lock_inputs(str(tmp_path), [{"path": "src"}])
+    assert not licenselock.is_license_lock_up_to_date(lock, inputs)
@@ -14,7 +14,14 @@
 
 """Integration tests for license validator."""
 
-from licensevalidator.licensevalidator import validate_used_licenses
+import git
+
+from licensevalidator import licensevalidator
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.licensevalidator import (
+    validate_license_delta,
+    validate_used_licenses,
+)
 
 
 def test_python_with_workflows():
@@ -156,3 +163,25 @@ def test_javascript():
 #     assert "c++" in origin_vs_deps
 #     assert "Rust" in origin_vs_deps
 #     assert "Python" in origin_vs_deps
+
+
+def test_delta_checks_all_workflow_actions(tmp_path, monkeypatch):
+    """Test that delta mode checks the actions used by the workflows,
+    although they are not part of the delta."""
+    monkeypatch.setattr(
+        licensevalidator,
+        "get_workflow_dependencies",
+        lambda *_: [DependencyInfo("some/action", "v1", ["GPL-3.0"])],
+    )
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / "whitelist.txt").write_text("MIT", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("", encoding="utf-8")
+    repo.index.add(["whitelist.txt", "requirements.txt"])
+    base_ref = repo.index.commit("Initial commit").hexsha
+
+    result, delta = validate_license_delta(
+        str(tmp_path), [{"path": "."}], "whitelist.txt", base_ref
+    )
+
+    assert result is False
+    assert len(delta.get_new_dependencies()) == 0
@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for noticegenerator."""
+
+import os
+import subprocess
+
+from licensevalidator.lib.dependency import DependencyInfo
+from licensevalidator.noticegenerator import render_notice, update_notice_file
+
+DEPENDENCIES = {"Python": [DependencyInfo("six", "1.16.0", ["MIT", "BSD"])]}
+
+
+def test_render_notice():
+    """Test the rendered notice."""
+    assert render_notice(DEPENDENCIES) == (
+        "# Licenses Notice\n"
+        "*Note*: This file is auto-generated. Do not modify it manually.\n"
+        "## Python\n"
+        "| Dependency | Version | License |\n"
+        "|:-----------|:-------:|--------:|\n"
+        "|six|1.16.0|MIT<br/>BSD|\n"
+    )
+
+
+def test_unchanged_notice_is_not_written(tmp_path):
+    """Test that an up to date notice file is left untouched."""
+    notice_file = tmp_path / "NOTICE.md"
+    notice_file.write_text(render_notice(DEPENDENCIES), encoding="utf-8")
+    os.utime(notice_file, (0, 0))
+
+    assert update_notice_file(DEPENDENCIES, str(notice_file)) is None
+    assert notice_file.stat().st_mtime == 0
+
+
+def test_notice_with_crlf_line_endings_is_unchanged(tmp_path):
+    """Test that a notice file checked out with CRLF line endings is
+    considered up to date, as git ignores the line endings."""
+    notice_file = tmp_path / "NOTICE.md"
+    notice_file.write_bytes(
+        render_notice(DEPENDENCIES).replace("\n", "\r\n").encode("utf-8")
+    )
+    os.utime(notice_file, (0, 0))
+
+    assert update_notice_file(DEPENDENCIES, str(notice_file)) is None
+    assert notice_file.stat().st_mtime == 0
+
+
+def test_changed_notice_is_written_and_diffed(tmp_path):
+    """Test that an outdated notice file is updated and the diff applies."""
+    notice_file = tmp_path / "NOTICE.md"
+    notice_file.write_text(
+        render_notice({"Python": [DependencyInfo("six", "1.15.0", ["MIT"])]}).rstrip(),
+        encoding="utf-8",
+    )
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), "add", "NOTICE.md"], check=True)
+
+    diff = update_notice_file(DEPENDENCIES, str(notice_file), "NOTICE.md")
+
+    assert "-|six|1.15.0|MIT" in diff
+    assert "+|six|1.16.0|MIT<br/>BSD|" in diff
+    assert notice_file.read_text(encoding="utf-8") == render_notice(DEPENDENCIES)
+
+    # the diff can be applied to the previous contents
+    subprocess.run(["git", "-C", str(tmp_path), "checkout", "NOTICE.md"], check=True)
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "apply"], input=diff, text=True, check=True
+    )
+    assert notice_file.read_text(encoding="utf-8") == render_notice(DEPENDENCIES)
+
+
+def test_new_notice_is_diffed_from_dev_null(tmp_path):
+    """Test that the diff of a new notice file creates it with git apply."""
+    notice_file = tmp_path / "NOTICE.md"
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+
+    diff = update_notice_file(DEPENDENCIES, str(notice_file), "NOTICE.md")
+
+    assert diff.startswith("--- /dev/null\n+++ b/NOTICE.md\n")
+    notice_file.unlink()
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "apply"], input=diff, text=True, check=True
+    )
+    assert notice_file.read_text(encoding="utf-8") == render_notice(DEPENDENCIES)